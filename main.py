@@ -6,9 +6,14 @@ import logging
 import sys
 import json
 from typing import Optional, Tuple
+from src.cache import EXPORT_CACHE, RESULTS_CACHE, cached_result
 from src.config import get_theme, Config
-from src.layout import inject_styles, render_header, render_inputs, render_planner_inputs, render_planner_results, render_results, render_sgpa_inputs, render_sgpa_results, render_home_page, render_guide_page, render_compare_page, render_update_cgpa_page
-from src.logic import build_breakdown, build_subject_breakdown, cgpa_to_percentage, classify_cgpa, classify_target_feasibility, compute_cgpa, compute_sgpa, required_sgpa_for_target, sgpa_to_percentage
+from src.curriculum import curriculum_catalog
+from src.memory import enforce_budget, measure_session
+from src.layout import cgpa_grid, sgpa_grid, inject_styles, render_header, render_inputs, render_planner_inputs, render_planner_results, render_results, render_sgpa_inputs, render_sgpa_results, render_home_page, render_guide_page, render_compare_page, render_update_cgpa_page
+from src.logic import PERCENTAGE_FORMULAS, build_breakdown, build_subject_breakdown, cgpa_to_percentage, classify_cgpa, classify_target_feasibility, compute_cgpa, compute_sgpa, required_sgpa_for_target, sgpa_to_percentage
+from src.state import CGPA_GRID_KEY, MAX_SEMESTERS, MAX_SUBJECTS, SEMESTER_WIDGETS, SGPA_GRID_KEY, SUBJECT_WIDGETS, forget_widgets
+from src.warmup import parse_steps, run_warmup
 import streamlit as st
 from streamlit_local_storage import LocalStorage
 
@@ -29,13 +34,54 @@ def track_event(event_name: str, payload: dict | None = None) -> None:
     counters[event_name] = counters.get(event_name, 0) + 1
     logger.info("telemetry event=%s payload=%s", event_name, payload)
 
+
+def _page_states() -> dict:
+    """All saved page states; the same dict for the whole session, so deferred callbacks see updates."""
+    return st.session_state.setdefault("page_states", {})
+
 def _load_page_state(page_key: str) -> dict:
-    if f"{page_key}_state" not in st.session_state:
-        return {}
-    return st.session_state[f"{page_key}_state"]
+    return _page_states().get(page_key, {})
 
 def _save_page_state(page_key: str, state: dict) -> None:
-    st.session_state[f"{page_key}_state"] = state
+    _page_states()[page_key] = state
+
+
+def _account_session_memory() -> None:
+    """Keep the session under its memory budget and log its size when it changes noticeably."""
+    memory = measure_session(st.session_state)
+    evicted = enforce_budget(st.session_state, Config.SESSION_MEMORY_BUDGET, memory)
+    if evicted:
+        logger.warning(
+            "session memory %d B over budget %d B; evicted regenerable entries %s",
+            memory.total, Config.SESSION_MEMORY_BUDGET, evicted,
+        )
+    last_logged = st.session_state.get("memory_logged_total", 0)
+    if abs(memory.total - last_logged) > 0.1 * last_logged:
+        st.session_state["memory_logged_total"] = memory.total
+        logger.info("session memory %s", memory.as_dict(Config.SESSION_MEMORY_BUDGET))
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_up_process() -> dict:
+    """Run the warm-up once per server process and return its report.
+
+    ``main`` calls it after the page and footer are rendered, so the first visitor
+    after a deploy sees their page before it runs. Concurrent first sessions wait on
+    the cache instead of importing the heavy libraries side by side.
+    """
+    try:
+        steps = parse_steps(Config.WARMUP_STEPS)
+    except ValueError as e:
+        logger.error(f"Warm-up disabled: {str(e)}")
+        steps = []
+    if not steps:
+        return {"steps": {}, "status": "disabled"}
+    report = run_warmup(steps)
+    for step in report.steps:
+        if step.error:
+            logger.warning("warm-up step=%s ms=%.1f failed: %s", step.name, step.ms, step.error)
+    logger.info("warm-up finished %s", report.as_dict())
+    return report.as_dict()
 
 def setup_environment() -> None:
     """Setup and validate application environment."""
@@ -72,10 +118,65 @@ def validate_sgpa_inputs(subjects: list[str], credits: list[int], grade_points:
     if sum(credits) <= 0: return False, "Your total credits are 0. We need at least 1 credit to calculate your score."
     return True, None
 
+
+def _backup_json(page_states: dict, settings: dict) -> str:
+    """Profile backup JSON.
+
+    Streamlit calls the download callable off the script thread, where session state is
+    unavailable, so it reads the session's page-state dict directly. Fragment-only reruns
+    update that dict, so the download always has the latest scores.
+    """
+    current_state = {
+        "cgpa": page_states.get("cgpa", {}),
+        "sgpa": page_states.get("sgpa", {}),
+        "planner": page_states.get("planner", {}),
+        "settings": settings
+    }
+    return json.dumps(current_state, indent=2)
+
 def handle_calculation_error(error: str) -> None:
     logger.error(f"Calculation error: {error}")
     st.error(error)
 
+
+def _cgpa_result(grades: list, credits: list[int], completed_semesters: int, settings: dict) -> dict:
+    """CGPA, classification, percentage and breakdown for one submit, shared across sessions.
+
+    The returned breakdown is a cached object; render it but do not modify it.
+    """
+    method = settings.get("cgpa_method", "weighted")
+    pct_formula = settings.get("pct_formula", "mu")
+
+    def compute() -> dict:
+        cgpa_dict = compute_cgpa(grades, credits, method=method)
+        cgpa = cgpa_dict.get("cgpa")
+        return {
+            "cgpa": cgpa,
+            "status": cgpa_dict.get("status"),
+            "classification": classify_cgpa(cgpa) if cgpa is not None else "Withheld",
+            "percentage": cgpa_to_percentage(cgpa, formula=pct_formula) if cgpa is not None else 0.0,
+            "breakdown": build_breakdown(completed_semesters, credits, grades),
+        }
+
+    return cached_result("cgpa", (grades, credits, completed_semesters, method, pct_formula), compute)
+
+
+def _sgpa_result(subjects: list[str], credits: list[int], grade_points: list[float], settings: dict) -> dict:
+    """SGPA, percentage and subject breakdown for one submit, shared across sessions."""
+    pct_formula = settings.get("pct_formula", "mu")
+
+    def compute() -> dict:
+        sgpa_dict = compute_sgpa(grade_points, credits)
+        sgpa = sgpa_dict.get("sgpa")
+        return {
+            "sgpa": sgpa,
+            "status": sgpa_dict.get("status"),
+            "percentage": sgpa_to_percentage(sgpa, formula=pct_formula) if sgpa is not None else 0.0,
+            "breakdown": build_subject_breakdown(subjects, credits, grade_points),
+        }
+
+    return cached_result("sgpa", (subjects, credits, grade_points, pct_formula), compute)
+
 def render_cgpa_page(theme, localS: LocalStorage):
     render_header(theme, "CGPA Calculator")
 
@@ -86,7 +187,12 @@ def render_cgpa_page(theme, localS: LocalStorage):
         "</p>",
         unsafe_allow_html=True
     )
-    
+    render_cgpa_calculator(localS)
+
+
+@st.fragment
+def render_cgpa_calculator(localS: LocalStorage):
+    """Semester grid and results; edits and Calculate rerun only this fragment, not the sidebar."""
     initial_state = _load_page_state("cgpa")
     submitted, num_courses, completed_semesters, credits, grades = render_inputs(initial_state)
 
@@ -100,10 +206,7 @@ def render_cgpa_page(theme, localS: LocalStorage):
         })
         # Sync manually entered CGPA grid grades to localStorage
         if st.session_state.get("storage_consent"):
-            cgpa_data = {}
-            for i in range(12):
-                if f"sgpa_{i}" in st.session_state:
-                    cgpa_data[f"sgpa_{i}"] = st.session_state[f"sgpa_{i}"]
+            cgpa_data = {f"sgpa_{i}": sgpa for i, sgpa in enumerate(cgpa_grid().sgpa)}
             localS.setItem("cgpa_data", json.dumps(cgpa_data))
 
     if submitted:
@@ -116,9 +219,9 @@ def render_cgpa_page(theme, localS: LocalStorage):
                 st.write("Validating semester credits...")
                 effective_credits = credits[:completed_semesters]
                 effective_grades = grades[:completed_semesters]
-                cgpa_dict = compute_cgpa(effective_grades, effective_credits, method=st.session_state.get("settings", {}).get("cgpa_method", "weighted"))
-                cgpa = cgpa_dict.get("cgpa")
-                status_code = cgpa_dict.get("status")
+                result = _cgpa_result(effective_grades, effective_credits, completed_semesters, st.session_state.get("settings", {}))
+                cgpa = result["cgpa"]
+                status_code = result["status"]
                 
                 if cgpa is not None:
                     st.session_state["calculated_cgpa"] = cgpa
@@ -130,16 +233,11 @@ def render_cgpa_page(theme, localS: LocalStorage):
                 
                 st.write("Applying university formulas...")
                 total_credits = sum(effective_credits)
-                
-                if cgpa is not None:
-                    classification = classify_cgpa(cgpa)
-                    percentage = cgpa_to_percentage(cgpa, formula=st.session_state.get("settings", {}).get("pct_formula", "mu"))
-                else:
-                    classification = "Withheld"
-                    percentage = 0.0
+                classification = result["classification"]
+                percentage = result["percentage"]
                 
                 st.write("Building your result details...")
-                breakdown = build_breakdown(completed_semesters, effective_credits, effective_grades)
+                breakdown = result["breakdown"]
                 status.update(label="Results ready!", state="complete")
             
             render_results(cgpa, percentage if percentage is not None else 0.0, total_credits, classification, breakdown, completed_semesters, num_courses, credits, st.session_state.get("settings", {}), status_code=status_code)
@@ -156,10 +254,16 @@ def render_cgpa_page(theme, localS: LocalStorage):
 
 def render_sgpa_page(theme, localS: LocalStorage):
     render_header(theme, "SGPA Calculator")
+    render_sgpa_calculator(localS)
+
+
+@st.fragment
+def render_sgpa_calculator(localS: LocalStorage):
+    """Subject grid and results; edits and Calculate rerun only this fragment, not the sidebar."""
     initial_state = _load_page_state("sgpa")
     submitted, subjects, credits, grade_points = render_sgpa_inputs(initial_state)
 
-    grade_letters = [str(st.session_state.get(f"subject_grade_{i}", "A")) for i in range(len(subjects))]
+    grade_letters = sgpa_grid().grades[:len(subjects)]
     if not st.session_state.get("sgpa_clear_pending", False):
         _save_page_state("sgpa", {
             "num_subjects": len(subjects),
@@ -177,9 +281,9 @@ def render_sgpa_page(theme, localS: LocalStorage):
         try:
             with st.status("Calculating SGPA...", expanded=False) as status:
                 st.write("Mapping grade points...")
-                sgpa_dict = compute_sgpa(grade_points, credits)
-                sgpa = sgpa_dict.get("sgpa")
-                status_code = sgpa_dict.get("status")
+                result = _sgpa_result(subjects, credits, grade_points, st.session_state.get("settings", {}))
+                sgpa = result["sgpa"]
+                status_code = result["status"]
                 
                 if status_code == "error":
                     status.update(label="Calculation failed", state="error")
@@ -187,13 +291,10 @@ def render_sgpa_page(theme, localS: LocalStorage):
                     return
                 
                 st.write("Applying formulas...")
-                if sgpa is not None:
-                    percentage = sgpa_to_percentage(sgpa, formula=st.session_state.get("settings", {}).get("pct_formula", "mu"))
-                else:
-                    percentage = 0.0
+                percentage = result["percentage"]
                 
                 st.write("Generating breakdown...")
-                breakdown = build_subject_breakdown(subjects, credits, grade_points)
+                breakdown = result["breakdown"]
                 status.update(label="Calculation complete!", state="complete")
                 
             render_sgpa_results(sgpa, percentage if percentage is not None else 0.0, sum(credits), breakdown, st.session_state.get("settings", {}), status_code=status_code)
@@ -203,7 +304,9 @@ def render_sgpa_page(theme, localS: LocalStorage):
             if target_sem_val != "None" and sgpa is not None and status_code != "error":
                 try:
                     sem_idx = int(target_sem_val.split(" ")[1]) - 1
-                    st.session_state[f"sgpa_{sem_idx}"] = sgpa
+                    grid = cgpa_grid(_load_page_state("cgpa"))
+                    grid.sgpa[sem_idx], grid.backlog[sem_idx] = sgpa, False
+                    forget_widgets(st.session_state, SEMESTER_WIDGETS, MAX_SEMESTERS)
                     st.toast(f"Linked SGPA {sgpa:.2f} to {target_sem_val} in CGPA Calculator!")
                     
                     # Persist across page states
@@ -283,8 +386,11 @@ def main() -> None:
                 if cgpa_data:
                     try:
                         parsed_data = json.loads(cgpa_data) if isinstance(cgpa_data, str) else cgpa_data
+                        grid = cgpa_grid(_load_page_state("cgpa"))
                         for k, v in parsed_data.items():
-                            st.session_state[k] = v
+                            index = int(k.removeprefix("sgpa_"))
+                            if 0 <= index < MAX_SEMESTERS:
+                                grid.sgpa[index] = float(v)
                     except Exception:
                         pass
             elif str(consent_given).lower() == "false":
@@ -318,8 +424,8 @@ def main() -> None:
             )
             pct_formula = st.selectbox(
                 "Percentage Formula:",
-                options=["mu", "cbse", "direct"],
-                format_func=lambda x: "Goa / Mumbai (CGPA - 0.75)×10" if x == "mu" else ("CBSE / AICTE (CGPA × 9.5)" if x == "cbse" else "Direct (CGPA × 10)"),
+                options=list(PERCENTAGE_FORMULAS),
+                format_func=lambda x: PERCENTAGE_FORMULAS[x].label,
                 key="sidebar_pct_formula",
                 help="Different boards use different math to convert CGPA to a percentage. Ask your college if you aren't sure."
             )
@@ -330,16 +436,10 @@ def main() -> None:
             }
 
         with st.sidebar.expander("💾 Backup & Restore", expanded=True):
-            current_state = {
-                "cgpa": _load_page_state("cgpa"),
-                "sgpa": _load_page_state("sgpa"),
-                "planner": _load_page_state("planner"),
-                "settings": st.session_state["settings"]
-            }
-            json_state = json.dumps(current_state, indent=2)
+            page_states, settings = _page_states(), st.session_state["settings"]
             st.download_button(
                 label="Save my scores to computer",
-                data=json_state,
+                data=lambda: _backup_json(page_states, settings),
                 file_name="cgpa_profile.json",
                 mime="application/json",
                 width="stretch",
@@ -353,6 +453,11 @@ def main() -> None:
                         if "cgpa" in uploaded_state: _save_page_state("cgpa", uploaded_state["cgpa"])
                         if "sgpa" in uploaded_state: _save_page_state("sgpa", uploaded_state["sgpa"])
                         if "planner" in uploaded_state: _save_page_state("planner", uploaded_state["planner"])
+                        # Rebuild the grids and their counts from the loaded page states on the next run.
+                        for grid_key in (CGPA_GRID_KEY, SGPA_GRID_KEY, "cgpa_num_courses", "cgpa_completed_semesters", "sgpa_num_subjects"):
+                            st.session_state.pop(grid_key, None)
+                        forget_widgets(st.session_state, SEMESTER_WIDGETS, MAX_SEMESTERS)
+                        forget_widgets(st.session_state, SUBJECT_WIDGETS, MAX_SUBJECTS)
                         if "settings" in uploaded_state:
                             st.session_state["settings"] = uploaded_state["settings"]
                             st.session_state["sidebar_syllabus_scheme"] = uploaded_state["settings"].get("syllabus_scheme", "rc1920")
@@ -395,6 +500,13 @@ def main() -> None:
                         st.session_state["storage_consent"] = False
                         st.rerun()
 
+        if Config.DEBUG:
+            with st.sidebar.expander("🧮 Shared caches"):
+                st.json({"results": RESULTS_CACHE.stats(), "exports": EXPORT_CACHE.stats(), "curriculum": curriculum_catalog().stats()})
+            with st.sidebar.expander("🧠 Session memory"):
+                st.json(measure_session(st.session_state).as_dict(Config.SESSION_MEMORY_BUDGET))
+            warmup_panel = st.sidebar.expander("🔥 Warm-up")
+
         # Navigation
         cgpa_page = st.Page(lambda: render_cgpa_page(theme, localS), title="CGPA", url_path="cgpa", icon="📊")
         update_cgpa_page = st.Page(lambda: render_update_cgpa_page(theme), title="Update CGPA", url_path="update", icon="🔄")
@@ -413,6 +525,10 @@ def main() -> None:
         
         pg.run()
         render_footer()
+        warmup_report = _warm_up_process()
+        if Config.DEBUG:
+            warmup_panel.json(warmup_report)
+        _account_session_memory()
         
     except Exception as app_error:
         logger.critical(f"Critical application error: {str(app_error)}", exc_info=True)
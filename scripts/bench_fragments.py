@@ -0,0 +1,94 @@
+# scripts/bench_fragments.py
+"""
+Rerun latency of the CGPA and SGPA calculators: full app rerun vs fragment rerun.
+
+A full rerun executes main() (sidebar settings, LocalStorage sync, Backup & Restore,
+navigation) and then the page. A fragment rerun executes only the calculator
+fragment, which is what Streamlit does when a widget inside it changes. Both are
+timed with AppTest on a 12-semester CGPA form and a 15-subject SGPA form.
+
+Usage: python scripts/bench_fragments.py [reruns]
+"""
+import os
+import statistics
+import sys
+import time
+from unittest.mock import MagicMock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# The LocalStorage component needs a browser; a stub keeps the timing server-side only.
+sys.modules["streamlit_local_storage"] = MagicMock()
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from src.state import CGPA_GRID_KEY, SGPA_GRID_KEY, SemesterGrid, SubjectGrid  # noqa: E402
+
+
+def full_app(url_path: str) -> None:
+    import streamlit as st
+    import main
+
+    class _Navigation:
+        def __init__(self, pages, **_kwargs):
+            self.page = next(p for group in pages.values() for p in group if p.url_path == url_path)
+
+        def run(self) -> None:
+            # StreamlitPage.run() only works for the page st.navigation picked itself.
+            self.page._page()
+
+    st.navigation = _Navigation
+    main.main()
+
+
+def fragment_only(url_path: str) -> None:
+    from unittest.mock import MagicMock
+    import main
+
+    local_storage = MagicMock()
+    local_storage.getItem.return_value = None
+    if url_path == "cgpa":
+        main.render_cgpa_calculator(local_storage)
+    else:
+        main.render_sgpa_calculator(local_storage)
+
+
+def seeded(app, url_path: str) -> AppTest:
+    at = AppTest.from_function(app, args=(url_path,), default_timeout=60)
+    at.session_state["settings"] = {"syllabus_scheme": "custom", "cgpa_method": "weighted", "pct_formula": "mu"}
+    at.session_state["sidebar_syllabus_scheme"] = "custom"
+    if url_path == "cgpa":
+        at.session_state["cgpa_num_courses"] = 12
+        at.session_state["cgpa_completed_semesters"] = 12
+        at.session_state[CGPA_GRID_KEY] = SemesterGrid([20] * 12, [8.0] * 12)
+    else:
+        at.session_state["sgpa_num_subjects"] = 15
+        at.session_state[SGPA_GRID_KEY] = SubjectGrid(credits=[3] * 15)
+    return at.run()
+
+
+def time_reruns(at: AppTest, reruns: int) -> list[float]:
+    timings = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    reruns = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{reruns} reruns each, milliseconds (median / p90)\n")
+    for url_path, label in (("cgpa", "CGPA, 12 semesters"), ("sgpa", "SGPA, 15 subjects")):
+        print(label)
+        for name, app in (("full app rerun", full_app), ("fragment rerun", fragment_only)):
+            at = seeded(app, url_path)
+            if at.exception or at.error:
+                raise SystemExit(f"{name} failed: {(at.exception or at.error)[0].value}")
+            timings = sorted(time_reruns(at, reruns))
+            p90 = timings[int(0.9 * (len(timings) - 1))]
+            print(f"  {name:<15} {statistics.median(timings):7.1f} / {p90:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
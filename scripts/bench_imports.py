@@ -0,0 +1,66 @@
+# scripts/bench_imports.py
+"""
+Cold-start cost of ``import main``, which is what every first paint (Home, Guide) pays.
+
+Each sample is a fresh interpreter. "lazy" is the app as shipped; "eager" first
+imports the heavy libraries the pages now load on demand, which is what
+``import main`` used to cost. The heavy-module table comes from ``-X importtime``.
+
+Usage: python scripts/bench_imports.py [samples]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("pandas", "numpy", "plotly.express", "plotly.graph_objects", "fpdf", "src.export", "src.projection")
+EAGER = "import pandas, numpy, plotly.express, plotly.graph_objects, src.export, src.projection; "
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{prelude}import main
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def sample(prelude: str) -> tuple[float, str]:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(prelude=prelude, heavy=HEAVY)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    return float(out[0]) * 1000, out[1] if len(out) > 1 else ""
+
+
+def heavy_import_times() -> dict[str, int]:
+    """Cumulative microseconds per heavy module when imported eagerly."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", EAGER + "import main"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stderr
+    times = {}
+    for line in err.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if name.strip() in HEAVY:
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"import main, {samples} fresh interpreters each, milliseconds (median / min)\n")
+    for label, prelude in (("eager", EAGER), ("lazy", "")):
+        runs = [sample(prelude) for _ in range(samples)]
+        times = [t for t, _ in runs]
+        loaded = runs[-1][1] or "none"
+        print(f"  {label:<5} {statistics.median(times):7.1f} / {min(times):7.1f}   heavy modules loaded: {loaded}")
+    print("\nDeferred modules, cumulative import time when loaded (ms):")
+    for name, micros in sorted(heavy_import_times().items(), key=lambda item: -item[1]):
+        print(f"  {name:<22} {micros / 1000:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# scripts/bench_styles.py
+"""
+Measure what inject_styles costs per rerun: bytes on the wire and build time.
+
+"Before" is the original per-rerun f-string build. "After" is the cached, minified
+stylesheet. Both are reported for a first render and for a later rerun, where
+Streamlit's ForwardMsg cache sends only a hash reference if the payload is
+byte-identical and above ``global.minCachedMessageSize``.
+
+Usage: python scripts/bench_styles.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit import config  # noqa: E402
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg  # noqa: E402
+from streamlit.runtime.forward_msg_cache import create_reference_msg, populate_hash_if_needed  # noqa: E402
+
+from src.config import get_theme, global_css  # noqa: E402
+from src.layout import compiled_stylesheet, enhanced_css  # noqa: E402
+
+
+def markdown_msg(body: str) -> ForwardMsg:
+    msg = ForwardMsg()
+    msg.delta.new_element.markdown.body = body
+    msg.delta.new_element.markdown.allow_html = True
+    populate_hash_if_needed(msg)
+    return msg
+
+
+def wire_bytes(msg: ForwardMsg, client_has_hash: bool) -> int:
+    if client_has_hash and msg.metadata.cacheable:
+        msg = create_reference_msg(msg)
+    return len(msg.SerializeToString())
+
+
+def main() -> None:
+    threshold = int(config.get_option("global.minCachedMessageSize"))
+    print(f"ForwardMsg cache threshold: {threshold:,} bytes\n")
+    for dark in (False, True):
+        theme = get_theme(dark)
+        before = markdown_msg(f"<style>{global_css(theme)}{enhanced_css(theme)}</style>")
+        after = markdown_msg(compiled_stylesheet(theme))
+        build_before = timeit.timeit(lambda: f"<style>{global_css(theme)}{enhanced_css(theme)}</style>", number=2000) / 2000
+        build_after = timeit.timeit(lambda: compiled_stylesheet(theme), number=2000) / 2000
+
+        print(f"{'dark' if dark else 'light'} theme")
+        for label, msg, build in (("before", before, build_before), ("after", after, build_after)):
+            print(
+                f"  {label:<6}: {wire_bytes(msg, False):>6,} B first render, "
+                f"{wire_bytes(msg, True):>6,} B per later rerun, {build * 1e6:6.2f} us to build"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+"""
+Vectorized cohort engines mirroring the scalar functions in ``src.logic``.
+
+Each engine takes students x semesters (or students x subjects) matrices and
+returns per-student arrays whose values and status codes match what the scalar
+function would return for that student's row.
+"""
+from typing import Optional
+
+import numpy as np
+
+from .logic import (
+    CLASSIFICATION_EDGES,
+    CLASSIFICATION_LABELS,
+    MAX_CREDITS,
+    MAX_GRADE,
+    MIN_CREDITS,
+    MIN_GRADE,
+    POINT_SCALE,
+    US_GPA_FORMULA,
+    LinearFormula,
+    _check_engine,
+    get_percentage_formula,
+)
+
+
+def _as_matrix(values, name: str) -> np.ndarray:
+    matrix = np.asarray(values)
+    # Integer matrices stay integral so the fixed-point engine can skip its whole-credit check.
+    if matrix.dtype.kind not in "iuf":
+        matrix = matrix.astype(np.float64)
+    if matrix.ndim != 2:
+        raise ValueError(f"{name} must be a 2-D students x semesters matrix, got shape {matrix.shape}.")
+    return matrix
+
+
+def _blocked_mask(blocked, grades: np.ndarray) -> Optional[np.ndarray]:
+    if blocked is None:
+        return None
+    mask = np.asarray(blocked, dtype=bool)
+    if mask.shape != grades.shape:
+        raise ValueError(f"blocked mask shape {mask.shape} does not match grades shape {grades.shape}.")
+    return mask
+
+
+def _rows_any(mask: np.ndarray) -> np.ndarray:
+    return np.asarray(mask.any(axis=1), dtype=bool)
+
+
+def _rows_all(mask: np.ndarray) -> np.ndarray:
+    return np.asarray(mask.all(axis=1), dtype=bool)
+
+
+def _row_sums(values: np.ndarray) -> np.ndarray:
+    """Sum each row left to right, matching Python's ``sum`` bit for bit."""
+    total = np.zeros(values.shape[0], dtype=np.float64)
+    for column in range(values.shape[1]):
+        total += values[:, column]
+    return total
+
+
+def _validated_means(
+    grades: np.ndarray,
+    credits: np.ndarray,
+    method: str,
+    engine: str = "float",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return per-row means and the mask of rows ``compute_cgpa`` would clear."""
+    bad_credit = _rows_any((credits < MIN_CREDITS) | (credits > MAX_CREDITS))
+    if engine == "fixed":
+        return _fixed_point_means(grades, credits, method, ~bad_credit)
+
+    # Comparisons are written like the scalar checks so NaN passes through the same way.
+    bad_grade = _rows_any((grades < MIN_GRADE) | (grades > MAX_GRADE))
+    valid = ~bad_grade & ~bad_credit
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if method == "simple_average":
+            return _row_sums(grades) / grades.shape[1], valid
+        total_credits = _row_sums(credits)
+        values = _row_sums(grades * credits) / total_credits
+    return values, valid & (total_credits > 0)
+
+
+def _fixed_point_means(
+    grades: np.ndarray,
+    credits: np.ndarray,
+    method: str,
+    valid: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Integer-arithmetic means matching ``compute_cgpa(..., engine="fixed")``.
+
+    Integer addition is associative, so rows reduce in a single pass and the
+    result is independent of summation order, chunking and worker count.
+    """
+    # Written so NaN fails the range check, as the scalar fixed engine rejects it.
+    in_range = _rows_all((grades >= MIN_GRADE) & (grades <= MAX_GRADE))
+    valid = valid & in_range
+    if credits.dtype.kind == "f":
+        valid &= _rows_all(credits == np.floor(credits))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Rows holding NaN or fractional credits cast to junk here but are already invalid.
+        scaled = np.rint(grades * POINT_SCALE).astype(np.int64)
+        if method == "simple_average":
+            return scaled.sum(axis=1) / (POINT_SCALE * grades.shape[1]), valid
+        int_credits = credits.astype(np.int64)
+        total_credits = int_credits.sum(axis=1)
+        weighted_sum = np.einsum("ij,ij->i", scaled, int_credits)
+        values = weighted_sum / (POINT_SCALE * total_credits)
+    return values, valid & (total_credits > 0)
+
+
+def compute_cgpa_batch(
+    grades,
+    credits,
+    blocked: Optional[np.ndarray] = None,
+    method: str = "weighted",
+    engine: str = "float",
+) -> dict:
+    """Compute CGPA for a whole cohort in one vectorized sweep.
+
+    Args:
+        grades: students x semesters SGPA matrix. Values in blocked cells are ignored.
+        credits: Matching students x semesters credit matrix.
+        blocked: Optional boolean mask marking semesters whose SGPA is None.
+        method: 'weighted' or 'simple_average', as in ``compute_cgpa``.
+        engine: 'float' or 'fixed', as in ``compute_cgpa``.
+
+    Returns:
+        ``{"cgpa": float64 array (NaN where None), "status": str array}`` with
+        status codes 'cleared', 'blocked' or 'error' per student.
+    """
+    _check_engine(engine)
+    grade_matrix = _as_matrix(grades, "grades")
+    credit_matrix = _as_matrix(credits, "credits")
+    if grade_matrix.shape != credit_matrix.shape:
+        raise ValueError(
+            f"grades shape {grade_matrix.shape} does not match credits shape {credit_matrix.shape}."
+        )
+    blocked_mask = _blocked_mask(blocked, grade_matrix)
+
+    n_students, n_semesters = grade_matrix.shape
+    cgpa = np.full(n_students, np.nan)
+    status = np.full(n_students, "error", dtype="<U7")
+    if n_semesters == 0:
+        return {"cgpa": cgpa, "status": status}
+
+    if blocked_mask is None:
+        is_blocked = np.zeros(n_students, dtype=bool)
+        safe_grades = grade_matrix
+    else:
+        is_blocked = _rows_any(blocked_mask)
+        safe_grades = np.where(blocked_mask, 0.0, grade_matrix)
+    values, computable = _validated_means(safe_grades, credit_matrix, method, engine)
+    computable &= ~is_blocked
+
+    cgpa[computable] = values[computable]
+    status[computable] = "cleared"
+    status[is_blocked] = "blocked"
+    return {"cgpa": cgpa, "status": status}
+
+
+def compute_sgpa_batch(
+    grade_points,
+    credits,
+    missing: Optional[np.ndarray] = None,
+    engine: str = "float",
+) -> dict:
+    """Compute SGPA for every student's subject row in one vectorized sweep.
+
+    Applies the same rules as ``compute_sgpa`` in the same order: missing grade
+    points give 'invalid_input', any failed (0.0) credit-bearing subject gives
+    'backlog_pending', then the weighted mean is validated like ``compute_cgpa``.
+
+    Args:
+        grade_points: students x subjects grade-point matrix.
+        credits: Matching students x subjects credit matrix.
+        missing: Optional boolean mask marking subjects whose grade point is None.
+        engine: 'float' or 'fixed', as in ``compute_sgpa``.
+
+    Returns:
+        ``{"sgpa": float64 array (NaN where None), "status": str array}``.
+    """
+    _check_engine(engine)
+    point_matrix = _as_matrix(grade_points, "grade_points")
+    credit_matrix = _as_matrix(credits, "credits")
+    if point_matrix.shape != credit_matrix.shape:
+        raise ValueError(
+            f"grade_points shape {point_matrix.shape} does not match credits shape {credit_matrix.shape}."
+        )
+    missing_mask = _blocked_mask(missing, point_matrix)
+
+    n_students, n_subjects = point_matrix.shape
+    sgpa = np.full(n_students, np.nan)
+    status = np.full(n_students, "error", dtype="<U15")
+    if n_subjects == 0:
+        return {"sgpa": sgpa, "status": status}
+
+    if missing_mask is None:
+        is_missing = np.zeros(n_students, dtype=bool)
+        safe_points = point_matrix
+        failed = (safe_points == 0.0) & (credit_matrix > 0)
+    else:
+        is_missing = _rows_any(missing_mask)
+        safe_points = np.where(missing_mask, 0.0, point_matrix)
+        failed = (safe_points == 0.0) & (credit_matrix > 0) & ~missing_mask
+    has_backlog = _rows_any(failed) & ~is_missing
+    values, computable = _validated_means(safe_points, credit_matrix, "weighted", engine)
+    computable &= ~is_missing & ~has_backlog
+
+    sgpa[computable] = values[computable]
+    status[computable] = "cleared"
+    status[has_backlog] = "backlog_pending"
+    status[is_missing] = "invalid_input"
+    return {"sgpa": sgpa, "status": status}
+
+
+def summarize_semesters_batch(
+    grades,
+    credits,
+    blocked: Optional[np.ndarray] = None,
+    remaining_credits=None,
+    minimum_future_sgpa: float = 6.0,
+    realistic_future_sgpa: float = 8.0,
+    best_future_sgpa: float = 9.5,
+) -> dict:
+    """Cohort version of ``summarize_semesters``.
+
+    Args:
+        grades: students x semesters SGPA matrix; NaN cells count as blocked.
+        credits: Matching students x semesters credit matrix.
+        blocked: Optional boolean mask of blocked semesters.
+        remaining_credits: Optional scalar or per-student array of credits still to come.
+
+    Returns:
+        A dict of per-student arrays keyed like the ``SemesterSummary`` fields, with
+        the projection split into 'minimum', 'realistic' and 'best' (NaN where None).
+    """
+    grade_matrix = _as_matrix(grades, "grades").astype(np.float64)
+    credit_matrix = _as_matrix(credits, "credits")
+    if grade_matrix.shape != credit_matrix.shape:
+        raise ValueError(
+            f"grades shape {grade_matrix.shape} does not match credits shape {credit_matrix.shape}."
+        )
+    blocked_mask = _blocked_mask(blocked, grade_matrix)
+    missing = np.isnan(grade_matrix)
+    if blocked_mask is not None:
+        missing |= blocked_mask
+    valid = ~missing
+    n_students, n_semesters = grade_matrix.shape
+    scenarios = {"minimum": minimum_future_sgpa, "realistic": realistic_future_sgpa, "best": best_future_sgpa}
+    if n_semesters == 0:
+        # argmax/argmin cannot reduce an empty axis; report what summarize_semesters([], []) does.
+        no_semesters = np.zeros(n_students, dtype=np.int64)
+        nothing = np.zeros(n_students)
+        summary = {
+            "count": no_semesters,
+            "mean_sgpa": nothing,
+            "slope": nothing,
+            "consistency": np.full(n_students, 100.0),
+            "strongest_semester": no_semesters,
+            "strongest_sgpa": nothing,
+            "weakest_semester": no_semesters,
+            "weakest_sgpa": nothing,
+            "cgpa": np.full(n_students, np.nan),
+            "status": np.full(n_students, "error", dtype="<U7"),
+            "cleared_credits": no_semesters,
+        }
+        for name in scenarios:
+            summary[name] = np.full(n_students, np.nan)
+        return summary
+
+    count = valid.sum(axis=1)
+    values = np.where(valid, grade_matrix, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_y = np.where(count > 0, values.sum(axis=1) / count, 0.0)
+        positions = np.cumsum(valid, axis=1)
+        dx = np.where(valid, positions - (count[:, None] + 1) / 2.0, 0.0)
+        dy = np.where(valid, grade_matrix - mean_y[:, None], 0.0)
+        m2_x = (dx * dx).sum(axis=1)
+        slope = np.where((count >= 2) & (m2_x > 0), (dx * dy).sum(axis=1) / m2_x, 0.0)
+        std_dev = np.sqrt((dy * dy).sum(axis=1) / count)
+    consistency = np.where(count >= 2, np.clip(100.0 - (std_dev / 10.0) * 100.0, 0.0, 100.0), 100.0)
+
+    has_any = count > 0
+    strongest_idx = np.argmax(np.where(valid, grade_matrix, -np.inf), axis=1)
+    weakest_idx = np.argmin(np.where(valid, grade_matrix, np.inf), axis=1)
+    rows = np.arange(n_students)
+
+    cgpa_result = compute_cgpa_batch(grade_matrix, credit_matrix, missing)
+    cgpa = cgpa_result["cgpa"]
+    cleared_credits = np.where(valid, credit_matrix, 0).sum(axis=1)
+
+    summary = {
+        "count": count,
+        "mean_sgpa": mean_y,
+        "slope": slope,
+        "consistency": consistency,
+        "strongest_semester": np.where(has_any, strongest_idx + 1, 0),
+        "strongest_sgpa": np.where(has_any, grade_matrix[rows, strongest_idx], 0.0),
+        "weakest_semester": np.where(has_any, weakest_idx + 1, 0),
+        "weakest_sgpa": np.where(has_any, grade_matrix[rows, weakest_idx], 0.0),
+        "cgpa": cgpa,
+        "status": cgpa_result["status"],
+        "cleared_credits": cleared_credits,
+    }
+
+    if remaining_credits is None:
+        for name in scenarios:
+            summary[name] = np.full(n_students, np.nan)
+        return summary
+
+    remaining = np.broadcast_to(np.asarray(remaining_credits, dtype=np.float64), (n_students,))
+    projectable = ~np.isnan(cgpa) & (cleared_credits > 0) & (remaining >= 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        current_points = cgpa * cleared_credits
+        final_credits = cleared_credits + remaining
+        for name, future_sgpa in scenarios.items():
+            projected = (current_points + future_sgpa * remaining) / final_credits
+            summary[name] = np.where(projectable, projected, np.nan)
+    return summary
+
+
+def _apply_formula(formula: LinearFormula, values: np.ndarray) -> np.ndarray:
+    """Vectorized ``LinearFormula.apply``; same operation order, so results match bit for bit."""
+    converted = (values - formula.offset) / formula.divisor * formula.scale
+    if formula.floor is None:
+        return converted
+    # Python's max(floor, x) keeps the floor unless x is greater, so NaN maps to the floor too.
+    return np.where(converted > formula.floor, converted, formula.floor)
+
+
+def gpa_to_percentage_batch(values, formula: str = "mu") -> np.ndarray:
+    """Vectorized ``gpa_to_percentage``: NaN where the scalar returns None.
+
+    NaN input passes the range check as in the scalar, so it converts to the
+    formula's floor (0.0 for ``"mu"``) or to NaN for formulas without one.
+    """
+    gpas = np.asarray(values, dtype=np.float64)
+    # Written like the scalar check so NaN passes through the same way.
+    in_range = ~((gpas < MIN_GRADE) | (gpas > MAX_GRADE))
+    with np.errstate(invalid="ignore"):
+        return np.where(in_range, _apply_formula(get_percentage_formula(formula), gpas), np.nan)
+
+
+def classify_cgpa_batch(values) -> np.ndarray:
+    """Vectorized ``classify_cgpa`` over the shared bin edges; NaN is "Needs improvement" as in the scalar."""
+    gpas = np.asarray(values, dtype=np.float64)
+    bins = np.searchsorted(np.array(CLASSIFICATION_EDGES), gpas, side="right")
+    return np.array(CLASSIFICATION_LABELS)[np.where(np.isnan(gpas), 0, bins)]
+
+
+def convert_gpa_batch(values, formula: str = "mu") -> dict:
+    """Percentage, US GPA and classification for a whole column of GPAs in one call.
+
+    Args:
+        values: Array of 10-point CGPAs or SGPAs; NaN marks students without one.
+        formula: Key of a registered percentage formula, as in ``gpa_to_percentage``.
+
+    Returns:
+        ``{"percentage", "us_gpa", "classification"}`` arrays aligned with ``values``;
+        students without a GPA get NaN conversions and an empty classification.
+    """
+    gpas = np.asarray(values, dtype=np.float64)
+    missing = np.isnan(gpas)
+    return {
+        "percentage": np.where(missing, np.nan, gpa_to_percentage_batch(gpas, formula)),
+        "us_gpa": np.where(missing, np.nan, _apply_formula(US_GPA_FORMULA, gpas)),
+        "classification": np.where(missing, "", classify_cgpa_batch(gpas)),
+    }
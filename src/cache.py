@@ -0,0 +1,165 @@
+"""
+Process-wide memoization of computed results, shared by every session on the server.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from .config import Config
+
+_MISSING = object()
+
+
+def canonical_hash(*parts: Any) -> str:
+    """SHA-256 of a canonical JSON encoding of ``parts``.
+
+    Dict keys are sorted and tuples encode like lists, so equal inputs hash equally
+    whichever session or widget order produced them.
+    """
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe bounded mapping with least-recently-used eviction and hit/miss counters.
+
+    Cached values are shared between sessions, so callers must treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing and storing it on a miss.
+
+        ``compute`` runs outside the lock, so two sessions missing the same key at
+        once may both compute it; the results are equal and the later one is kept.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class ByteBudgetCache(LRUCache):
+    """LRUCache that also bounds the total size of its values, for binary exports.
+
+    Values larger than the whole budget are returned to the caller but never stored.
+    """
+
+    def __init__(self, maxbytes: int, maxsize: int = 1024, sizeof: Callable[[Any], int] = len):
+        super().__init__(maxsize)
+        if maxbytes <= 0:
+            raise ValueError("maxbytes must be positive.")
+        self.maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._sizes: dict[Hashable, int] = {}
+        self.nbytes = 0
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value)
+        if size > self.maxbytes:
+            return
+        with self._lock:
+            self.nbytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, key: Hashable) -> None:
+        """Re-measure the value under ``key`` after it grew or shrank in place, evicting to fit.
+
+        A value that alone outgrows the budget is evicted too, as ``put`` would not store it.
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                return
+            size = self._sizeof(value)
+            self.nbytes += size - self._sizes[key]
+            self._sizes[key] = size
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until both bounds hold; caller holds the lock."""
+        while len(self._data) > self.maxsize or self.nbytes > self.maxbytes:
+            evicted, _ = self._data.popitem(last=False)
+            self.nbytes -= self._sizes.pop(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        super().clear()
+        with self._lock:
+            self._sizes.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self._lock:
+            stats.update(bytes=self.nbytes, maxbytes=self.maxbytes)
+        return stats
+
+
+RESULTS_CACHE = LRUCache(Config.RESULTS_CACHE_SIZE)
+# Content-addressed PDF/PNG exports; sessions keep only the key.
+EXPORT_CACHE = ByteBudgetCache(Config.EXPORT_CACHE_BYTES)
+
+
+def cached_result(namespace: str, inputs: tuple, compute: Callable[[], Any], cache: Optional[LRUCache] = None) -> Any:
+    """Memoize ``compute()`` under ``namespace`` and the canonical hash of ``inputs``."""
+    cache = RESULTS_CACHE if cache is None else cache
+    return cache.get_or_compute(canonical_hash(namespace, *inputs), compute)
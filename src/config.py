@@ -212,6 +212,20 @@ class Config:
     ENVIRONMENT = os.getenv('ENVIRONMENT', 'development').lower()
     DATABASE_URL = os.getenv('DATABASE_URL', '')
     SECRET_KEY = os.getenv('SECRET_KEY', '')
+    # Entries in the process-wide results cache shared by all sessions.
+    RESULTS_CACHE_SIZE = int(os.getenv('RESULTS_CACHE_SIZE', '512'))
+    # Total bytes of generated PDF/PNG exports kept for reuse across sessions.
+    EXPORT_CACHE_BYTES = int(os.getenv('EXPORT_CACHE_BYTES', str(64 * 1024 * 1024)))
+    # Per-session byte budget; regenerable entries (uploads, results, frames, blobs) are evicted above it.
+    SESSION_MEMORY_BUDGET = int(os.getenv('SESSION_MEMORY_BUDGET', str(2 * 1024 * 1024)))
+    # Memory cap for curriculum shards kept loaded; least recently used shards are dropped above it.
+    CURRICULUM_CACHE_BYTES = int(os.getenv('CURRICULUM_CACHE_BYTES', str(32 * 1024 * 1024)))
+    # Let the app rewrite a stale curriculum snapshot next to its shard; off by default,
+    # so a deploy prebuilds them with scripts/build_curriculum_snapshot.py instead.
+    CURRICULUM_SNAPSHOT_WRITE = os.getenv('CURRICULUM_SNAPSHOT_WRITE', 'False') == 'True'
+    # Comma-separated warm-up steps run once per server process ('all' or 'none'). The
+    # default leaves out 'charts', whose PNG export needs the optional kaleido package.
+    WARMUP_STEPS = os.getenv('WARMUP_STEPS', 'imports,curriculum,styles,fonts,pdf')
 
     @staticmethod
     def validate():
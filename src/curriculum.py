@@ -0,0 +1,375 @@
+"""
+Curriculum catalog: per-university, per-scheme shards under ``data/curriculum/``,
+listed in ``manifest.json`` and each loaded on first use into a
+scheme -> template -> semester index with precomputed credit totals.
+
+An index reads compiled tables (see :mod:`src.snapshot`), normally straight from
+the memory-mapped snapshot next to its shard, and materializes a semester's
+subjects only when it is first looked up.
+
+Templates keep their full JSON keys (e.g. ``"Computer Engineering - RC 2019-20"``)
+because those are the values users see and save as ``template_branch``.
+"""
+import json
+import os
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Mapping, Optional, Sequence
+
+from .cache import ByteBudgetCache
+from .config import Config
+from .search import SearchIndex, build_search_index
+from .snapshot import CurriculumTables, compile_tables, load_tables, semester_number
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "curriculum")
+MANIFEST_PATH = os.path.join(CATALOG_DIR, "manifest.json")
+MANIFEST_VERSION = 1
+
+# Syllabus scheme key (as in the sidebar settings) -> suffix used in curriculum template
+# names; the default for indexes built outside the catalog, which takes tags from its manifest.
+SCHEME_TAGS = {
+    "rc1920": "RC 2019-20",
+    "nep2025": "NEP 2025",
+}
+FIRST_YEAR_PREFIX = "First Year"
+
+
+def _tag_of(template: str) -> str:
+    return template.rsplit(" - ", 1)[-1]
+
+
+@dataclass(frozen=True, slots=True)
+class SemesterTemplate:
+    """One semester of a template: ``subjects`` are ``{name, credits}`` dicts in syllabus order."""
+    label: str
+    number: int
+    subjects: tuple[dict, ...]
+    credits: int
+
+    @property
+    def count(self) -> int:
+        return len(self.subjects)
+
+
+class CurriculumIndex:
+    """Scheme -> template -> semester lookups over compiled curriculum tables.
+
+    Lookups are dict accesses; per-template semester maps, semesters and credit
+    vectors are built on first use and kept. Semesters are ordered by number even
+    where the JSON lists them out of order.
+    """
+    __slots__ = (
+        "_schemes_by_tag", "_tables", "_template_ids", "_by_scheme", "_branches", "_first_year",
+        "_semester_rows", "_semesters", "_scheme_credits", "_credits", "_search",
+        "_table_bytes", "_cached_bytes",
+    )
+
+    def __init__(self, data: Mapping[str, Mapping[str, Sequence[dict]]], tags: Mapping[str, str] = SCHEME_TAGS):
+        self._load(compile_tables(data), tags)
+
+    @classmethod
+    def from_tables(cls, tables: CurriculumTables, tags: Mapping[str, str] = SCHEME_TAGS) -> "CurriculumIndex":
+        index = cls.__new__(cls)
+        index._load(tables, tags)
+        return index
+
+    @classmethod
+    def from_file(cls, path: str, tags: Mapping[str, str] = SCHEME_TAGS) -> "CurriculumIndex":
+        """Index a curriculum JSON file through its snapshot; a missing file gives an empty index."""
+        return cls.from_tables(load_tables(path, write=Config.CURRICULUM_SNAPSHOT_WRITE), tags)
+
+    def _load(self, tables: CurriculumTables, tags: Mapping[str, str]) -> None:
+        self._schemes_by_tag = {tag: scheme for scheme, tag in tags.items()}
+        self._tables = tables
+        self._table_bytes = tables.nbytes
+        self._cached_bytes = 0
+        names = [tables.strings[i] for i in tables.template_name]
+        self._template_ids = {name: i for i, name in enumerate(names)}
+        self._first_year: dict[str, str] = {}
+        by_scheme: dict[str, list[str]] = {}
+        for name in names:
+            scheme = self._scheme_of(name)
+            by_scheme.setdefault(scheme, []).append(name)
+            if name.startswith(FIRST_YEAR_PREFIX):
+                self._first_year.setdefault(scheme, name)
+        self._by_scheme = {scheme: tuple(templates) for scheme, templates in by_scheme.items()}
+        self._branches = {
+            scheme: tuple(t for t in templates if t != self._first_year.get(scheme))
+            for scheme, templates in self._by_scheme.items()
+        }
+        self._semester_rows: dict[int, dict[int, int]] = {}
+        self._semesters: dict[int, SemesterTemplate] = {}
+        self._scheme_credits: dict[str, tuple[int, ...]] = {}
+        self._credits: dict[str, tuple[int, ...]] = {}
+        self._search: dict[str, SearchIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self._template_ids)
+
+    def __contains__(self, template: object) -> bool:
+        return template in self._template_ids
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the tables plus the semesters and search indexes built so far."""
+        return self._table_bytes + self._cached_bytes
+
+    def _scheme_of(self, template: str) -> str:
+        """Scheme key for a template name; unknown suffixes are used as their own key."""
+        tag = _tag_of(template)
+        return self._schemes_by_tag.get(tag, tag)
+
+    def _rows(self, template: str) -> dict[int, int]:
+        """Semester number -> semester row for a template; empty for unknown templates."""
+        template_id = self._template_ids.get(template)
+        if template_id is None:
+            return {}
+        rows = self._semester_rows.get(template_id)
+        if rows is None:
+            t = self._tables
+            first = t.template_first[template_id]
+            rows = {t.semester_number[row]: row for row in range(first, first + t.template_count[template_id])}
+            self._semester_rows[template_id] = rows
+        return rows
+
+    def _row(self, template: str, number: int) -> Optional[int]:
+        """Semester row, falling back to the scheme's common first-year template."""
+        row = self._rows(template).get(number)
+        if row is None:
+            first_year = self._first_year.get(self._scheme_of(template))
+            if first_year:
+                row = self._rows(first_year).get(number)
+        return row
+
+    def _semester(self, row: int) -> SemesterTemplate:
+        semester = self._semesters.get(row)
+        if semester is None:
+            t = self._tables
+            first = t.semester_first[row]
+            subjects = tuple(
+                {"name": t.strings[t.subject_name[i]], "credits": t.subject_credits[i]}
+                for i in range(first, first + t.semester_count[row])
+            )
+            semester = SemesterTemplate(
+                t.strings[t.semester_label[row]], t.semester_number[row], subjects, t.semester_credits[row]
+            )
+            self._semesters[row] = semester
+            # Names are the tables' strings, already counted there.
+            self._cached_bytes += sys.getsizeof(semester) + sys.getsizeof(subjects) + sum(map(sys.getsizeof, subjects))
+        return semester
+
+    def templates(self, scheme: str) -> tuple[str, ...]:
+        """Every template of a scheme, first-year templates included, in file order."""
+        return self._by_scheme.get(scheme, ())
+
+    def branches(self, scheme: str) -> tuple[str, ...]:
+        """Branch templates of a scheme, without the common first-year template."""
+        return self._branches.get(scheme, ())
+
+    def semesters(self, template: str) -> tuple[str, ...]:
+        """Semester labels of a template in semester order."""
+        return tuple(self._tables.strings[self._tables.semester_label[row]] for row in self._rows(template).values())
+
+    def semester(self, template: str, semester: int | str) -> Optional[SemesterTemplate]:
+        """One semester of a template by number or label (``"Semester 3"``).
+
+        A branch template without that semester falls back to its scheme's common
+        first-year template.
+        """
+        number = semester if isinstance(semester, int) else semester_number(semester)
+        row = self._row(template, number)
+        return None if row is None else self._semester(row)
+
+    def _common_credits(self, scheme: str) -> tuple[int, ...]:
+        """Most common credit total per semester across the scheme's templates, from semester 1 to the first gap."""
+        totals: dict[int, Counter] = {}
+        for template in self.templates(scheme):
+            for number, row in self._rows(template).items():
+                totals.setdefault(number, Counter())[self._tables.semester_credits[row]] += 1
+        vector: list[int] = []
+        while len(vector) + 1 in totals:
+            vector.append(totals[len(vector) + 1].most_common(1)[0][0])
+        return tuple(vector)
+
+    def _template_credits(self, template: str, common: tuple[int, ...]) -> tuple[int, ...]:
+        """A template's own credit totals per semester, filled from its scheme's common vector."""
+        vector: list[int] = []
+        for number in range(1, max(len(common), max(self._rows(template), default=0)) + 1):
+            row = self._row(template, number)
+            if row is not None:
+                vector.append(self._tables.semester_credits[row])
+            elif number <= len(common):
+                vector.append(common[number - 1])
+            else:
+                break
+        return tuple(vector)
+
+    def credits(self, scheme: str, branch: Optional[str] = None) -> tuple[int, ...]:
+        """Credit totals per semester from semester 1, computed once per scheme and branch.
+
+        With a ``branch`` of this scheme, its own totals (first-year semesters from the
+        common template); otherwise, or for another scheme's branch, the total most
+        templates of the scheme share. Empty when the scheme has no templates.
+        """
+        common = self._scheme_credits.get(scheme)
+        if common is None:
+            common = self._scheme_credits[scheme] = self._common_credits(scheme)
+        if branch is None or branch not in self._template_ids or self._scheme_of(branch) != scheme:
+            return common
+        own = self._credits.get(branch)
+        if own is None:
+            own = self._credits[branch] = self._template_credits(branch, common)
+        return own
+
+    def search_index(self, scheme: str) -> SearchIndex:
+        """Quick Fill search over a scheme's semesters and subject names, built on first use."""
+        index = self._search.get(scheme)
+        if index is None:
+            index = self._search[scheme] = build_search_index(self, scheme)
+            self._cached_bytes += index.nbytes
+        return index
+
+    def subjects(self, branch: str, first_semester: int, last_semester: int) -> list[dict]:
+        """List ``{semester, name, credits}`` for a branch's semesters, first to last inclusive."""
+        subjects = []
+        for number in range(first_semester, last_semester + 1):
+            found = self.semester(branch, number)
+            for subject in found.subjects if found else ():
+                subjects.append({"semester": number, **subject})
+        return subjects
+
+
+@dataclass(frozen=True, slots=True)
+class Shard:
+    """One manifest entry: the curriculum of one university's syllabus scheme."""
+    scheme: str
+    university: str
+    tag: str
+    path: str
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> dict[str, Shard]:
+    """Shards listed in a catalog manifest, keyed by scheme; a missing manifest lists none.
+
+    Shard paths are relative to the manifest. Raises ValueError for an unknown
+    manifest version or two shards sharing a template-name tag.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported curriculum manifest version {manifest.get('version')!r} in {path}.")
+    base = os.path.dirname(path)
+    shards = {
+        scheme: Shard(scheme, entry["university"], entry["tag"], os.path.join(base, entry["path"]))
+        for scheme, entry in manifest.get("shards", {}).items()
+    }
+    tags = [shard.tag for shard in shards.values()]
+    if len(set(tags)) != len(tags):
+        raise ValueError(f"Curriculum shards in {path} must have distinct tags.")
+    return shards
+
+
+class CurriculumCatalog:
+    """Every curriculum shard behind the :class:`CurriculumIndex` lookups.
+
+    Scheme lookups go to that scheme's shard and template lookups to the shard
+    whose tag ends the template name. A shard is loaded on first use and kept in
+    an LRU bounded by ``maxbytes`` of index memory, re-measured whenever a lookup
+    materializes semesters or a search index; an evicted shard reloads from its
+    snapshot.
+    """
+    __slots__ = ("shards", "_schemes_by_tag", "_cache")
+
+    def __init__(self, shards: Mapping[str, Shard], maxbytes: int = Config.CURRICULUM_CACHE_BYTES):
+        self.shards = dict(shards)
+        self._schemes_by_tag = {shard.tag: scheme for scheme, shard in self.shards.items()}
+        self._cache = ByteBudgetCache(maxbytes, maxsize=max(len(self.shards), 1), sizeof=lambda index: index.nbytes)
+
+    @classmethod
+    def from_manifest(cls, path: str = MANIFEST_PATH, maxbytes: int = Config.CURRICULUM_CACHE_BYTES) -> "CurriculumCatalog":
+        return cls(load_manifest(path), maxbytes)
+
+    def __bool__(self) -> bool:
+        return bool(self.shards)
+
+    def __contains__(self, template: object) -> bool:
+        shard = self._shard_of(template) if isinstance(template, str) else None
+        return shard is not None and template in shard
+
+    def shard(self, scheme: str) -> Optional[CurriculumIndex]:
+        """The index of a scheme's shard, loading it on first use; None for schemes without one."""
+        shard = self.shards.get(scheme)
+        if shard is None:
+            return None
+        return self._cache.get_or_compute(scheme, lambda: CurriculumIndex.from_file(shard.path, {scheme: shard.tag}))
+
+    def _scheme_for(self, template: str) -> Optional[str]:
+        return self._schemes_by_tag.get(_tag_of(template))
+
+    def _shard_of(self, template: str) -> Optional[CurriculumIndex]:
+        scheme = self._scheme_for(template)
+        return None if scheme is None else self.shard(scheme)
+
+    def _reaccount(self, scheme: str, shard: CurriculumIndex, before: int) -> None:
+        """Re-measure a shard in the cache if the last lookup built more of it."""
+        if shard.nbytes != before:
+            self._cache.resize(scheme)
+
+    def templates(self, scheme: str) -> tuple[str, ...]:
+        shard = self.shard(scheme)
+        return shard.templates(scheme) if shard else ()
+
+    def branches(self, scheme: str) -> tuple[str, ...]:
+        shard = self.shard(scheme)
+        return shard.branches(scheme) if shard else ()
+
+    def credits(self, scheme: str, branch: Optional[str] = None) -> tuple[int, ...]:
+        shard = self.shard(scheme)
+        return shard.credits(scheme, branch) if shard else ()
+
+    def semesters(self, template: str) -> tuple[str, ...]:
+        shard = self._shard_of(template)
+        return shard.semesters(template) if shard else ()
+
+    def semester(self, template: str, semester: int | str) -> Optional[SemesterTemplate]:
+        scheme = self._scheme_for(template)
+        shard = None if scheme is None else self.shard(scheme)
+        if scheme is None or shard is None:
+            return None
+        before = shard.nbytes
+        found = shard.semester(template, semester)
+        self._reaccount(scheme, shard, before)
+        return found
+
+    def subjects(self, branch: str, first_semester: int, last_semester: int) -> list[dict]:
+        scheme = self._scheme_for(branch)
+        shard = None if scheme is None else self.shard(scheme)
+        if scheme is None or shard is None:
+            return []
+        before = shard.nbytes
+        subjects = shard.subjects(branch, first_semester, last_semester)
+        self._reaccount(scheme, shard, before)
+        return subjects
+
+    def search_index(self, scheme: str) -> SearchIndex:
+        shard = self.shard(scheme)
+        if shard is None:
+            return SearchIndex(())
+        before = shard.nbytes
+        index = shard.search_index(scheme)
+        self._reaccount(scheme, shard, before)
+        return index
+
+    def stats(self) -> dict:
+        """Shard cache counters for the debug view."""
+        return self._cache.stats()
+
+
+@lru_cache(maxsize=1)
+def curriculum_catalog() -> CurriculumCatalog:
+    """The process-wide catalog of ``data/curriculum/manifest.json``."""
+    return CurriculumCatalog.from_manifest()
@@ -1,5 +1,6 @@
 import io
 import datetime
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 
 try:
@@ -9,20 +10,23 @@ except ImportError:
     _FPDF_AVAILABLE = False
     FPDF = object  # dummy base so class definition below doesn't error
 
+
+@lru_cache(maxsize=1)
+def card_fonts() -> tuple:
+    """Title, CGPA, subtitle and footer fonts for the shareable card, loaded once per process."""
+    try:
+        return tuple(ImageFont.load_default(size=size) for size in (40, 120, 30, 20))
+    except TypeError:  # Pillow < 10.1 has a single fixed-size default font
+        font = ImageFont.load_default()
+        return font, font, font, font
+
 def generate_shareable_card(cgpa: float, percentage: float, standing: str) -> bytes:
     """Generate a shareable PNG card with the user's CGPA and standing."""
     width, height = 800, 450
     bg_color = (37, 99, 235)  # Blue 600
     card = Image.new("RGB", (width, height), bg_color)
     draw = ImageDraw.Draw(card)
-
-    try:
-        font_title = ImageFont.load_default(size=40)
-        font_cgpa = ImageFont.load_default(size=120)
-        font_sub = ImageFont.load_default(size=30)
-        font_footer = ImageFont.load_default(size=20)
-    except TypeError:
-        font_title = font_cgpa = font_sub = font_footer = ImageFont.load_default()
+    font_title, font_cgpa, font_sub, font_footer = card_fonts()
 
     # Draw Text
     draw.text((width//2, 80), "My CGPA Result", fill=(255,255,255), anchor="ms", font=font_title)
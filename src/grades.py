@@ -0,0 +1,124 @@
+"""
+Compiled letter-grade scales: letter -> integer code -> grade point.
+"""
+import math
+from array import array
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+
+GRADE_POINT_MAP = {
+    "O": 10.0,
+    "A+": 9.0,
+    "A": 8.0,
+    "B+": 7.0,
+    "B": 6.0,
+    "C": 5.0,
+    "P": 4.0,
+    "F": 0.0,
+}
+
+# Code given to letters that are not on the scale.
+UNKNOWN_CODE = -1
+
+
+class GradeScale(Mapping):
+    """Immutable, hashable letter -> grade point table.
+
+    Letters keep the order of the source map and get integer codes 0..n-1;
+    points live in an ``array('d')`` indexed by code. Lookups accept the exact
+    letter or its stripped, upper-cased form, like ``grade_letter_to_point``.
+    """
+
+    __slots__ = ("_letters", "_points", "_codes", "_key", "_hash")
+
+    def __init__(self, grade_map: Mapping[str, float]):
+        self._letters = tuple(str(letter) for letter in grade_map)
+        self._points = array("d", (float(grade_map[letter]) for letter in grade_map))
+        codes: dict[str, int] = {}
+        for code, letter in enumerate(self._letters):
+            codes[letter] = code
+        for code, letter in enumerate(self._letters):
+            codes.setdefault(letter.strip().upper(), code)
+        self._codes = codes
+        self._key = tuple(zip(self._letters, self._points))
+        self._hash = hash(self._key)
+
+    @classmethod
+    def from_map(cls, grade_map: Mapping[str, float]) -> "GradeScale":
+        """Return the shared compiled scale for ``grade_map``, building it at most once."""
+        if isinstance(grade_map, GradeScale):
+            return grade_map
+        return _compiled_scale(tuple((str(k), float(v)) for k, v in grade_map.items()))
+
+    @property
+    def letters(self) -> tuple[str, ...]:
+        return self._letters
+
+    @property
+    def points(self) -> array:
+        """Grade points indexed by code (a copy; the scale itself never changes)."""
+        return array("d", self._points)
+
+    @property
+    def key(self) -> tuple[tuple[str, float], ...]:
+        """Ordered (letter, point) pairs; a plain hashable key for external caches."""
+        return self._key
+
+    def code(self, letter: Optional[str]) -> int:
+        """Integer code of ``letter``, or ``UNKNOWN_CODE`` if it is not on the scale."""
+        if not letter:
+            return UNKNOWN_CODE
+        code = self._codes.get(letter)
+        if code is None:
+            code = self._codes.get(letter.strip().upper(), UNKNOWN_CODE)
+        return code
+
+    def point(self, letter: Optional[str]) -> Optional[float]:
+        """Grade point of ``letter``, or None if it is not on the scale."""
+        code = self.code(letter)
+        return None if code == UNKNOWN_CODE else self._points[code]
+
+    def to_codes(self, letters: Iterable[Optional[str]]) -> array:
+        """Encode letters as an ``array('b')`` of codes (``UNKNOWN_CODE`` for unknown letters)."""
+        return array("b", (self.code(letter) for letter in letters))
+
+    def codes_to_points(self, codes: Iterable[int], default: float = math.nan) -> array:
+        """Decode codes to an ``array('d')`` of points, using ``default`` for unknown codes."""
+        points = self._points
+        return array("d", (points[c] if c >= 0 else default for c in codes))
+
+    def to_points(self, letters: Iterable[Optional[str]], default: float = math.nan) -> array:
+        """Convert many letters at once to an ``array('d')`` of grade points."""
+        return self.codes_to_points(self.to_codes(letters), default)
+
+    def __getitem__(self, letter: str) -> float:
+        code = self.code(letter)
+        if code == UNKNOWN_CODE:
+            raise KeyError(letter)
+        return self._points[code]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._letters)
+
+    def __len__(self) -> int:
+        return len(self._letters)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GradeScale):
+            return self._key == other._key
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"GradeScale({dict(self._key)!r})"
+
+
+@lru_cache(maxsize=64)
+def _compiled_scale(items: tuple[tuple[str, float], ...]) -> GradeScale:
+    return GradeScale(dict(items))
+
+
+DEFAULT_GRADE_SCALE = GradeScale.from_map(GRADE_POINT_MAP)
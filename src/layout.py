@@ -4,80 +4,146 @@ Streamlit UI layout for CGPA Calculator (modular, clean, secure, HCD-focused).
 Enhanced with Human-Centered Design principles for optimal user experience.
 """
 import streamlit as st
-import streamlit.components.v1 as components
 from typing import Optional, List, Tuple, Dict, Any
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
+import datetime
+import inspect
 import json
+import math
 import os
+import re
+from functools import lru_cache
+from .cache import EXPORT_CACHE, cached_result, canonical_hash
 from .config import Theme, global_css
+from .curriculum import curriculum_catalog
 from .logic import (
+    BreakdownTable,
     DEFAULT_CREDITS,
     DEFAULT_SEM_COUNT,
     RC1920_CREDITS,
     NEP2025_CREDITS,
     get_scheme_credits,
     GRADE_POINT_MAP,
-    consistency_score,
+    GradeScale,
+    US_GPA_FORMULA,
+    get_percentage_formula,
+    gpa_to_us_gpa,
     grade_letter_to_point,
-    predict_final_cgpa_range,
-    semester_trend_slope,
-    strongest_weakest_semester,
-    what_if_simulator,
+    summarize_semesters,
 )
-from .export import (
-    generate_pdf_report,
-    generate_shareable_card
+from .planner import plan_for_target
+from .search import SearchIndex, describe
+from .state import (
+    CGPA_GRID_KEY,
+    MAX_SEMESTERS,
+    MAX_SUBJECTS,
+    SEMESTER_WIDGETS,
+    SGPA_GRID_KEY,
+    SUBJECT_WIDGETS,
+    SemesterGrid,
+    SubjectGrid,
+    forget_widgets,
+    semester_grid,
+    subject_grid,
 )
 
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+# Results listed under the Quick Fill search box.
+QUICK_FILL_HITS = 8
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and redundant whitespace; output is deterministic for a given input."""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_WHITESPACE.sub(" ", css)
+    css = _CSS_PUNCTUATION.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+@lru_cache(maxsize=8)
+def compiled_stylesheet(theme: Theme) -> str:
+    """The full ``<style>`` block for a theme, built once per process.
+
+    Every rerun then sends byte-identical markdown, and Streamlit's ForwardMsg cache
+    replaces payloads above ``global.minCachedMessageSize`` with a hash reference the
+    browser already holds.
+    """
+    return f"<style>{minify_css(global_css(theme) + enhanced_css(theme))}</style>"
+
 def inject_styles(theme: Theme) -> None:
     """Inject global + component CSS."""
-    st.markdown(f"<style>{global_css(theme)}{enhanced_css(theme)}</style>", unsafe_allow_html=True)
-    
-    # Inject JavaScript to allow swipe-to-close for the sidebar on mobile
-    components.html(
-        """
-        <script>
-            const doc = window.parent.document;
-            if (!doc.swipeGestureAdded) {
-                let touchstartX = 0;
-                let touchstartY = 0;
-                let touchendX = 0;
-                let touchendY = 0;
-
-                doc.addEventListener('touchstart', e => {
-                    touchstartX = e.changedTouches[0].screenX;
-                    touchstartY = e.changedTouches[0].screenY;
-                }, { passive: true });
-
-                doc.addEventListener('touchend', e => {
-                    touchendX = e.changedTouches[0].screenX;
-                    touchendY = e.changedTouches[0].screenY;
-                    
-                    const xDiff = touchstartX - touchendX;
-                    const yDiff = Math.abs(touchstartY - touchendY);
-                    
-                    // Detect left swipe (at least 50px left, and mostly horizontal)
-                    if (xDiff > 50 && yDiff < 50) { 
-                        // Dispatch Escape key event to close the Streamlit sidebar
-                        const escEvent = new KeyboardEvent('keydown', {
-                            key: 'Escape',
-                            code: 'Escape',
-                            keyCode: 27,
-                            which: 27,
-                            bubbles: true
-                        });
-                        doc.dispatchEvent(escEvent);
-                    }
-                }, { passive: true });
-                doc.swipeGestureAdded = true;
-            }
-        </script>
-        """,
-        height=0,
-        width=0,
-    )
+    st.markdown(compiled_stylesheet(theme), unsafe_allow_html=True)
+    inject_client_script("swipe_to_close_sidebar", SWIPE_TO_CLOSE_JS)
+
+
+# Left swipe on mobile closes the sidebar by dispatching Escape to the page.
+SWIPE_TO_CLOSE_JS = """
+if (!document.swipeGestureAdded) {
+    let touchstartX = 0;
+    let touchstartY = 0;
+
+    document.addEventListener('touchstart', e => {
+        touchstartX = e.changedTouches[0].screenX;
+        touchstartY = e.changedTouches[0].screenY;
+    }, { passive: true });
+
+    document.addEventListener('touchend', e => {
+        const xDiff = touchstartX - e.changedTouches[0].screenX;
+        const yDiff = Math.abs(touchstartY - e.changedTouches[0].screenY);
+
+        // Detect left swipe (at least 50px left, and mostly horizontal)
+        if (xDiff > 50 && yDiff < 50) {
+            document.dispatchEvent(new KeyboardEvent('keydown', {
+                key: 'Escape',
+                code: 'Escape',
+                keyCode: 27,
+                which: 27,
+                bubbles: true
+            }));
+        }
+    }, { passive: true });
+    document.swipeGestureAdded = true;
+}
+"""
+
+
+def inject_client_script(name: str, script: str) -> bool:
+    """Run a script in the page at most once per browser session.
+
+    ``st.html`` executes the script in the app document itself (no iframe), and the
+    listeners it installs outlive the element, so later reruns send nothing. Scripts
+    should still guard against double installation, because a reconnect after a
+    server restart starts a new session in the same page.
+
+    Streamlit releases whose ``st.html`` cannot run scripts get the script in a
+    zero-size component iframe instead, with ``document`` bound to the app page, on
+    every run as before.
+
+    Returns:
+        True if the script was sent on this run.
+    """
+    if not html_runs_scripts():
+        import streamlit.components.v1 as components
+        components.html(
+            f"<script>(function(document){{{script}}})(window.parent.document);</script>",
+            height=0,
+            width=0,
+        )
+        return True
+    injected = st.session_state.setdefault("injected_client_scripts", set())
+    if name in injected:
+        return False
+    st.html(f"<script>{script}</script>", unsafe_allow_javascript=True)
+    injected.add(name)
+    return True
+
+
+@lru_cache(maxsize=1)
+def html_runs_scripts() -> bool:
+    """Whether this Streamlit's ``st.html`` accepts ``unsafe_allow_javascript`` (1.52+)."""
+    return "unsafe_allow_javascript" in inspect.signature(st.html).parameters
+
 
 def enhanced_css(theme: Theme) -> str:
     """
@@ -826,23 +892,16 @@ def render_compare_page():
         
         if use_active:
             # Reconstruct live CGPA state
-            cgpa_state_live = st.session_state.get("cgpa_state", {}).copy()
-            live_grades = []
+            page_states = st.session_state.get("page_states", {})
+            cgpa_state_live = page_states.get("cgpa", {}).copy()
             num_courses = st.session_state.get("cgpa_num_courses", cgpa_state_live.get("num_courses", 8))
-            for i in range(num_courses):
-                val = st.session_state.get(f"sgpa_{i}")
-                if val is not None:
-                    live_grades.append(float(val))
-                elif len(cgpa_state_live.get("grades", [])) > i:
-                    live_grades.append(cgpa_state_live["grades"][i])
-                else:
-                    live_grades.append(None)
-            cgpa_state_live["grades"] = live_grades
+            if CGPA_GRID_KEY in st.session_state:
+                cgpa_state_live["grades"] = st.session_state[CGPA_GRID_KEY].grades(num_courses)
 
             data1 = {
                 "cgpa": cgpa_state_live,
-                "sgpa": st.session_state.get("sgpa_state", {}),
-                "planner": st.session_state.get("planner_state", {}),
+                "sgpa": page_states.get("sgpa", {}),
+                "planner": page_states.get("planner", {}),
                 "settings": st.session_state.get("settings", {})
             }
         elif file1:
@@ -876,6 +935,9 @@ def render_compare_page():
         label1 = get_label(name1, file1)
         label2 = get_label(name2, file2)
         
+        import pandas as pd
+        import plotly.express as px
+
         df1 = pd.DataFrame({"Semester": range(1, len(grades1) + 1), "SGPA": grades1, "Profile": label1})
         df2 = pd.DataFrame({"Semester": range(1, len(grades2) + 1), "SGPA": grades2, "Profile": label2})
         
@@ -1036,6 +1098,23 @@ def render_guide_page():
             else:
                 st.warning("Grade reference image not found. Please ensure `src/grades_for_marks.jpg` exists.")
 
+
+def credits_for_scheme(num_semesters: int, scheme: str | None = None) -> list[int]:
+    """Per-semester credits for a scheme (default: the sidebar's), exact for the Quick Fill branch if one is saved."""
+    settings = st.session_state.get("settings", {})
+    return get_scheme_credits(scheme or settings.get("syllabus_scheme", "rc1920"), num_semesters, branch=settings.get("template_branch"))
+
+
+def cgpa_grid(initial_state: dict | None = None) -> SemesterGrid:
+    """The session's semester grid, seeded from the saved CGPA page state and the active scheme's credits."""
+    return semester_grid(st.session_state, initial_state, credits_for_scheme(MAX_SEMESTERS))
+
+
+def sgpa_grid(initial_state: dict | None = None) -> SubjectGrid:
+    """The session's subject grid, seeded from the saved SGPA page state."""
+    grade_map = st.session_state.get("custom_grade_map") or GRADE_POINT_MAP
+    return subject_grid(st.session_state, initial_state, next(iter(grade_map), "A"))
+
 def render_inputs(initial_state: dict | None = None) -> tuple[bool, int, int, list[int], list[Optional[float]]]:
     """Render enhanced input form with HCD principles."""
     initial_state = initial_state or {}
@@ -1048,10 +1127,8 @@ def render_inputs(initial_state: dict | None = None) -> tuple[bool, int, int, li
     if st.session_state.get("cgpa_reset_requested", False):
         st.session_state["cgpa_num_courses"] = DEFAULT_SEM_COUNT
         st.session_state["cgpa_completed_semesters"] = DEFAULT_SEM_COUNT
-        scheme_credits = get_scheme_credits(scheme, DEFAULT_SEM_COUNT)
-        for i in range(12):
-            st.session_state[f"credit_{i}"] = int(scheme_credits[i] if i < len(scheme_credits) else scheme_credits[-1])
-            st.session_state[f"sgpa_{i}"] = 8.0
+        st.session_state[CGPA_GRID_KEY] = SemesterGrid(credits_for_scheme(MAX_SEMESTERS), [8.0] * MAX_SEMESTERS)
+        forget_widgets(st.session_state, SEMESTER_WIDGETS, MAX_SEMESTERS)
         st.session_state["cgpa_reset_requested"] = False
 
     if "cgpa_num_courses" not in st.session_state:
@@ -1061,23 +1138,7 @@ def render_inputs(initial_state: dict | None = None) -> tuple[bool, int, int, li
             initial_state.get("completed_semesters", st.session_state["cgpa_num_courses"])
         )
 
-    initial_credits = initial_state.get("credits", [])
-    initial_grades = initial_state.get("grades", [])
-    scheme_defaults = get_scheme_credits(scheme, 12)
-    for i in range(12):
-        c_key = f"credit_{i}"
-        if c_key not in st.session_state:
-            if i < len(initial_credits):
-                st.session_state[c_key] = int(initial_credits[i])
-            else:
-                st.session_state[c_key] = int(scheme_defaults[i] if i < len(scheme_defaults) else scheme_defaults[-1])
-
-        g_key = f"sgpa_{i}"
-        if g_key not in st.session_state:
-            if i < len(initial_grades):
-                st.session_state[g_key] = float(initial_grades[i])
-            else:
-                st.session_state[g_key] = 0.0
+    grid = cgpa_grid(initial_state)
 
     col_title, col_demo = st.columns([2, 1])
     with col_title:
@@ -1087,8 +1148,8 @@ def render_inputs(initial_state: dict | None = None) -> tuple[bool, int, int, li
             st.session_state["cgpa_num_courses"] = 8
             st.session_state["cgpa_completed_semesters"] = 5
             demo_grades = [8.1, 7.8, 8.4, 8.2, 8.9]
-            for i in range(12):
-                st.session_state[f"sgpa_{i}"] = demo_grades[i] if i < len(demo_grades) else 0.0
+            grid.set_grades(demo_grades + [0.0] * (MAX_SEMESTERS - len(demo_grades)))
+            forget_widgets(st.session_state, SEMESTER_WIDGETS, MAX_SEMESTERS)
             st.rerun()
 
     # Keep dynamic controls outside the form so UI updates immediately.
@@ -1141,24 +1202,28 @@ def render_inputs(initial_state: dict | None = None) -> tuple[bool, int, int, li
                         f"Semester {i + 1} Credits",
                         min_value=0,
                         max_value=35,
+                        value=min(int(grid.credits[i]), 35),
                         step=1,
                         key=f"credit_{i}",
                     )
+                    grid.credits[i] = int(credit)
                     credits.append(int(credit))
                     if int(credit) == 0 and i < completed_semesters:
                         st.error("⚠️ Missing credit", icon="🚨")
                 with col2:
                     if i < completed_semesters:
-                        is_backlog = st.checkbox(f"Backlog Pending", key=f"backlog_{i}")
-                        current_sgpa = st.session_state.get(f"sgpa_{i}", 0.0)
+                        is_backlog = st.checkbox(f"Backlog Pending", value=bool(grid.backlog[i]), key=f"backlog_{i}")
+                        current_sgpa = st.session_state.get(f"sgpa_{i}", grid.sgpa[i])
                         label_prefix = "✅ " if current_sgpa > 0.0 else ""
                         grade = st.number_input(
                             f"{label_prefix}Semester {i + 1} SGPA",
                             min_value=0.0,
+                            value=grid.sgpa[i],
                             step=0.01,
                             key=f"sgpa_{i}",
                             disabled=is_backlog
                         )
+                        grid.sgpa[i], grid.backlog[i] = float(grade), is_backlog
                         grades.append(None if is_backlog else float(grade))
                         if not is_backlog and float(grade) > 10.0:
                             st.error("⚠️ SGPA > 10.0", icon="🚨")
@@ -1166,10 +1231,9 @@ def render_inputs(initial_state: dict | None = None) -> tuple[bool, int, int, li
                         st.markdown("<div style='margin-top: 2.8rem; color: var(--muted); text-align: center; font-size: 0.9rem;'>Not completed</div>", unsafe_allow_html=True)
         else:
             # Auto-load credits from the active scheme — user only provides SGPAs
-            active_credits = get_scheme_credits(scheme, num_courses)
-            for i in range(num_courses):
-                credits.append(active_credits[i])
-                st.session_state[f"credit_{i}"] = active_credits[i]
+            active_credits = credits_for_scheme(num_courses)
+            grid.set_credits(active_credits)
+            credits.extend(active_credits)
 
             st.markdown("### Your Semester Scores")
             st.caption("Enter the SGPA for the semesters you've completed. If you have a backlog in a semester, just check the 'Backlog' box.")
@@ -1178,16 +1242,18 @@ def render_inputs(initial_state: dict | None = None) -> tuple[bool, int, int, li
                 for j in range(2):
                     if i + j < completed_semesters:
                         with cols[j]:
-                            is_backlog = st.checkbox(f"Backlog (Sem {i + j + 1})", key=f"backlog_{i+j}")
-                            current_sgpa = st.session_state.get(f"sgpa_{i+j}", 0.0)
+                            is_backlog = st.checkbox(f"Backlog (Sem {i + j + 1})", value=bool(grid.backlog[i + j]), key=f"backlog_{i+j}")
+                            current_sgpa = st.session_state.get(f"sgpa_{i+j}", grid.sgpa[i + j])
                             label_prefix = "✅ " if current_sgpa > 0.0 else ""
                             grade = st.number_input(
                                 f"{label_prefix}Semester {i + j + 1} SGPA",
                                 min_value=0.0,
+                                value=grid.sgpa[i + j],
                                 step=0.01,
                                 key=f"sgpa_{i+j}",
                                 disabled=is_backlog
                             )
+                            grid.sgpa[i + j], grid.backlog[i + j] = float(grade), is_backlog
                             grades.append(None if is_backlog else float(grade))
                             if not is_backlog and float(grade) > 10.0:
                                 st.error("⚠️ SGPA > 10.0", icon="🚨")
@@ -1226,7 +1292,7 @@ def render_results(
     percentage: float,
     total_credits: int,
     classification: str,
-    breakdown,
+    breakdown: BreakdownTable,
     completed_semesters: int,
     num_courses: int,
     all_credits: list[int],
@@ -1234,13 +1300,16 @@ def render_results(
     status_code: str = "cleared"
 ) -> None:
     """Render CGPA results. Handles withheld state with explicit backlog banner."""
+    import plotly.express as px
+    from .projection import projection_grid, simulate_final_cgpa
+
     st.markdown("<div style='height:1.5rem'></div>", unsafe_allow_html=True)
 
     if status_code != "cleared" or cgpa is None:
         # Determine which semesters are blocked
         blocked_sems = []
-        if isinstance(breakdown, pd.DataFrame) and not breakdown.empty:
-            blocked_sems = breakdown[breakdown["SGPA"].isna()]["Semester"].tolist()
+        if not breakdown.empty:
+            blocked_sems = [sem for sem, sgpa in zip(breakdown["Semester"], breakdown["SGPA"]) if math.isnan(sgpa)]
         sem_list = ", ".join(f"Semester {s}" for s in blocked_sems) if blocked_sems else "one or more semesters"
         st.markdown(f"""
 <div class='backlog-banner'>
@@ -1252,7 +1321,7 @@ def render_results(
         """, unsafe_allow_html=True)
     else:
         classification_color = get_classification_color(classification)
-        us_gpa = (cgpa / 10.0) * 4.0
+        us_gpa = gpa_to_us_gpa(cgpa)
         # Big hero number, then secondary strip
         st.markdown(f"""
 <div class='glass-card sticky-summary'>
@@ -1282,14 +1351,14 @@ def render_results(
 
     st.markdown("---")
 
-    weighted_sum = float(breakdown["Weighted"].sum()) if not breakdown.empty else 0.0
+    weighted_sum = breakdown.sum("Weighted") if not breakdown.empty else 0.0
     
     settings = settings or {}
     cgpa_method = settings.get("cgpa_method", "weighted")
     pct_formula = settings.get("pct_formula", "mu")
 
     cgpa_formula_str = r"$CGPA = \frac{\sum(SGPA_i \times Credits_i)}{\sum(Credits_i)}$" if cgpa_method == "weighted" else r"$CGPA = \frac{\sum(SGPA_i)}{n_{semesters}}$"
-    pct_formula_str = r"$(CGPA - 0.75) \times 10$" if pct_formula == "mu" else (r"$CGPA \times 9.5$" if pct_formula == "cbse" else r"$CGPA \times 10$")
+    pct_formula_str = get_percentage_formula(pct_formula).describe("CGPA")
 
     with st.expander("How it's calculated"):
         if cgpa is not None:
@@ -1304,20 +1373,21 @@ def render_results(
             - Total credits: {total_credits}
             - Final CGPA: {cgpa:.2f}
             - Percentage: {percentage:.2f}% (using {pct_formula_str})
-            - US GPA Equivalent: {(cgpa / 10.0) * 4.0:.2f} (using $(CGPA \\div 10) \\times 4.0$)
+            - US GPA Equivalent: {gpa_to_us_gpa(cgpa):.2f} (using {US_GPA_FORMULA.describe("CGPA")})
             """)
         else:
             st.markdown(f"**CGPA Formula**: {cgpa_formula_str}")
 
     st.subheader("Semester Breakdown")
+    frame = breakdown.to_frame()
     st.dataframe(
-        breakdown,
+        frame,
         width="stretch",
         height=300
     )
 
     if not breakdown.empty:
-        csv_data = breakdown.to_csv(index=False).encode('utf-8')
+        csv_data = frame.to_csv(index=False).encode('utf-8')
         st.download_button(
             label="Download Breakdown (CSV)",
             data=csv_data,
@@ -1330,51 +1400,57 @@ def render_results(
             st.subheader("Exports")
             col_export1, col_export2 = st.columns(2)
             
+            records = breakdown.records()
+            # The PDF footer carries today's date, so it is part of the PDF's content key.
+            pdf_key = canonical_hash("pdf", cgpa, percentage, classification, records, datetime.date.today().isoformat())
+            png_key = canonical_hash("png", cgpa, percentage, classification)
+
+            def build_pdf() -> bytes:
+                from .export import generate_pdf_report
+
+                # Generate a basic chart for the PDF (styled to match white PDF background)
+                fig_static = px.line(frame, x="Semester", y="SGPA", title="SGPA Trend")
+                fig_static.update_traces(line_color="#4F46E5", line_width=3)
+                fig_static.update_layout(
+                    paper_bgcolor="white", 
+                    plot_bgcolor="white", 
+                    font_color="#111827",
+                    title_font_color="#111827",
+                    width=800,
+                    height=400
+                )
+                try:
+                    chart_bytes = fig_static.to_image(format="png")
+                except Exception:
+                    chart_bytes = None
+                return generate_pdf_report(cgpa, percentage, classification, records, chart_bytes)
+
+            def build_png() -> bytes:
+                from .export import generate_shareable_card
+
+                return generate_shareable_card(cgpa, percentage, classification)
+
+            # Built on click, or served from the shared cache if any session already made
+            # the same export; on_click="ignore" keeps these results on screen.
             with col_export1:
-                if st.button("Generate PDF Report"):
-                    with st.spinner("Generating PDF..."):
-                        # Generate a basic chart for the PDF (styled to match white PDF background)
-                        fig_static = px.line(breakdown, x="Semester", y="SGPA", title="SGPA Trend")
-                        fig_static.update_traces(line_color="#4F46E5", line_width=3)
-                        fig_static.update_layout(
-                            paper_bgcolor="white", 
-                            plot_bgcolor="white", 
-                            font_color="#111827",
-                            title_font_color="#111827",
-                            width=800,
-                            height=400
-                        )
-                        try:
-                            chart_bytes = fig_static.to_image(format="png")
-                        except Exception:
-                            chart_bytes = None
-                        
-                        pdf_data = generate_pdf_report(cgpa, percentage, classification, breakdown.to_dict('records'), chart_bytes)
-                        st.session_state['pdf_export_data'] = pdf_data
-                
-                if 'pdf_export_data' in st.session_state:
-                    st.download_button(
-                        label="⬇️ Download PDF",
-                        data=st.session_state['pdf_export_data'],
-                        file_name="academic_report.pdf",
-                        mime="application/pdf",
-                        type="primary"
-                    )
+                st.download_button(
+                    label="⬇️ Download PDF Report",
+                    data=lambda: EXPORT_CACHE.get_or_compute(pdf_key, build_pdf),
+                    file_name="academic_report.pdf",
+                    mime="application/pdf",
+                    on_click="ignore",
+                    type="primary"
+                )
 
             with col_export2:
-                if st.button("Generate Shareable Card"):
-                    with st.spinner("Generating PNG..."):
-                        png_data = generate_shareable_card(cgpa, percentage, classification)
-                        st.session_state['png_export_data'] = png_data
-                        
-                if 'png_export_data' in st.session_state:
-                    st.download_button(
-                        label="⬇️ Download PNG",
-                        data=st.session_state['png_export_data'],
-                        file_name="cgpa_card.png",
-                        mime="image/png",
-                        type="primary"
-                    )
+                st.download_button(
+                    label="⬇️ Download Shareable Card",
+                    data=lambda: EXPORT_CACHE.get_or_compute(png_key, build_png),
+                    file_name="cgpa_card.png",
+                    mime="image/png",
+                    on_click="ignore",
+                    type="primary"
+                )
 
         if completed_semesters < num_courses:
             remaining_semesters = num_courses - completed_semesters
@@ -1382,99 +1458,196 @@ def render_results(
                 f"Based on first {completed_semesters} semester(s). {remaining_semesters} semester(s) remaining.",
             )
 
+        sgpa_series = list(breakdown["SGPA"])
+        completed_credits = all_credits[:completed_semesters]
+        summary = cached_result(
+            "summary", (sgpa_series, completed_credits), lambda: summarize_semesters(sgpa_series, completed_credits)
+        )
+
         with st.expander("Trend"):
             if not breakdown.empty:
                 st.bar_chart(
-                    breakdown,
+                    frame,
                     x="Semester",
                     y="SGPA",
                     height=400
                 )
                 
                 if len(breakdown) > 1:
-                    slope = semester_trend_slope(breakdown['SGPA'].tolist())
-                    trend_text = "Improving" if slope > 0.05 else ("Declining" if slope < -0.05 else "Stable")
+                    trend_text = "Improving" if summary.slope > 0.05 else ("Declining" if summary.slope < -0.05 else "Stable")
                     st.caption(f"Trend: **{trend_text}**")
 
-        sgpa_series = breakdown["SGPA"].tolist() if not breakdown.empty else []
-        slope = semester_trend_slope(sgpa_series)
-        consistency = consistency_score(sgpa_series)
-        extreme_meta = strongest_weakest_semester(sgpa_series)
-
         st.subheader("Analytics")
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Trend slope", f"{slope:+.3f}")
+            st.metric("Trend slope", f"{summary.slope:+.3f}")
         with col2:
-            st.metric("Consistency score", f"{consistency:.1f}/100")
+            st.metric("Consistency score", f"{summary.consistency:.1f}/100")
         with col3:
             st.metric(
                 "Strongest / Weakest",
-                f"S{extreme_meta['strongest_semester']} / S{extreme_meta['weakest_semester']}",
-                help=f"Best SGPA: {extreme_meta['strongest_sgpa']:.2f}, Worst SGPA: {extreme_meta['weakest_sgpa']:.2f}",
+                f"S{summary.strongest_semester} / S{summary.weakest_semester}",
+                help=f"Best SGPA: {summary.strongest_sgpa:.2f}, Worst SGPA: {summary.weakest_sgpa:.2f}",
             )
 
-        if completed_semesters < num_courses:
-            remaining_credits = sum(all_credits[completed_semesters:])
-            projection = predict_final_cgpa_range(
-                current_grades=sgpa_series,
-                current_credits=all_credits[:completed_semesters],
-                remaining_credits=remaining_credits,
-            )
-            what_if = what_if_simulator(
-                current_grades=sgpa_series,
-                current_credits=all_credits[:completed_semesters],
-                remaining_credits=remaining_credits,
+        if completed_semesters < num_courses and summary.cgpa is not None:
+            target_cgpa = st.session_state.get("planner_target_cgpa")
+            future_credits = all_credits[completed_semesters:num_courses]
+            # seed=0 makes the simulation deterministic, so identical inputs can share a result.
+            simulation = cached_result(
+                "simulation",
+                (sgpa_series, completed_credits, future_credits, target_cgpa),
+                lambda: simulate_final_cgpa(
+                    current_grades=sgpa_series,
+                    current_credits=completed_credits,
+                    future_credits=future_credits,
+                    target_cgpa=target_cgpa,
+                    seed=0,
+                ),
             )
-
-            if projection and what_if:
+            if simulation:
+                bands = simulation["percentiles"]
                 with st.expander("🔮 See my future CGPA predictions"):
-                    st.markdown("Based on how you're doing now, here's what your final score could be:")
+                    st.markdown(
+                        f"We simulated {simulation['paths']:,} possible futures from your own SGPA trend and how much your scores usually vary. "
+                        "Here's where your final CGPA is likely to land:"
+                    )
                     c1, c2, c3 = st.columns(3)
                     with c1:
-                        st.metric("Minimum case", f"{projection['minimum']:.2f}", help="If you score an average of 6.0 SGPA in remaining semesters")
+                        st.metric("Cautious case", f"{bands[10]:.2f}", help="9 out of 10 simulated futures finish above this")
                     with c2:
-                        st.metric("Realistic case", f"{projection['realistic']:.2f}", help="If you score an average of 8.0 SGPA in remaining semesters")
+                        st.metric("Most likely", f"{bands[50]:.2f}", help="Half the simulated futures finish above this")
                     with c3:
-                        st.metric("Best case", f"{projection['best']:.2f}", help="If you score an average of 9.5 SGPA in remaining semesters")
+                        st.metric("Optimistic case", f"{bands[90]:.2f}", help="Only 1 in 10 simulated futures finishes above this")
+                    if simulation["target_probability"] is not None and target_cgpa is not None:
+                        st.caption(
+                            f"Chance of reaching your Goal Planner target of **{float(target_cgpa):.2f}**: "
+                            f"**{simulation['target_probability'] * 100:.0f}%**"
+                        )
+
+                    future_credits = all_credits[completed_semesters:num_courses]
+                    milestones = {
+                        f"Semester {completed_semesters + i}": sum(future_credits[:i])
+                        for i in range(1, len(future_credits) + 1)
+                    }
+                    grid = projection_grid(summary.cgpa * summary.cleared_credits, summary.cleared_credits, list(milestones.values()))
+                    render_what_if_grid(grid, milestones, default_sgpa=round(summary.mean_sgpa, 2))
 
         st.caption("Tip: Update credits if your semester load changes.")
 
+
+@st.fragment
+def render_what_if_grid(grid, milestones: dict[str, int], default_sgpa: float) -> None:
+    """Slider and curve over a precomputed projection grid; moving the slider only reruns this fragment."""
+    import plotly.graph_objects as go
+    from .projection import GRID_SGPA
+
+    st.markdown("**Try your own number**")
+    col_sgpa, col_when = st.columns(2)
+    with col_sgpa:
+        future_sgpa = st.slider("If I average this SGPA from now on", 0.0, 10.0, float(default_sgpa), 0.01, key="what_if_future_sgpa")
+    with col_when:
+        milestone = st.selectbox("By the end of", options=list(milestones), index=len(milestones) - 1, key="what_if_milestone")
+    remaining = milestones[milestone]
+    st.metric(f"CGPA after {milestone}", f"{grid.lookup(future_sgpa, remaining):.2f}")
+
+    def build_figure() -> go.Figure:
+        fig = go.Figure(go.Scatter(
+            x=GRID_SGPA,
+            y=grid.row(remaining),
+            mode="lines",
+            hovertemplate="Average SGPA %{x:.2f} → CGPA %{y:.2f}<extra></extra>",
+        ))
+        fig.update_layout(
+            xaxis_title="Average SGPA from now on",
+            yaxis_title=f"CGPA after {milestone}",
+            height=260,
+            margin=dict(l=10, r=10, t=10, b=10),
+        )
+        return fig
+
+    # The curve depends only on the grid's totals and the milestone, not on the slider;
+    # st.plotly_chart serializes the shared figure without modifying it.
+    fig = cached_result(
+        "what_if_figure", (grid.current_points, grid.current_credits, remaining, milestone), build_figure
+    )
+    st.plotly_chart(fig, width="stretch")
+
+
+def _load_semester(grid: SubjectGrid, branch: str, sem: str) -> bool:
+    """Fill the SGPA grid with a curriculum semester and remember the branch; False if it has none."""
+    template = curriculum_catalog().semester(branch, sem)
+    if template is None:
+        return False
+    st.session_state["sgpa_num_subjects"] = template.count
+    # Also default to grade 'A' to make it faster
+    grid.load(template.subjects, "A")
+    forget_widgets(st.session_state, SUBJECT_WIDGETS, MAX_SUBJECTS)
+    st.session_state["sgpa_target_sem"] = sem
+
+    # Persist selected branch
+    settings = st.session_state.get("settings", {})
+    settings["template_branch"] = branch
+    st.session_state["settings"] = settings
+    return True
+
+
+def _quick_fill_search(grid: SubjectGrid, index: SearchIndex) -> None:
+    """Search box over the scheme's semesters and subjects; a hit loads its semester or adds its subject.
+
+    Runs before the Syllabus/Semester pickers so a loaded semester can also select them.
+    """
+    query = st.text_input(
+        "Search branch or subject",
+        key="quick_fill_query",
+        placeholder="e.g. comp sem 3, data structures",
+        help="Type part of a branch or subject name; small typos are fine.",
+    )
+    hits = index.search(query, limit=QUICK_FILL_HITS)
+    if query.strip() and not hits:
+        st.caption("No matching branch or subject.")
+    for i, hit in enumerate(hits):
+        entry = hit.entry
+        icon = "📚" if entry.kind == "semester" else "➕"
+        if not st.button(f"{icon} {describe(entry)}", key=f"quick_fill_hit_{i}", width="stretch"):
+            continue
+        if entry.kind == "semester":
+            if _load_semester(grid, entry.template, entry.semester):
+                # The Syllabus picker follows the saved branch; the Semester picker is set directly.
+                st.session_state.pop("template_branch", None)
+                st.session_state["template_sem"] = entry.semester
+                st.rerun()
+            continue
+        count = int(st.session_state.get("sgpa_num_subjects", 6))
+        row = grid.add({"name": entry.text, "credits": entry.credits}, "A", count)
+        if row is None:
+            st.warning(f"All {MAX_SUBJECTS} subject rows are in use.")
+            continue
+        st.session_state["sgpa_num_subjects"] = max(count, row + 1)
+        forget_widgets(st.session_state, SUBJECT_WIDGETS, MAX_SUBJECTS)
+        st.rerun()
+
+
 def render_sgpa_inputs(initial_state: dict | None = None) -> tuple[bool, list[str], list[int], list[float]]:
     """Render SGPA input form with subject-level details."""
+    import pandas as pd
+
     initial_state = initial_state or {}
 
     # Apply reset before creating widgets to avoid Streamlit session-state mutation errors.
     if st.session_state.get("sgpa_reset_requested", False):
         st.session_state["sgpa_num_subjects"] = 6
-        for i in range(15):
-            st.session_state[f"subject_name_{i}"] = f"Subject {i + 1}"
-            st.session_state[f"subject_credit_{i}"] = 3
-            st.session_state[f"subject_grade_{i}"] = "A"
-            st.session_state[f"subject_is_template_{i}"] = False
+        st.session_state[SGPA_GRID_KEY] = SubjectGrid()
+        forget_widgets(st.session_state, SUBJECT_WIDGETS, MAX_SUBJECTS)
         st.session_state["sgpa_reset_requested"] = False
 
     if "sgpa_num_subjects" not in st.session_state:
         st.session_state["sgpa_num_subjects"] = int(initial_state.get("num_subjects", 6))
 
-    initial_subjects = initial_state.get("subjects", [])
-    initial_credits = initial_state.get("credits", [])
-    initial_grades = initial_state.get("grades", [])
-
     if "custom_grade_map" not in st.session_state:
         st.session_state["custom_grade_map"] = initial_state.get("grade_map", dict(GRADE_POINT_MAP))
     custom_map = st.session_state["custom_grade_map"]
-
-    for i in range(15):
-        n_key = f"subject_name_{i}"
-        if n_key not in st.session_state:
-            st.session_state[n_key] = str(initial_subjects[i]) if i < len(initial_subjects) else f"Subject {i + 1}"
-        c_key = f"subject_credit_{i}"
-        if c_key not in st.session_state:
-            st.session_state[c_key] = int(initial_credits[i]) if i < len(initial_credits) else 3
-        g_key = f"subject_grade_{i}"
-        if g_key not in st.session_state:
-            st.session_state[g_key] = initial_grades[i] if i < len(initial_grades) and initial_grades[i] in custom_map else list(custom_map.keys())[0] if custom_map else "A"
+    grid = sgpa_grid(initial_state)
 
     st.subheader("SGPA Setup")
 
@@ -1509,30 +1682,18 @@ def render_sgpa_inputs(initial_state: dict | None = None) -> tuple[bool, list[st
             st.session_state["custom_grade_map"] = new_custom_map
             st.rerun()
 
-    @st.cache_data
-    def load_curriculum():
-        path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "curriculum.json")
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
-
     scheme = st.session_state.get("settings", {}).get("syllabus_scheme", "rc1920")
-    curriculum_data = load_curriculum()
+    curriculum = curriculum_catalog()
     
-    if curriculum_data:
+    if curriculum:
         has_templates = scheme in ["rc1920", "nep2025"]
         with st.expander("⚡ Quick Fill Subjects", expanded=has_templates):
             st.markdown("Pick your syllabus and semester to automatically fill out your subjects. If you're not sure, just look for your branch name.")
             
-            # Filter templates based on active scheme
-            if scheme == "rc1920":
-                valid_templates = [k for k in curriculum_data.keys() if "RC 2019-20" in k]
-            elif scheme == "nep2025":
-                valid_templates = [k for k in curriculum_data.keys() if "NEP 2025" in k]
-            else:
-                valid_templates = []
-                
+            valid_templates = list(curriculum.templates(scheme))
+            branch = sem = None
+            if valid_templates:
+                _quick_fill_search(grid, curriculum.search_index(scheme))
             if not valid_templates:
                 scheme_label = "NEP 2025" if scheme == "nep2025" else "Custom"
                 st.info(f"Auto-fill templates for **{scheme_label}** are not yet available. Please enter subjects manually below.", icon="ℹ️")
@@ -1546,25 +1707,10 @@ def render_sgpa_inputs(initial_state: dict | None = None) -> tuple[bool, list[st
                     branch = st.selectbox("Syllabus", options=valid_templates, index=default_idx, key="template_branch")
                 with col_s:
                     if branch:
-                        sem = st.selectbox("Semester", options=list(curriculum_data[branch].keys()), key="template_sem")
+                        sem = st.selectbox("Semester", options=curriculum.semesters(branch), key="template_sem")
             
             if st.button("Load Subjects", type="primary", width="stretch"):
-                if branch and sem:
-                    subjects_list = curriculum_data[branch][sem]
-                    st.session_state["sgpa_num_subjects"] = len(subjects_list)
-                    for i, subj in enumerate(subjects_list):
-                        st.session_state[f"subject_name_{i}"] = subj["name"]
-                        st.session_state[f"subject_credit_{i}"] = subj["credits"]
-                        # Also default to grade 'A' to make it faster
-                        st.session_state[f"subject_grade_{i}"] = "A"
-                        st.session_state[f"subject_is_template_{i}"] = True
-                    st.session_state["sgpa_target_sem"] = sem
-                    
-                    # Persist selected branch
-                    settings = st.session_state.get("settings", {})
-                    settings["template_branch"] = branch
-                    st.session_state["settings"] = settings
-                    
+                if branch and sem and _load_semester(grid, branch, sem):
                     st.rerun()
 
             st.markdown("---")
@@ -1593,7 +1739,7 @@ def render_sgpa_inputs(initial_state: dict | None = None) -> tuple[bool, list[st
                 unsafe_allow_html=True
             )
 
-    is_template_active = any(st.session_state.get(f"subject_is_template_{i}", False) for i in range(15))
+    is_template_active = grid.is_template
     num_subjects = int(st.number_input(
         "How many subjects do you have?",
         min_value=1,
@@ -1604,20 +1750,23 @@ def render_sgpa_inputs(initial_state: dict | None = None) -> tuple[bool, list[st
         help="This is locked when using a pre-filled syllabus template. Click 'Clear' at the bottom to reset." if is_template_active else None
     ))
 
+    grade_scale = GradeScale.from_map(st.session_state["custom_grade_map"])
+
     with st.form("sgpa_form", clear_on_submit=False):
         subjects: list[str] = []
         credits: list[int] = []
-        grade_points: list[float] = []
+        grade_letters: list[str] = []
 
         st.markdown("### Subjects")
         for i in range(num_subjects):
             col1, col2, col3 = st.columns([2.3, 1, 1])
             
-            is_template = st.session_state.get(f"subject_is_template_{i}", False)
+            is_template = bool(grid.template[i])
 
             with col1:
                 subject_name = st.text_input(
                     f"Subject {i + 1} name",
+                    value=grid.names[i],
                     key=f"subject_name_{i}",
                     disabled=is_template
                 )
@@ -1626,6 +1775,7 @@ def render_sgpa_inputs(initial_state: dict | None = None) -> tuple[bool, list[st
                     f"Credits #{i + 1}",
                     min_value=0,
                     max_value=35,
+                    value=min(int(grid.credits[i]), 35),
                     step=1,
                     key=f"subject_credit_{i}",
                     help="Credits mean how much a subject counts. Check your syllabus if you aren't sure.",
@@ -1634,15 +1784,19 @@ def render_sgpa_inputs(initial_state: dict | None = None) -> tuple[bool, list[st
             with col3:
                 grade_letter = st.selectbox(
                     f"Grade #{i + 1}",
-                    options=list(st.session_state["custom_grade_map"].keys()),
+                    options=grade_scale.letters,
+                    index=grade_scale.code(grid.grades[i]) if grid.grades[i] in grade_scale.letters else 0,
                     key=f"subject_grade_{i}",
                     help="Your final grade in this subject (e.g. A, B+)."
                 )
                 st.caption("Pass" if grade_letter != "F" else "Fail")
 
+            grid.names[i], grid.credits[i], grid.grades[i] = subject_name, int(credit), grade_letter
             subjects.append(subject_name.strip() or f"Subject {i + 1}")
             credits.append(int(credit))
-            grade_points.append(float(st.session_state["custom_grade_map"].get(grade_letter, 0.0)))
+            grade_letters.append(grade_letter)
+
+        grade_points = grade_scale.to_points(grade_letters, default=0.0).tolist()
 
         st.markdown("---")
         st.selectbox(
@@ -1681,16 +1835,17 @@ def render_sgpa_inputs(initial_state: dict | None = None) -> tuple[bool, list[st
 
     return submitted, subjects, credits, grade_points
 
-def render_sgpa_results(sgpa: Optional[float], percentage: float, total_credits: int, breakdown, settings: dict | None = None, status_code: str = "cleared") -> None:
+
+def render_sgpa_results(sgpa: Optional[float], percentage: float, total_credits: int, breakdown: BreakdownTable, settings: dict | None = None, status_code: str = "cleared") -> None:
     """Render SGPA results with withheld-state handling."""
     st.markdown("<div style='height:1.5rem'></div>", unsafe_allow_html=True)
 
-    is_failed = bool((breakdown["Grade Point"] == 0.0).any()) if not breakdown.empty else False
+    failed_subjects = [
+        subject for subject, point in zip(breakdown["Subject"], breakdown["Grade Point"]) if point == 0.0
+    ] if "Subject" in breakdown.columns else []
+    is_failed = 0.0 in breakdown["Grade Point"]
     result_status = "FAILED" if is_failed else "PASSED"
     result_color = "#EF4444" if is_failed else "#10B981"
-    failed_subjects = []
-    if not breakdown.empty:
-        failed_subjects = breakdown[breakdown["Grade Point"] == 0.0]["Subject"].tolist() if "Subject" in breakdown.columns else []
     
     if status_code != "cleared" or sgpa is None:
         subj_list = ", ".join(failed_subjects[:3]) if failed_subjects else "one or more subjects"
@@ -1716,7 +1871,7 @@ def render_sgpa_results(sgpa: Optional[float], percentage: float, total_credits:
     </div>
 </div>""", unsafe_allow_html=True)
     else:
-        us_gpa = (sgpa / 10.0) * 4.0
+        us_gpa = gpa_to_us_gpa(sgpa)
         st.markdown(f"""
 <div class='glass-card sticky-summary'>
     <div class='result-hero'>
@@ -1751,14 +1906,15 @@ def render_sgpa_results(sgpa: Optional[float], percentage: float, total_credits:
         st.warning("One or more subjects received an F grade. Re-check the grades if this looks wrong.")
 
     st.subheader("Subject Breakdown")
+    frame = breakdown.to_frame()
     st.dataframe(
-        breakdown,
+        frame,
         width="stretch",
         height=320,
     )
 
     if not breakdown.empty:
-        csv_data = breakdown.to_csv(index=False).encode('utf-8')
+        csv_data = frame.to_csv(index=False).encode('utf-8')
         st.download_button(
             label="Download Breakdown (CSV)",
             data=csv_data,
@@ -1768,9 +1924,9 @@ def render_sgpa_results(sgpa: Optional[float], percentage: float, total_credits:
 
     settings = settings or {}
     pct_formula = settings.get("pct_formula", "mu")
-    pct_formula_str = r"$(SGPA - 0.75) \times 10$" if pct_formula == "mu" else (r"$SGPA \times 9.5$" if pct_formula == "cbse" else r"$SGPA \times 10$")
+    pct_formula_str = get_percentage_formula(pct_formula).describe("SGPA")
     if sgpa is not None:
-        us_gpa = (sgpa / 10.0) * 4.0
+        us_gpa = gpa_to_us_gpa(sgpa)
         st.expander("How it's calculated").markdown(f"""
         **SGPA Formula**
 
@@ -1778,11 +1934,11 @@ def render_sgpa_results(sgpa: Optional[float], percentage: float, total_credits:
 
         **Your values**
 
-        - Total weighted score: {float(breakdown["Weighted"].sum()):.2f}
+        - Total weighted score: {breakdown.sum("Weighted"):.2f}
         - Total credits: {total_credits}
         - Final SGPA: {sgpa:.2f}
         - Percentage: {percentage:.2f}% (using {pct_formula_str})
-        - US GPA Equivalent: {us_gpa:.2f} (using $(SGPA \\div 10) \\times 4.0$)
+        - US GPA Equivalent: {us_gpa:.2f} (using {US_GPA_FORMULA.describe("SGPA")})
 
         **Rule applied**
 
@@ -1896,6 +2052,16 @@ def render_planner_inputs(initial_state: dict | None = None) -> tuple[bool, floa
             current_credits = sum(scheme_credits[:completed_sems])
             remaining_credits = sum(scheme_credits[completed_sems:])
 
+            branches = list(curriculum_catalog().branches(scheme))
+            if branches:
+                saved_branch = st.session_state.get("settings", {}).get("template_branch")
+                st.selectbox(
+                    "Branch (for subject-wise grade plans)",
+                    options=branches,
+                    index=branches.index(saved_branch) if saved_branch in branches else 0,
+                    key="planner_branch",
+                )
+
         target_cgpa = float(st.number_input(
             "Target CGPA",
             min_value=0.0,
@@ -1999,6 +2165,10 @@ def render_planner_results(
         else:
             st.info(f"Target is feasible. Maintaining an average above {required_sgpa:.2f} will get you there.")
 
+    branch = st.session_state.get("planner_branch")
+    if feasibility == "Possible" and branch:
+        render_grade_plans(branch, current_cgpa, current_credits, target_cgpa)
+
     with st.expander("How it's calculated"):
         st.markdown(f"""
         **Required SGPA Formula**
@@ -2014,6 +2184,36 @@ def render_planner_results(
         - Required SGPA: {required_sgpa:.2f}
         """)
 
+
+def render_grade_plans(branch: str, current_cgpa: float, current_credits: int, target_cgpa: float) -> None:
+    """Show subject-wise grade combinations for the remaining semesters that reach the target."""
+    import pandas as pd
+
+    completed_sems = int(st.session_state.get("planner_completed_sems", 0))
+    total_sems = int(st.session_state.get("planner_total_sems", 0))
+    subjects = curriculum_catalog().subjects(branch, completed_sems + 1, total_sems)
+    if not subjects:
+        return
+
+    with st.expander("🧩 Which grades get me there?", expanded=False):
+        plans = plan_for_target(current_cgpa, current_credits, target_cgpa, [s["credits"] for s in subjects], limit=5)
+        if not plans:
+            st.info("No grade combination over these subjects reaches the target.")
+            return
+        st.markdown(
+            f"Lowest-effort grade mixes across your remaining **{len(subjects)} subjects** in {branch.split(' - ')[0]}. "
+            "In each plan, lowering any one grade would miss the target."
+        )
+        table = {
+            "Sem": [s["semester"] for s in subjects],
+            "Subject": [s["name"] for s in subjects],
+            "Credits": [s["credits"] for s in subjects],
+        }
+        for i, plan in enumerate(plans, start=1):
+            table[f"Plan {i}"] = plan["grades"]
+        st.dataframe(pd.DataFrame(table), hide_index=True, width="stretch")
+        st.caption(" · ".join(f"Plan {i}: final CGPA {plan['final_cgpa']:.2f}" for i, plan in enumerate(plans, start=1)))
+
 def get_classification_color(classification: str) -> str:
     """Return color based on classification for visual feedback."""
     colors = {
@@ -2070,9 +2270,7 @@ def render_update_cgpa_page(theme):
         if scheme == 'custom':
             old_credits = int(st.number_input("Total Credits Earned (Base)", min_value=1, max_value=250, value=80, key="update_cgpa_old_credits"))
         else:
-            from src.logic import get_scheme_credits
-            scheme_credits = get_scheme_credits(scheme, completed_sems)
-            old_credits = sum(scheme_credits[:completed_sems])
+            old_credits = sum(credits_for_scheme(completed_sems, scheme))
             st.caption(f"Automatically calculated base credits: **{old_credits}**")
             
     st.markdown("---")
@@ -2082,6 +2280,7 @@ def render_update_cgpa_page(theme):
     
     new_sgpas = []
     new_credits = []
+    auto_credits = credits_for_scheme(completed_sems + num_new_sems, scheme) if scheme != 'custom' else []
     
     for i in range(num_new_sems):
         c1, c2 = st.columns(2)
@@ -2093,26 +2292,22 @@ def render_update_cgpa_page(theme):
             if scheme == 'custom':
                 cred = st.number_input(f"Sem {sem_idx} Credits", min_value=1, max_value=35, value=20, key=f"update_cgpa_new_cred_{i}")
             else:
-                from src.logic import get_scheme_credits
-                # Pad to cover up to 12 sems safely
-                full_credits = get_scheme_credits(scheme, 12)
-                cred = full_credits[sem_idx - 1] if sem_idx <= len(full_credits) else 20
+                cred = auto_credits[sem_idx - 1]
                 st.markdown(f"<div style='margin-top: 2.8rem; color: var(--muted);'>Auto Credits: {cred}</div>", unsafe_allow_html=True)
             new_credits.append(int(cred))
             
     if st.button("Calculate New CGPA", type="primary", use_container_width=True):
-        from src.logic import update_cgpa_with_new_semester
+        from src.logic import CGPAAccumulator
         import pandas as pd
         
-        current_cgpa = old_cgpa
-        current_creds = old_credits
+        accumulator = CGPAAccumulator.from_cgpa(old_cgpa, old_credits, semesters=completed_sems)
         
         rows = []
         rows.append({
             "Phase": "Base (Through Sem " + str(completed_sems) + ")",
             "SGPA/CGPA Added": f"{old_cgpa:.2f}",
             "Credits Added": old_credits,
-            "Overall CGPA": f"{current_cgpa:.2f}"
+            "Overall CGPA": f"{old_cgpa:.2f}"
         })
         
         for i in range(num_new_sems):
@@ -2120,17 +2315,13 @@ def render_update_cgpa_page(theme):
             cred = new_credits[i]
             sem_idx = completed_sems + i + 1
             
-            new_cgpa = update_cgpa_with_new_semester(current_cgpa, current_creds, sgpa, cred)
-            if new_cgpa is not None:
-                current_cgpa = new_cgpa
-                current_creds += cred
-                
-                rows.append({
-                    "Phase": f"Add Sem {sem_idx}",
-                    "SGPA/CGPA Added": f"{sgpa:.2f}",
-                    "Credits Added": cred,
-                    "Overall CGPA": f"{current_cgpa:.2f}"
-                })
+            accumulator.add(sgpa, cred)
+            rows.append({
+                "Phase": f"Add Sem {sem_idx}",
+                "SGPA/CGPA Added": f"{sgpa:.2f}",
+                "Credits Added": cred,
+                "Overall CGPA": f"{accumulator.cgpa:.2f}"
+            })
                 
-        st.success(f"### Final Updated CGPA: **{current_cgpa:.2f}**")
+        st.success(f"### Final Updated CGPA: **{accumulator.cgpa:.2f}**")
         st.table(pd.DataFrame(rows))
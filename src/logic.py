@@ -2,32 +2,59 @@
 """
 Core CGPA calculation logic (SOLID, testable, secure).
 """
-import pandas as pd
 import math
-from typing import List, Optional
+import struct
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Sequence, cast
 
-# RC 19-20 syllabus credit structure (Goa University Engineering)
+if TYPE_CHECKING:
+    import pandas as pd
+
+from .curriculum import curriculum_catalog
+from .grades import DEFAULT_GRADE_SCALE, GRADE_POINT_MAP, GradeScale  # noqa: F401  (re-exported)
+
+# RC 19-20 syllabus credit structure (Goa University Engineering); get_scheme_credits
+# derives it from the curriculum catalog and uses this list only if that has no rc1920 shard.
 RC1920_CREDITS = [16, 18, 23, 24, 22, 22, 17, 18]
-# NEP 2025 syllabus credit structure (uniform 20 credits per semester)
+# NEP 2025 syllabus credit structure (uniform 20 credits per semester; no curriculum templates yet)
 NEP2025_CREDITS = [20, 20, 20, 20, 20, 20, 20, 20]
 # Alias kept for backward compatibility
 DEFAULT_CREDITS = RC1920_CREDITS
 DEFAULT_SEM_COUNT = len(DEFAULT_CREDITS)
 
+# Input bounds shared by the scalar and batch engines (kept aligned with UI constraints).
+MIN_GRADE = 0.0
+MAX_GRADE = 10.0
+MIN_CREDITS = 0
+MAX_CREDITS = 35
+
+# Grade points are held as integers in units of 1/POINT_SCALE so running totals stay exact.
+POINT_SCALE = 10_000
+# "float" sums in floating point; "fixed" sums scaled integers and rounds once at the end.
+ENGINES = ("float", "fixed")
+
 _SCHEME_CREDIT_MAP: dict[str, List[int]] = {
     "rc1920": RC1920_CREDITS,
     "nep2025": NEP2025_CREDITS,
 }
 
-def get_scheme_credits(scheme: str, num_semesters: int | None = None) -> List[int]:
+
+def get_scheme_credits(scheme: str, num_semesters: int | None = None, branch: str | None = None) -> List[int]:
     """Return the credit array for the given syllabus scheme key.
     
+    Credits come from the subject credits in the scheme's curriculum shard, summed
+    per semester once per process; schemes without a shard use their hard-coded list.
+
     Args:
         scheme: One of 'rc1920', 'nep2025', or 'custom'.
-                'custom' returns an empty list — caller must supply their own.
-        num_semesters: If provided, pads or trims the credit list to match.
+                'custom' falls back to the RC 19-20 credits — callers let the user edit them.
+        num_semesters: If provided, pads (repeating the last semester) or trims the credit list to match.
+        branch: Curriculum template name (e.g. the Quick Fill ``template_branch``). A branch
+                of ``scheme`` gets its own per-semester credits; other values are ignored.
     """
-    base = list(_SCHEME_CREDIT_MAP.get(scheme, RC1920_CREDITS))
+    base = list(curriculum_catalog().credits(scheme, branch) or _SCHEME_CREDIT_MAP.get(scheme, RC1920_CREDITS))
     if num_semesters is not None:
         if num_semesters <= len(base):
             return base[:num_semesters]
@@ -35,16 +62,34 @@ def get_scheme_credits(scheme: str, num_semesters: int | None = None) -> List[in
         return base + padding
     return base
 
-GRADE_POINT_MAP = {
-    "O": 10.0,
-    "A+": 9.0,
-    "A": 8.0,
-    "B+": 7.0,
-    "B": 6.0,
-    "C": 5.0,
-    "P": 4.0,
-    "F": 0.0,
-}
+
+def _scaled_points(grade: float) -> int:
+    """Convert a grade point to an integer count of 1/POINT_SCALE units."""
+    return round(grade * POINT_SCALE)
+
+
+def _check_engine(engine: str) -> None:
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}.")
+
+
+def _fixed_point_mean(grades: List[float], credits: List[int], method: str) -> dict:
+    """Mean in integer arithmetic; the only rounding is the final division."""
+    if not all(math.isfinite(grade) for grade in grades):
+        return {"cgpa": None, "status": "error"}
+    # Whole credits keep the weighted sum integral.
+    if any(not math.isfinite(credit) or credit != int(credit) for credit in credits):
+        return {"cgpa": None, "status": "error"}
+
+    scaled = [_scaled_points(grade) for grade in grades]
+    if method == "simple_average":
+        return {"cgpa": sum(scaled) / (POINT_SCALE * len(scaled)), "status": "cleared"}
+
+    total_credits = sum(int(credit) for credit in credits)
+    if total_credits <= 0:
+        return {"cgpa": None, "status": "error"}
+    weighted_sum = sum(points * int(credit) for points, credit in zip(scaled, credits))
+    return {"cgpa": weighted_sum / (POINT_SCALE * total_credits), "status": "cleared"}
 
 def padded_default_credits(num_semesters: int) -> List[int]:
     """Ensure default credits match the selected semester count."""
@@ -53,8 +98,19 @@ def padded_default_credits(num_semesters: int) -> List[int]:
     padding = [DEFAULT_CREDITS[-1]] * (num_semesters - DEFAULT_SEM_COUNT)
     return DEFAULT_CREDITS + padding
 
-def compute_cgpa(grades: List[Optional[float]], credits: List[int], method: str = "weighted") -> dict:
-    """Compute CGPA and return a status dict."""
+
+def compute_cgpa(
+    grades: List[Optional[float]],
+    credits: List[int],
+    method: str = "weighted",
+    engine: str = "float",
+) -> dict:
+    """Compute CGPA and return a status dict.
+
+    ``engine="fixed"`` sums grade points as scaled integers so the result does not
+    depend on summation order and is identical on every machine.
+    """
+    _check_engine(engine)
     if len(grades) != len(credits):
         return {"cgpa": None, "status": "error"}
     if not grades or not credits:
@@ -66,11 +122,15 @@ def compute_cgpa(grades: List[Optional[float]], credits: List[int], method: str
         return {"cgpa": None, "status": "blocked", "blocked_semesters": pending}
 
     # Keep core validation aligned with UI constraints.
-    if any(grade < 0.0 or grade > 10.0 for grade in grades):
+    if any(grade < MIN_GRADE or grade > MAX_GRADE for grade in grades):
         return {"cgpa": None, "status": "error"}
-    if any(credit < 0 or credit > 35 for credit in credits):
+    if any(credit < MIN_CREDITS or credit > MAX_CREDITS for credit in credits):
         return {"cgpa": None, "status": "error"}
 
+    if engine == "fixed":
+        # The blocked-semester check above has returned for any None.
+        return _fixed_point_mean(cast(List[float], grades), credits, method)
+
     if method == "simple_average":
         return {"cgpa": sum(grades) / len(grades), "status": "cleared"}
 
@@ -80,8 +140,10 @@ def compute_cgpa(grades: List[Optional[float]], credits: List[int], method: str
     weighted_sum = sum(grade * credit for grade, credit in zip(grades, credits))
     return {"cgpa": weighted_sum / total_credits, "status": "cleared"}
 
-def compute_sgpa(grade_points: List[Optional[float]], credits: List[int]) -> dict:
+
+def compute_sgpa(grade_points: List[Optional[float]], credits: List[int], engine: str = "float") -> dict:
     """Compute SGPA using subject-wise grade points and credits. Returns status dict."""
+    _check_engine(engine)
     if not grade_points or not credits or len(grade_points) != len(credits):
         return {"sgpa": None, "status": "error"}
         
@@ -92,36 +154,70 @@ def compute_sgpa(grade_points: List[Optional[float]], credits: List[int]) -> dic
     if any(point == 0.0 and credit > 0 for point, credit in zip(grade_points, credits)):
         return {"sgpa": None, "status": "backlog_pending"}
 
-    base_sgpa = compute_cgpa(grade_points, credits)
+    base_sgpa = compute_cgpa(grade_points, credits, engine=engine)
     return {"sgpa": base_sgpa.get("cgpa"), "status": base_sgpa.get("status")}
 
 def grade_letter_to_point(letter: str) -> Optional[float]:
     """Convert grade letter to grade point."""
-    if not letter:
+    return DEFAULT_GRADE_SCALE.point(letter)
+
+
+@dataclass(frozen=True, slots=True)
+class LinearFormula:
+    """A GPA conversion of the form ``max(floor, (gpa - offset) / divisor * scale)``."""
+    label: str
+    expression: str
+    scale: float
+    offset: float = 0.0
+    divisor: float = 1.0
+    floor: Optional[float] = None
+
+    def apply(self, gpa: float) -> float:
+        value = (gpa - self.offset) / self.divisor * self.scale
+        return value if self.floor is None else max(self.floor, value)
+
+    def describe(self, gpa_name: str = "CGPA") -> str:
+        """LaTeX for the formula, e.g. ``$(CGPA - 0.75) \\times 10$``."""
+        return "$" + self.expression.replace("GPA", gpa_name) + "$"
+
+
+PERCENTAGE_FORMULAS: dict[str, LinearFormula] = {
+    "mu": LinearFormula("Goa / Mumbai (CGPA - 0.75)×10", r"(GPA - 0.75) \times 10", scale=10.0, offset=0.75, floor=0.0),
+    "cbse": LinearFormula("CBSE / AICTE (CGPA × 9.5)", r"GPA \times 9.5", scale=9.5),
+    "direct": LinearFormula("Direct (CGPA × 10)", r"GPA \times 10", scale=10.0),
+}
+DEFAULT_PERCENTAGE_FORMULA = "mu"
+US_GPA_FORMULA = LinearFormula("US GPA (4.0 scale)", r"(GPA \div 10) \times 4.0", scale=4.0, divisor=10.0)
+
+
+def register_percentage_formula(key: str, formula: LinearFormula) -> None:
+    """Add or replace a percentage formula; it becomes available to the scalar and batch converters."""
+    PERCENTAGE_FORMULAS[key] = formula
+
+
+def get_percentage_formula(formula: str) -> LinearFormula:
+    """Look up a percentage formula, falling back to the Goa / Mumbai formula for unknown keys."""
+    return PERCENTAGE_FORMULAS.get(formula, PERCENTAGE_FORMULAS[DEFAULT_PERCENTAGE_FORMULA])
+
+
+def gpa_to_percentage(gpa: float, formula: str = "mu") -> Optional[float]:
+    """Convert a 10-point CGPA or SGPA to percentage using a registered formula."""
+    if gpa < MIN_GRADE or gpa > MAX_GRADE:
         return None
-    return GRADE_POINT_MAP.get(letter.strip().upper())
+    return get_percentage_formula(formula).apply(gpa)
 
 def cgpa_to_percentage(cgpa: float, formula: str = "mu") -> Optional[float]:
     """Convert CGPA to percentage using the specified formula."""
-    if cgpa < 0.0 or cgpa > 10.0:
-        return None
-    if formula == "cbse":
-        return cgpa * 9.5
-    elif formula == "direct":
-        return cgpa * 10.0
-    # default to mu: (CGPA - 0.75) * 10
-    return max(0.0, (cgpa - 0.75) * 10)
+    return gpa_to_percentage(cgpa, formula)
 
 def sgpa_to_percentage(sgpa: float, formula: str = "mu") -> Optional[float]:
     """Convert SGPA to percentage using the specified formula."""
-    if sgpa < 0.0 or sgpa > 10.0:
-        return None
-    if formula == "cbse":
-        return sgpa * 9.5
-    elif formula == "direct":
-        return sgpa * 10.0
-    # default to mu: (SGPA - 0.75) * 10
-    return max(0.0, (sgpa - 0.75) * 10)
+    return gpa_to_percentage(sgpa, formula)
+
+
+def gpa_to_us_gpa(gpa: float) -> float:
+    """Convert a 10-point GPA to the US 4.0 scale."""
+    return US_GPA_FORMULA.apply(gpa)
 
 def required_sgpa_for_target(
     current_cgpa: float,
@@ -153,43 +249,88 @@ def classify_target_feasibility(required_sgpa: float) -> str:
         return "Possible"
     return "Impossible"
 
+
+# A CGPA on or above CLASSIFICATION_EDGES[i] earns CLASSIFICATION_LABELS[i + 1].
+CLASSIFICATION_EDGES = (6.0, 7.0, 8.0, 9.0)
+CLASSIFICATION_LABELS = ("Needs improvement", "Satisfactory", "Good", "Excellent", "Outstanding")
+
 def classify_cgpa(cgpa: float) -> str:
-    if cgpa >= 9:
-        return "Outstanding"
-    if cgpa >= 8:
-        return "Excellent"
-    if cgpa >= 7:
-        return "Good"
-    if cgpa >= 6:
-        return "Satisfactory"
-    return "Needs improvement"
-
-def build_breakdown(completed_semesters: int, credits: List[int], grades: List[Optional[float]]) -> pd.DataFrame:
-    weighted = []
-    for g, c in zip(grades, credits):
-        if g is None:
-            weighted.append(None)
-        else:
-            weighted.append(g * c)
-            
-    return pd.DataFrame(
-        {
-            "Semester": [i + 1 for i in range(completed_semesters)],
-            "Credits": credits,
-            "SGPA": grades,
-            "Weighted": weighted,
-        }
+    # NaN compares false against every edge, so it falls to the lowest band as the old if-chain did.
+    if math.isnan(cgpa):
+        return CLASSIFICATION_LABELS[0]
+    return CLASSIFICATION_LABELS[bisect_right(CLASSIFICATION_EDGES, cgpa)]
+
+
+@dataclass(frozen=True, slots=True)
+class BreakdownTable:
+    """Column-oriented result table: one sequence per column name, all the same length.
+
+    Numeric columns are ``array('l')`` / ``array('d')`` with NaN for missing values,
+    like the DataFrame they replace; ``to_frame()`` converts at the display boundary.
+    """
+    columns: tuple[str, ...]
+    data: tuple[Sequence, ...]
+
+    def __post_init__(self) -> None:
+        if len(self.columns) != len(self.data):
+            raise ValueError("Each column needs exactly one data sequence.")
+        if len({len(column) for column in self.data}) > 1:
+            raise ValueError("All columns must be the same length.")
+
+    def __len__(self) -> int:
+        return len(self.data[0]) if self.data else 0
+
+    def __getitem__(self, name: str) -> Sequence:
+        try:
+            return self.data[self.columns.index(name)]
+        except ValueError:
+            raise KeyError(name) from None
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def sum(self, name: str) -> float:
+        """Sum of a numeric column, skipping NaN like ``DataFrame.sum``."""
+        return math.fsum(value for value in self[name] if not math.isnan(value))
+
+    def records(self) -> list[dict]:
+        """Rows as dicts, like ``DataFrame.to_dict('records')``."""
+        return [dict(zip(self.columns, row)) for row in zip(*self.data)]
+
+    def to_frame(self) -> "pd.DataFrame":
+        import pandas as pd
+
+        return pd.DataFrame({name: list(column) for name, column in zip(self.columns, self.data)})
+
+
+def _nan_if_none(values) -> array:
+    return array("d", (math.nan if value is None else float(value) for value in values))
+
+
+def build_breakdown(completed_semesters: int, credits: List[int], grades: List[Optional[float]]) -> BreakdownTable:
+    weighted = [None if g is None else g * c for g, c in zip(grades, credits)]
+    return BreakdownTable(
+        ("Semester", "Credits", "SGPA", "Weighted"),
+        (
+            array("l", range(1, completed_semesters + 1)),
+            array("l", credits),
+            _nan_if_none(grades),
+            _nan_if_none(weighted),
+        ),
     )
 
-def build_subject_breakdown(subjects: List[str], credits: List[int], grade_points: List[float]) -> pd.DataFrame:
+
+def build_subject_breakdown(subjects: List[str], credits: List[int], grade_points: List[float]) -> BreakdownTable:
     """Build SGPA table from subject-level inputs."""
-    return pd.DataFrame(
-        {
-            "Subject": subjects,
-            "Credits": credits,
-            "Grade Point": grade_points,
-            "Weighted": [g * c for g, c in zip(grade_points, credits)],
-        }
+    return BreakdownTable(
+        ("Subject", "Credits", "Grade Point", "Weighted"),
+        (
+            tuple(subjects),
+            array("l", credits),
+            array("d", grade_points),
+            array("d", (g * c for g, c in zip(grade_points, credits))),
+        ),
     )
 
 def semester_trend_slope(grades: List[Optional[float]]) -> float:
@@ -296,9 +437,212 @@ def what_if_simulator(
         best_future_sgpa=9.5,
     )
 
+
+@dataclass(frozen=True, slots=True)
+class SemesterSummary:
+    """Everything the results page shows about a semester history, from one pass."""
+    count: int
+    mean_sgpa: float
+    slope: float
+    consistency: float
+    strongest_semester: int
+    strongest_sgpa: float
+    weakest_semester: int
+    weakest_sgpa: float
+    cgpa: Optional[float]
+    status: str
+    cleared_credits: int
+    projection: Optional[dict]
+
+
+def summarize_semesters(
+    grades: List[Optional[float]],
+    credits: List[int],
+    remaining_credits: Optional[int] = None,
+    minimum_future_sgpa: float = 6.0,
+    realistic_future_sgpa: float = 8.0,
+    best_future_sgpa: float = 9.5,
+) -> SemesterSummary:
+    """Compute trend, consistency, extremes, CGPA and projections in a single pass.
+
+    None (or NaN) grades are skipped for the statistics and put the CGPA on hold,
+    matching ``compute_cgpa``. ``projection`` follows ``predict_final_cgpa_range``
+    and is None when ``remaining_credits`` is not given.
+    """
+    n = 0
+    mean_x = mean_y = 0.0
+    m2_x = m2_y = co_moment = 0.0
+    strongest_idx = weakest_idx = -1
+    strongest = weakest = 0.0
+    weighted_sum = 0.0
+    total_credits = cleared_credits = 0
+    blocked = out_of_range = False
+
+    for i, (grade, credit) in enumerate(zip(grades, credits)):
+        total_credits += credit
+        if credit < MIN_CREDITS or credit > MAX_CREDITS:
+            out_of_range = True
+        if grade is None or math.isnan(grade):
+            blocked = True
+            continue
+        if grade < MIN_GRADE or grade > MAX_GRADE:
+            out_of_range = True
+
+        # Welford-style running moments over (position, grade) for slope and variance.
+        n += 1
+        dx = n - mean_x
+        mean_x += dx / n
+        dy = grade - mean_y
+        mean_y += dy / n
+        m2_x += dx * (n - mean_x)
+        m2_y += dy * (grade - mean_y)
+        co_moment += dx * (grade - mean_y)
+
+        if strongest_idx < 0 or grade > strongest:
+            strongest_idx, strongest = i, grade
+        if weakest_idx < 0 or grade < weakest:
+            weakest_idx, weakest = i, grade
+        weighted_sum += grade * credit
+        cleared_credits += credit
+
+    slope = co_moment / m2_x if n >= 2 and m2_x else 0.0
+    if n >= 2:
+        std_dev = math.sqrt(m2_y / n)
+        consistency = max(0.0, min(100.0, 100.0 - (std_dev / 10.0) * 100.0))
+    else:
+        consistency = 100.0
+
+    cgpa: Optional[float] = None
+    if len(grades) != len(credits) or not grades:
+        status = "error"
+    elif blocked:
+        status = "blocked"
+    elif out_of_range or total_credits <= 0:
+        status = "error"
+    else:
+        status = "cleared"
+        cgpa = weighted_sum / total_credits
+
+    projection = None
+    if remaining_credits is not None and remaining_credits >= 0 and cgpa is not None and cleared_credits > 0:
+        final_credits = cleared_credits + remaining_credits
+        current_points = cgpa * cleared_credits
+        projection = {
+            "minimum": (current_points + minimum_future_sgpa * remaining_credits) / final_credits,
+            "realistic": (current_points + realistic_future_sgpa * remaining_credits) / final_credits,
+            "best": (current_points + best_future_sgpa * remaining_credits) / final_credits,
+        }
+
+    return SemesterSummary(
+        count=n,
+        mean_sgpa=mean_y,
+        slope=slope,
+        consistency=consistency,
+        strongest_semester=strongest_idx + 1,
+        strongest_sgpa=strongest,
+        weakest_semester=weakest_idx + 1,
+        weakest_sgpa=weakest,
+        cgpa=cgpa,
+        status=status,
+        cleared_credits=cleared_credits,
+        projection=projection,
+    )
+
 def update_cgpa_with_new_semester(old_cgpa: float, old_credits: int, new_sgpa: float, new_credits: int) -> Optional[float]:
     """Calculate the updated cumulative CGPA by adding a new semester."""
     total_credits = old_credits + new_credits
     if total_credits <= 0:
         return None
     return (old_cgpa * old_credits + new_sgpa * new_credits) / total_credits
+
+
+class CGPAAccumulator:
+    """Running CGPA that keeps exact integer totals.
+
+    Adding, retracting or replacing a semester is O(1) and never re-reads the
+    history, so backlog clearances and revaluations do not accumulate rounding drift.
+    """
+
+    __slots__ = ("_points", "_credits", "_semesters")
+    _PACKED = struct.Struct("<qIH")
+
+    def __init__(self, scaled_points: int = 0, total_credits: int = 0, semesters: int = 0):
+        if scaled_points < 0 or total_credits < 0 or semesters < 0:
+            raise ValueError("Accumulator totals cannot be negative.")
+        self._points = int(scaled_points)
+        self._credits = int(total_credits)
+        self._semesters = int(semesters)
+
+    @classmethod
+    def from_cgpa(cls, cgpa: float, total_credits: int, semesters: int = 0) -> "CGPAAccumulator":
+        """Seed an accumulator from a known CGPA and the credits it covers."""
+        if not (MIN_GRADE <= cgpa <= MAX_GRADE):
+            raise ValueError(f"CGPA must be between {MIN_GRADE} and {MAX_GRADE}.")
+        return cls(_scaled_points(cgpa) * int(total_credits), total_credits, semesters)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "CGPAAccumulator":
+        """Restore an accumulator serialized with ``to_bytes``."""
+        return cls(*cls._PACKED.unpack(payload))
+
+    def to_bytes(self) -> bytes:
+        """Serialize the totals into a fixed 14-byte record."""
+        return self._PACKED.pack(self._points, self._credits, self._semesters)
+
+    @staticmethod
+    def _validate(sgpa: float, credits: int) -> None:
+        if sgpa is None or not (MIN_GRADE <= sgpa <= MAX_GRADE):
+            raise ValueError(f"SGPA must be between {MIN_GRADE} and {MAX_GRADE}.")
+        if not (MIN_CREDITS <= credits <= MAX_CREDITS):
+            raise ValueError(f"Credits must be between {MIN_CREDITS} and {MAX_CREDITS}.")
+
+    def add(self, sgpa: float, credits: int) -> "CGPAAccumulator":
+        """Add a semester's SGPA and credits."""
+        self._validate(sgpa, credits)
+        self._points += _scaled_points(sgpa) * credits
+        self._credits += credits
+        self._semesters += 1
+        return self
+
+    def retract(self, sgpa: float, credits: int) -> "CGPAAccumulator":
+        """Remove a semester previously added with the same SGPA and credits."""
+        self._validate(sgpa, credits)
+        points = _scaled_points(sgpa) * credits
+        if self._semesters == 0 or credits > self._credits or points > self._points:
+            raise ValueError("Cannot retract a semester that was never added.")
+        self._points -= points
+        self._credits -= credits
+        self._semesters -= 1
+        return self
+
+    def replace(self, old_sgpa: float, old_credits: int, new_sgpa: float, new_credits: int) -> "CGPAAccumulator":
+        """Swap one semester's result for another, e.g. after a revaluation."""
+        self._validate(new_sgpa, new_credits)
+        self.retract(old_sgpa, old_credits)
+        return self.add(new_sgpa, new_credits)
+
+    @property
+    def cgpa(self) -> Optional[float]:
+        if self._credits <= 0:
+            return None
+        return self._points / (POINT_SCALE * self._credits)
+
+    @property
+    def total_points(self) -> float:
+        return self._points / POINT_SCALE
+
+    @property
+    def total_credits(self) -> int:
+        return self._credits
+
+    @property
+    def semesters(self) -> int:
+        return self._semesters
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CGPAAccumulator):
+            return NotImplemented
+        return (self._points, self._credits, self._semesters) == (other._points, other._credits, other._semesters)
+
+    def __repr__(self) -> str:
+        return f"CGPAAccumulator(cgpa={self.cgpa}, total_credits={self._credits}, semesters={self._semesters})"
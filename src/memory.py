@@ -0,0 +1,125 @@
+"""
+Per-session memory accounting: size session-state entries by category and keep a
+session under its byte budget by evicting regenerable entries.
+"""
+import io
+import sys
+from dataclasses import dataclass
+from typing import Any, MutableMapping, Optional
+
+from .logic import BreakdownTable
+from .state import CGPA_GRID_KEY, SGPA_GRID_KEY
+
+CATEGORIES = ("grids", "page_states", "uploads", "results", "frames", "blobs", "other")
+# Entries derived from a calculation and read back by other pages as a default.
+RESULT_KEYS = frozenset({"calculated_cgpa"})
+# Result tables and raw bytes in session state are caches of something the page can
+# rebuild from its inputs (results, charts, exports), so they may be dropped. Uploader
+# values may be too: the browser sends the widget state again on the next rerun and
+# Streamlit rebuilds the file from the copy it keeps for the session.
+REGENERABLE = frozenset({"uploads", "results", "frames", "blobs"})
+
+_LARGEST_REPORTED = 5
+
+
+def sizeof(obj: Any, _seen: Optional[set] = None) -> int:
+    """Approximate deep size of ``obj`` in bytes; objects reachable twice are counted once."""
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if type(obj).__name__ in ("DataFrame", "Series") and hasattr(obj, "memory_usage"):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, io.BytesIO):
+        # Seek rather than getbuffer(): a buffer still sharing the bytes it was built
+        # from (as uploads do) would copy them on getbuffer().
+        try:
+            position = obj.tell()
+            end = obj.seek(0, io.SEEK_END)
+            obj.seek(position)
+            return size + end
+        except ValueError:  # closed buffer
+            return size
+    if isinstance(obj, dict):
+        return size + sum(sizeof(k, seen) + sizeof(v, seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(sizeof(item, seen) for item in obj)
+    slots = [slot for cls in type(obj).__mro__ for slot in getattr(cls, "__slots__", ())]
+    size += sum(sizeof(getattr(obj, slot), seen) for slot in slots if hasattr(obj, slot))
+    if hasattr(obj, "__dict__"):
+        size += sizeof(vars(obj), seen)
+    return size
+
+
+def categorize(key: str, value: Any) -> str:
+    """Accounting category of one session-state entry."""
+    if key in (CGPA_GRID_KEY, SGPA_GRID_KEY):
+        return "grids"
+    if key == "page_states":
+        return "page_states"
+    if key in RESULT_KEYS:
+        return "results"
+    if isinstance(value, io.BytesIO) or (
+        isinstance(value, list) and value and all(isinstance(item, io.BytesIO) for item in value)
+    ):
+        return "uploads"
+    if isinstance(value, BreakdownTable) or type(value).__name__ in ("DataFrame", "Series"):
+        return "frames"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "blobs"
+    return "other"
+
+
+@dataclass(frozen=True, slots=True)
+class SessionMemory:
+    """One sizing pass over a session: ``entries`` are ``(key, bytes, category)``, largest first."""
+    total: int
+    categories: dict[str, int]
+    entries: tuple[tuple[str, int, str], ...]
+
+    def as_dict(self, budget: Optional[int] = None) -> dict:
+        """Totals for logs and the debug view."""
+        report = {"total": self.total, "categories": self.categories}
+        if budget is not None:
+            report["budget"] = budget
+        report["largest"] = [(key, size) for key, size, _ in self.entries[:_LARGEST_REPORTED]]
+        return report
+
+
+def measure_session(session: MutableMapping) -> SessionMemory:
+    """Size every session-state entry and total them by category."""
+    seen: set = set()
+    categories = dict.fromkeys(CATEGORIES, 0)
+    entries = []
+    for key in list(session.keys()):
+        value = session.get(key)
+        size = sizeof(value, seen)
+        category = categorize(str(key), value)
+        categories[category] += size
+        entries.append((str(key), size, category))
+    entries.sort(key=lambda entry: entry[1], reverse=True)
+    return SessionMemory(sum(categories.values()), categories, tuple(entries))
+
+
+def enforce_budget(session: MutableMapping, budget: int, memory: Optional[SessionMemory] = None) -> list[str]:
+    """Evict regenerable entries, largest first, until the session fits in ``budget`` bytes.
+
+    Returns the evicted keys. Grids, page states and other entries are user input
+    and are never evicted, so a session can stay over budget.
+    """
+    memory = memory or measure_session(session)
+    total = memory.total
+    evicted = []
+    for key, size, category in memory.entries:
+        if total <= budget:
+            break
+        if category in REGENERABLE and key in session:
+            del session[key]
+            total -= size
+            evicted.append(key)
+    return evicted
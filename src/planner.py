@@ -0,0 +1,159 @@
+"""
+Goal Planner solver: which subject grades reach a target CGPA.
+
+Achievable grade-point totals are tracked as bitsets (one Python int per
+subject prefix), so the search is a dynamic programme over point totals rather
+than a walk over every one of levels^n grade combinations.
+"""
+import math
+from typing import Iterator, List, Mapping, Optional, Sequence
+
+from .logic import GRADE_POINT_MAP
+
+_SCALES = (1, 10, 100)
+
+
+def _passing_levels(grade_map: Mapping[str, float]) -> tuple[List[str], List[float], int]:
+    """Return passing letters and points in ascending order, plus the integer scale."""
+    levels: dict[float, str] = {}
+    for letter, point in grade_map.items():
+        # F (0 points) leaves a backlog, so it never helps reach a target.
+        if point is not None and point > 0 and point not in levels:
+            levels[float(point)] = letter
+    points = sorted(levels)
+    scale = next(
+        (s for s in _SCALES if all(abs(p * s - round(p * s)) < 1e-9 for p in points)),
+        _SCALES[-1],
+    )
+    return [levels[p] for p in points], points, scale
+
+
+def _reach_bitsets(credits: Sequence[int], units: Sequence[Sequence[int]]) -> List[int]:
+    """reach[k] has bit t set when the first k subjects can total exactly t units."""
+    reach = [1]
+    for credit, subject_units in zip(credits, units):
+        previous = reach[-1]
+        current = 0
+        for u in subject_units:
+            current |= previous << (u * credit)
+        reach.append(current)
+    return reach
+
+
+def _combinations(total: int, credits: Sequence[int], units: Sequence[Sequence[int]], reach: List[int]) -> Iterator[List[int]]:
+    """Yield level indices per subject whose units sum exactly to ``total``."""
+    chosen = [0] * len(credits)
+
+    def walk(k: int, remaining: int) -> Iterator[List[int]]:
+        if k == 0:
+            yield list(chosen)
+            return
+        credit = credits[k - 1]
+        for level, u in enumerate(units[k - 1]):
+            rest = remaining - u * credit
+            if rest >= 0 and (reach[k - 1] >> rest) & 1:
+                chosen[k - 1] = level
+                yield from walk(k - 1, rest)
+
+    yield from walk(len(credits), total)
+
+
+def plan_grade_combinations(
+    subject_credits: Sequence[int],
+    required_points: float,
+    grade_map: Optional[Mapping[str, float]] = None,
+    limit: int = 10,
+    pareto: bool = True,
+) -> List[dict]:
+    """Find grade combinations over the given subjects that reach a points total.
+
+    Args:
+        subject_credits: Credits of each remaining subject (any number of semesters).
+        required_points: Minimum sum of grade point x credits across those subjects.
+        grade_map: Letter to grade-point map; defaults to ``GRADE_POINT_MAP``.
+        limit: Maximum number of plans to return.
+        pareto: If True, return Pareto-minimal plans: lowering any single subject by
+            one grade would miss the target. If False, return only plans with the
+            smallest achievable total.
+
+    Returns:
+        Plans ordered from least to most total effort, each
+        ``{"grades": [letter], "grade_points": [float], "total_points": float, "sgpa": float}``.
+        An empty list means the target cannot be reached.
+    """
+    letters, points, scale = _passing_levels(grade_map or GRADE_POINT_MAP)
+    credits = [int(c) for c in subject_credits]
+    if not letters or not credits or limit <= 0 or any(c < 0 for c in credits):
+        return []
+
+    level_units = [round(p * scale) for p in points]
+    needed = max(0, math.ceil(required_points * scale - 1e-9))
+    lowest_total = level_units[0] * sum(credits)
+    highest_total = level_units[-1] * sum(credits)
+    if needed > highest_total:
+        return []
+
+    steps = [b - a for a, b in zip(level_units, level_units[1:])]
+    max_drop = max(steps, default=0) * max(credits)
+    full_reach = _reach_bitsets(credits, [level_units] * len(credits))
+
+    plans: List[dict] = []
+    total = max(needed, lowest_total)
+    while total <= highest_total and len(plans) < limit:
+        slack = total - needed
+        if (full_reach[-1] >> total) & 1:
+            if pareto:
+                # A subject may sit above its lowest grade only if one step down costs more than the slack.
+                units = [
+                    [u for level, u in enumerate(level_units) if level == 0 or steps[level - 1] * c > slack]
+                    for c in credits
+                ]
+                reach = _reach_bitsets(credits, units)
+            else:
+                units, reach = [level_units if c else level_units[:1] for c in credits], full_reach
+            for chosen in _combinations(total, credits, units, reach):
+                unit_values = [units[i][level] for i, level in enumerate(chosen)]
+                plan_points = [u / scale for u in unit_values]
+                plans.append({
+                    "grades": [letters[level_units.index(u)] for u in unit_values],
+                    "grade_points": plan_points,
+                    "total_points": total / scale,
+                    "sgpa": total / scale / sum(credits) if sum(credits) else 0.0,
+                })
+                if len(plans) >= limit:
+                    break
+            if not pareto and plans:
+                break
+        if pareto and slack >= max_drop:
+            # Beyond this slack every plan above the all-lowest one can drop a grade.
+            break
+        total += 1
+    return plans
+
+
+def plan_for_target(
+    current_cgpa: float,
+    current_credits: int,
+    target_cgpa: float,
+    subject_credits: Sequence[int],
+    grade_map: Optional[Mapping[str, float]] = None,
+    limit: int = 10,
+    pareto: bool = True,
+) -> Optional[List[dict]]:
+    """Grade plans for the remaining subjects that lift CGPA to ``target_cgpa``.
+
+    Returns None for invalid inputs, otherwise the plans from
+    ``plan_grade_combinations`` with each plan's resulting ``final_cgpa`` added.
+    """
+    if current_credits < 0 or not (0.0 <= current_cgpa <= 10.0 and 0.0 <= target_cgpa <= 10.0):
+        return None
+    remaining = sum(subject_credits)
+    total_credits = current_credits + remaining
+    if remaining <= 0 or total_credits <= 0:
+        return None
+
+    required_points = target_cgpa * total_credits - current_cgpa * current_credits
+    plans = plan_grade_combinations(subject_credits, required_points, grade_map, limit, pareto)
+    for plan in plans:
+        plan["final_cgpa"] = (current_cgpa * current_credits + plan["total_points"]) / total_credits
+    return plans
@@ -0,0 +1,140 @@
+"""
+Monte Carlo projection of final CGPA from a student's own SGPA history.
+"""
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .logic import MAX_GRADE, MIN_GRADE, summarize_semesters
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+# Floor on the per-semester spread so short or perfectly flat histories still get a band.
+MIN_SGPA_STD = 0.25
+# What-if grid resolution: every future SGPA from 0.00 to 10.00 in 0.01 steps.
+GRID_STEPS_PER_POINT = 100
+GRID_SGPA = np.arange(int(MAX_GRADE * GRID_STEPS_PER_POINT) + 1) / GRID_STEPS_PER_POINT
+GRID_SGPA.setflags(write=False)
+
+
+@dataclass(frozen=True, eq=False)
+class ProjectionGrid:
+    """Final CGPA for every future SGPA on the 0.01 grid, one row per remaining-credit option."""
+    current_points: float
+    current_credits: int
+    remaining_credits: np.ndarray
+    final_cgpa: np.ndarray
+
+    def row(self, remaining_credits: int) -> np.ndarray:
+        """Read-only final CGPA curve over ``GRID_SGPA`` for one remaining-credit option."""
+        return self.final_cgpa[self._row_index(remaining_credits)]
+
+    def lookup(self, future_sgpa: float, remaining_credits: int) -> float:
+        """Final CGPA if the student averages ``future_sgpa`` over ``remaining_credits``."""
+        column = min(max(int(round(future_sgpa * GRID_STEPS_PER_POINT)), 0), len(GRID_SGPA) - 1)
+        return float(self.final_cgpa[self._row_index(remaining_credits), column])
+
+    def _row_index(self, remaining_credits: int) -> int:
+        index = int(np.searchsorted(self.remaining_credits, remaining_credits))
+        if index == len(self.remaining_credits) or self.remaining_credits[index] != remaining_credits:
+            raise ValueError(f"remaining_credits={remaining_credits} is not one of the grid options {self.remaining_credits.tolist()}.")
+        return index
+
+
+@lru_cache(maxsize=256)
+def _cached_grid(current_points: float, current_credits: int, remaining_options: tuple[int, ...]) -> ProjectionGrid:
+    remaining = np.array(remaining_options, dtype=np.float64)
+    # Same expression as predict_final_cgpa_range, broadcast over credits x SGPA.
+    final_cgpa = (current_points + GRID_SGPA[None, :] * remaining[:, None]) / (current_credits + remaining[:, None])
+    remaining_ints = np.array(remaining_options, dtype=np.int64)
+    for array in (remaining_ints, final_cgpa):
+        array.setflags(write=False)
+    return ProjectionGrid(current_points, current_credits, remaining_ints, final_cgpa)
+
+
+def projection_grid(current_points: float, current_credits: int, remaining_credit_options: Sequence[int]) -> ProjectionGrid:
+    """Precompute the what-if response surface for one student.
+
+    Grids are cached per (current points, current credits, options), so repeated
+    slider moves and reruns only index into an existing read-only table.
+
+    Raises:
+        ValueError: If current credits are not positive or any option is negative.
+    """
+    options = tuple(sorted({int(c) for c in remaining_credit_options}))
+    if current_credits <= 0 or not options or options[0] < 0:
+        raise ValueError("current_credits must be positive and remaining credit options non-negative.")
+    return _cached_grid(float(current_points), int(current_credits), options)
+
+
+def _trend_model(grades: List[float]) -> tuple[float, float, float]:
+    """Return (intercept at the mean position, slope, residual std) of the SGPA history."""
+    y = np.asarray(grades, dtype=np.float64)
+    x = np.arange(1, len(y) + 1, dtype=np.float64)
+    x_mean, y_mean = x.mean(), y.mean()
+    if len(y) < 2:
+        return y_mean, 0.0, MIN_SGPA_STD
+    slope = float(((x - x_mean) * (y - y_mean)).sum() / ((x - x_mean) ** 2).sum())
+    residuals = y - (y_mean + slope * (x - x_mean))
+    return y_mean, slope, max(MIN_SGPA_STD, float(residuals.std()))
+
+
+def simulate_final_cgpa(
+    current_grades: List[Optional[float]],
+    current_credits: List[int],
+    future_credits: Sequence[int],
+    target_cgpa: Optional[float] = None,
+    n_paths: int = 5000,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    seed: Optional[int] = None,
+) -> Optional[dict]:
+    """Simulate final CGPA over the remaining semesters.
+
+    Each path draws one SGPA per future semester from a normal distribution centred
+    on the student's linear trend, with the spread of their residuals around it,
+    clamped to the 0-10 scale.
+
+    Args:
+        current_grades: SGPAs so far; any None puts the projection on hold.
+        current_credits: Credits for those semesters.
+        future_credits: Credits of each remaining semester, in order.
+        target_cgpa: If given, also return the share of paths that reach it.
+        n_paths: Number of simulated futures.
+        percentiles: Percentiles of the final CGPA to report.
+        seed: Seed for reproducible runs.
+
+    Returns:
+        ``{"percentiles": {p: cgpa}, "mean": float, "target_probability": float | None,
+        "paths": int}``, or None if the current CGPA cannot be computed.
+    """
+    summary = summarize_semesters(current_grades, current_credits)
+    if summary.cgpa is None or summary.cleared_credits <= 0 or n_paths <= 0:
+        return None
+
+    future = np.asarray(future_credits, dtype=np.float64)
+    current_points = summary.cgpa * summary.cleared_credits
+    final_credits = summary.cleared_credits + future.sum()
+    if len(future) == 0 or final_credits <= 0:
+        draws = np.full(n_paths, summary.cgpa)
+    else:
+        y_mean, slope, spread = _trend_model([g for g in current_grades if g is not None])
+        n_done = summary.count
+        future_positions = np.arange(n_done + 1, n_done + len(future) + 1, dtype=np.float64)
+        means = y_mean + slope * (future_positions - (n_done + 1) / 2.0)
+
+        rng = np.random.default_rng(seed)
+        sgpas = np.clip(rng.normal(means, spread, size=(n_paths, len(future))), MIN_GRADE, MAX_GRADE)
+        draws = (current_points + sgpas @ future) / final_credits
+
+    bands = np.percentile(draws, percentiles)
+    probability = None
+    if target_cgpa is not None and math.isfinite(target_cgpa):
+        probability = float((draws >= target_cgpa).mean())
+    return {
+        "percentiles": {p: float(v) for p, v in zip(percentiles, bands)},
+        "mean": float(draws.mean()),
+        "target_probability": probability,
+        "paths": int(n_paths),
+    }
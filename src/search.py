@@ -0,0 +1,162 @@
+"""
+Fuzzy search over curriculum semesters and subject names for Quick Fill.
+
+Entries are indexed two ways: a trigram posting list per padded trigram, which
+tolerates typos and partial words, and a sorted token list for prefix matches
+("comp sem 3", "data str"). A query scores each candidate by the share of its
+words that prefix a word of the entry plus the trigram Jaccard similarity, so
+only entries sharing a trigram or a prefix with the query are ever scored.
+"""
+import heapq
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .curriculum import CurriculumIndex
+
+KINDS = ("semester", "subject")
+# Candidates that only share trigrams need at least this similarity to be listed.
+MIN_SIMILARITY = 0.2
+_PREFIX_WEIGHT = 2.0
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+def normalize(text: str) -> str:
+    """Casefolded words separated by single spaces; punctuation is dropped."""
+    return _NON_WORD.sub(" ", text.casefold()).strip()
+
+
+def trigrams(text: str) -> set[str]:
+    """Trigrams of each word, padded so word starts weigh more than middles."""
+    grams: set[str] = set()
+    for word in normalize(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+@dataclass(frozen=True, slots=True)
+class SearchEntry:
+    """A loadable Quick Fill target: a whole semester of a template, or one subject of it."""
+    kind: str
+    text: str
+    template: str
+    semester: str
+    credits: int
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    entry: SearchEntry
+    score: float
+
+
+class SearchIndex:
+    """Trigram and prefix index over ``SearchEntry`` texts; built once, then read-only."""
+    __slots__ = ("entries", "_postings", "_gram_counts", "_tokens", "_token_ids")
+
+    def __init__(self, entries: Iterable[SearchEntry]):
+        self.entries = tuple(entries)
+        postings: dict[str, list[int]] = {}
+        tokens: list[tuple[str, int]] = []
+        self._gram_counts = array("H")
+        for entry_id, entry in enumerate(self.entries):
+            grams = trigrams(entry.text)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(entry_id)
+            tokens.extend((word, entry_id) for word in set(normalize(entry.text).split()))
+        self._postings = {gram: array("I", ids) for gram, ids in postings.items()}
+        tokens.sort()
+        self._tokens = [word for word, _ in tokens]
+        self._token_ids = array("I", (entry_id for _, entry_id in tokens))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory of the entries, trigram postings and token lists."""
+        size = sys.getsizeof(self.entries) + sum(sys.getsizeof(e) + sys.getsizeof(e.text) for e in self.entries)
+        size += sys.getsizeof(self._postings) + sum(
+            sys.getsizeof(gram) + sys.getsizeof(ids) for gram, ids in self._postings.items()
+        )
+        size += sys.getsizeof(self._tokens) + sum(map(sys.getsizeof, self._tokens))
+        return size + sys.getsizeof(self._token_ids) + sys.getsizeof(self._gram_counts)
+
+    def _prefixed(self, word: str) -> set[int]:
+        """Entries with a word starting with ``word``."""
+        ids = set()
+        i = bisect_left(self._tokens, word)
+        while i < len(self._tokens) and self._tokens[i].startswith(word):
+            ids.add(self._token_ids[i])
+            i += 1
+        return ids
+
+    def search(self, query: str, limit: int = 8, kind: Optional[str] = None) -> list[SearchHit]:
+        """Best ``limit`` entries for ``query``, highest score first; ties go to the shorter text."""
+        words = normalize(query).split()
+        if not words:
+            return []
+        query_grams = trigrams(query)
+        shared: dict[int, int] = {}
+        for gram in query_grams:
+            for entry_id in self._postings.get(gram, ()):
+                shared[entry_id] = shared.get(entry_id, 0) + 1
+        prefixed: dict[int, int] = {}
+        for word in set(words):
+            for entry_id in self._prefixed(word):
+                prefixed[entry_id] = prefixed.get(entry_id, 0) + 1
+
+        scored = []
+        for entry_id in shared.keys() | prefixed.keys():
+            entry = self.entries[entry_id]
+            if kind is not None and entry.kind != kind:
+                continue
+            common = shared.get(entry_id, 0)
+            similarity = common / (len(query_grams) + self._gram_counts[entry_id] - common)
+            prefix_share = prefixed.get(entry_id, 0) / len(set(words))
+            if prefix_share == 0 and similarity < MIN_SIMILARITY:
+                continue
+            scored.append((_PREFIX_WEIGHT * prefix_share + similarity, -len(entry.text), -entry_id))
+        best = heapq.nlargest(limit, scored)
+        return [SearchHit(self.entries[-entry_id], score) for score, _, entry_id in best]
+
+
+def curriculum_entries(index: "CurriculumIndex", scheme: str) -> list[SearchEntry]:
+    """One entry per semester of each of the scheme's templates and one per distinct subject.
+
+    A subject offered in several templates (e.g. a shared maths paper) is listed
+    once, under the first template and semester that has it.
+    """
+    entries = []
+    seen_subjects = set()
+    for template in index.templates(scheme):
+        for label in index.semesters(template):
+            semester = index.semester(template, label)
+            if semester is None:
+                continue
+            entries.append(SearchEntry("semester", f"{template} {label}", template, label, semester.credits))
+            for subject in semester.subjects:
+                key = (normalize(subject["name"]), subject["credits"])
+                if key not in seen_subjects:
+                    seen_subjects.add(key)
+                    entries.append(SearchEntry("subject", subject["name"], template, label, subject["credits"]))
+    return entries
+
+
+def build_search_index(index: "CurriculumIndex", scheme: str) -> SearchIndex:
+    return SearchIndex(curriculum_entries(index, scheme))
+
+
+def describe(entry: SearchEntry) -> str:
+    """One-line label for a hit in the Quick Fill results."""
+    credits = f"{entry.credits} credit{'' if entry.credits == 1 else 's'}"
+    if entry.kind == "semester":
+        return f"{entry.template} · {entry.semester} ({credits})"
+    return f"{entry.text} · {credits} · {entry.template.rsplit(' - ', 1)[0]}, {entry.semester}"
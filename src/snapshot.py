@@ -0,0 +1,226 @@
+"""
+Compiled curriculum tables and their binary snapshot.
+
+``compile_tables`` flattens curriculum JSON into one interned string table and
+typed columns. A snapshot stores those tables in a single file that is
+memory-mapped on load: the columns are zero-copy views into the mapping, so a
+process start decodes one string blob instead of parsing the JSON.
+
+Each snapshot records the SHA-256, mtime and size of its source. ``load_tables``
+trusts a snapshot whose mtime and size match, re-checks the hash otherwise, and
+recompiles from the JSON when the content changed. It rewrites the snapshot only
+when asked to; snapshots are normally built by ``scripts/build_curriculum_snapshot.py``.
+"""
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from typing import Any, Literal, Mapping, Optional, Sequence
+
+SNAPSHOT_MAGIC = b"CGPC"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snapshot"
+
+# Column name and array typecode, in file order after the string table. Rows of the
+# template columns point into the semester columns, which point into the subject columns.
+COLUMNS: tuple[tuple[str, Literal["I", "H", "B"]], ...] = (
+    ("template_name", "I"),
+    ("template_first", "I"),
+    ("template_count", "H"),
+    ("semester_label", "I"),
+    ("semester_number", "H"),
+    ("semester_credits", "H"),
+    ("semester_first", "I"),
+    ("semester_count", "H"),
+    ("subject_name", "I"),
+    ("subject_credits", "B"),
+)
+
+# magic, version, byte order of the columns (0 little, 1 big), source SHA-256, mtime_ns and size
+_HEADER = struct.Struct("<4sHBx32sqq")
+# byte offset and length of the string table, then of each column
+_SECTION = struct.Struct("<QQ")
+_ALIGN = 8
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+_STRING_SEPARATOR = "\0"
+
+_SEMESTER_NUMBER = re.compile(r"(\d+)")
+
+
+def semester_number(label: str) -> int:
+    """Number in a semester label such as ``"Semester 3"``; 0 if it has none."""
+    match = _SEMESTER_NUMBER.search(label)
+    return int(match.group(1)) if match else 0
+
+
+def snapshot_path(source: str) -> str:
+    """Where the snapshot of a curriculum source file lives (next to it)."""
+    return os.path.splitext(source)[0] + SNAPSHOT_SUFFIX
+
+
+class CurriculumTables:
+    """Interned strings plus typed columns describing templates, semesters and subjects.
+
+    Columns are ``array`` objects when compiled and ``memoryview`` casts into the
+    mapped file when read from a snapshot; both index to plain ints.
+    """
+    __slots__ = ("strings", "_buffer") + tuple(name for name, _ in COLUMNS)
+
+    strings: Sequence[str]
+    template_name: Sequence[int]
+    template_first: Sequence[int]
+    template_count: Sequence[int]
+    semester_label: Sequence[int]
+    semester_number: Sequence[int]
+    semester_credits: Sequence[int]
+    semester_first: Sequence[int]
+    semester_count: Sequence[int]
+    subject_name: Sequence[int]
+    subject_credits: Sequence[int]
+
+    def __init__(self, strings: Sequence[str], columns: Mapping[str, Sequence[int]], buffer: Optional[Any] = None):
+        self.strings = strings
+        for name, _ in COLUMNS:
+            setattr(self, name, columns[name])
+        self._buffer = buffer  # keeps the mapped file open as long as its views are in use
+
+    def __len__(self) -> int:
+        return len(self.template_name)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory of the decoded strings plus the columns."""
+        return sum(map(sys.getsizeof, self.strings)) + sum(memoryview(getattr(self, name)).nbytes for name, _ in COLUMNS)
+
+
+def compile_tables(data: Mapping[str, Mapping[str, Sequence[dict]]]) -> CurriculumTables:
+    """Flatten curriculum JSON; semesters of each template are stored in number order."""
+    strings: list[str] = []
+    ids: dict[str, int] = {}
+
+    def string_id(text: str) -> int:
+        if text not in ids:
+            if _STRING_SEPARATOR in text:
+                raise ValueError(f"Curriculum text cannot contain NUL characters: {text!r}")
+            ids[text] = len(strings)
+            strings.append(sys.intern(text))
+        return ids[text]
+
+    columns = {name: array(typecode) for name, typecode in COLUMNS}
+    for template, semesters in data.items():
+        rows = sorted(semesters.items(), key=lambda item: semester_number(item[0]))
+        columns["template_name"].append(string_id(template))
+        columns["template_first"].append(len(columns["semester_label"]))
+        columns["template_count"].append(len(rows))
+        for label, subjects in rows:
+            columns["semester_label"].append(string_id(label))
+            columns["semester_number"].append(semester_number(label))
+            columns["semester_credits"].append(sum(int(subject["credits"]) for subject in subjects))
+            columns["semester_first"].append(len(columns["subject_name"]))
+            columns["semester_count"].append(len(subjects))
+            for subject in subjects:
+                columns["subject_name"].append(string_id(str(subject["name"])))
+                columns["subject_credits"].append(int(subject["credits"]))
+    return CurriculumTables(strings, columns)
+
+
+def write_snapshot(tables: CurriculumTables, path: str, source_hash: bytes, source_mtime_ns: int = 0, source_size: int = 0) -> int:
+    """Write ``tables`` to ``path`` atomically; returns the snapshot size in bytes."""
+    sections = [_STRING_SEPARATOR.join(tables.strings).encode("utf-8")]
+    sections += [array(typecode, getattr(tables, name)).tobytes() for name, typecode in COLUMNS]
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    directory, body = [], bytearray()
+    for section in sections:
+        padding = -(offset + len(body)) % _ALIGN
+        body += bytes(padding)
+        directory.append(_SECTION.pack(offset + len(body), len(section)))
+        body += section
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, _BYTE_ORDER, source_hash, source_mtime_ns, source_size)
+    payload = header + b"".join(directory) + bytes(body)
+
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(payload)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    return len(payload)
+
+
+def read_snapshot(path: str) -> tuple[CurriculumTables, bytes, int, int]:
+    """Map a snapshot; returns the tables and the source SHA-256, mtime_ns and size it was built from.
+
+    Raises ValueError for a file that is not a snapshot of this version and byte order;
+    the mapping is closed before it propagates.
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(buffer)
+    try:
+        try:
+            magic, version, byte_order, source_hash, mtime_ns, size = _HEADER.unpack_from(view)
+            if (magic, version, byte_order) != (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, _BYTE_ORDER):
+                raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} curriculum snapshot for this platform.")
+            sections = [
+                _SECTION.unpack_from(view, _HEADER.size + i * _SECTION.size) for i in range(len(COLUMNS) + 1)
+            ]
+            if any(start + length > len(view) for start, length in sections):
+                raise ValueError(f"{path} is truncated.")
+            # Checked up front so that no column view exists yet when a cast would fail.
+            if any(length % array(typecode).itemsize for (_, typecode), (_, length) in zip(COLUMNS, sections[1:])):
+                raise ValueError(f"{path} has a column of partial rows.")
+            start, length = sections[0]
+            strings = list(map(sys.intern, str(view[start:start + length], "utf-8").split(_STRING_SEPARATOR)))
+        except (struct.error, UnicodeDecodeError) as exc:
+            raise ValueError(f"{path} is not a readable curriculum snapshot: {exc}") from exc
+    except ValueError:
+        view.release()
+        buffer.close()
+        raise
+    columns = {
+        name: view[start:start + length].cast(typecode)
+        for (name, typecode), (start, length) in zip(COLUMNS, sections[1:])
+    }
+    return CurriculumTables(strings, columns, buffer), source_hash, mtime_ns, size
+
+
+def load_tables(source: str, snapshot: Optional[str] = None, write: bool = False) -> CurriculumTables:
+    """Tables for a curriculum JSON file, from its snapshot when that is current.
+
+    A stale, missing or unreadable snapshot is compiled from ``source`` instead, and
+    rewritten only with ``write``; if it cannot be written (read-only deploy), the
+    compiled tables are still returned. Without ``source``, an existing snapshot is
+    used as shipped.
+    """
+    snapshot = snapshot or snapshot_path(source)
+    try:
+        tables, snapshot_hash, mtime_ns, size = read_snapshot(snapshot)
+    except (OSError, ValueError):
+        tables, snapshot_hash, mtime_ns, size = None, b"", 0, 0
+    try:
+        stat = os.stat(source)
+    except FileNotFoundError:
+        return tables if tables is not None else compile_tables({})
+    if tables is not None and (mtime_ns, size) == (stat.st_mtime_ns, stat.st_size):
+        return tables
+
+    with open(source, "rb") as f:
+        raw = f.read()
+    source_hash = hashlib.sha256(raw).digest()
+    if tables is None or snapshot_hash != source_hash:
+        tables = compile_tables(json.loads(raw))
+    if not write:
+        return tables
+    # Same content under a new mtime (fresh checkout, copied file) is re-stamped so the
+    # next start takes the mtime fast path.
+    try:
+        write_snapshot(tables, snapshot, source_hash, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        pass
+    return tables
@@ -0,0 +1,163 @@
+"""
+Compact input models for the calculator grids: one session-state key per calculator.
+
+Widgets keep their own keys while they are on screen (Streamlit needs them), but
+the grid is the source of truth: widgets read their initial value from it and
+write their value back after every run. Anything that fills the grid in code
+(demo data, templates, reset, restore) updates the grid and then calls
+``forget_widgets`` so the widgets re-read it.
+"""
+from array import array
+from typing import Iterable, MutableMapping, Optional, Sequence
+
+MAX_SEMESTERS = 12
+MAX_SUBJECTS = 15
+
+CGPA_GRID_KEY = "cgpa_grid"
+SGPA_GRID_KEY = "sgpa_grid"
+
+# Widget key prefixes bound to each grid; the widget for row i is f"{prefix}_{i}".
+SEMESTER_WIDGETS = ("credit", "sgpa", "backlog")
+SUBJECT_WIDGETS = ("subject_name", "subject_credit", "subject_grade")
+
+DEFAULT_SUBJECT_CREDITS = 3
+
+
+def _byte(value) -> int:
+    """Clamp a credit count into an ``array('B')`` cell."""
+    return min(max(int(value), 0), 255)
+
+
+def _fill(target, values: Iterable, cast) -> None:
+    for i, value in zip(range(len(target)), values):
+        target[i] = cast(value)
+
+
+class SemesterGrid:
+    """Credits, SGPAs and backlog flags for up to ``MAX_SEMESTERS`` semesters.
+
+    ``credits`` is an ``array('B')``, ``sgpa`` an ``array('d')`` and ``backlog`` a
+    ``bytearray`` of 0/1 flags, all of fixed length. A backlog semester keeps its
+    last SGPA so unticking the box restores it.
+    """
+
+    __slots__ = ("credits", "sgpa", "backlog")
+
+    def __init__(self, credits: Iterable[int] = (), grades: Iterable[Optional[float]] = ()):
+        self.credits = array("B", bytes(MAX_SEMESTERS))
+        self.sgpa = array("d", [0.0]) * MAX_SEMESTERS
+        self.backlog = bytearray(MAX_SEMESTERS)
+        self.set_credits(credits)
+        self.set_grades(grades)
+
+    def set_credits(self, credits: Iterable[int]) -> None:
+        _fill(self.credits, credits, _byte)
+
+    def set_grades(self, grades: Iterable[Optional[float]]) -> None:
+        """Store SGPAs from the start of the grid; None marks a backlog semester."""
+        for i, grade in zip(range(MAX_SEMESTERS), grades):
+            self.backlog[i] = grade is None
+            if grade is not None:
+                self.sgpa[i] = float(grade)
+
+    def credit_list(self, count: int) -> list[int]:
+        return self.credits[:count].tolist()
+
+    def grades(self, count: int) -> list[Optional[float]]:
+        """SGPAs of the first ``count`` semesters, with None for backlogs."""
+        return [None if flag else grade for grade, flag in zip(self.sgpa[:count], self.backlog)]
+
+    def __repr__(self) -> str:
+        return f"SemesterGrid(credits={self.credits.tolist()!r}, grades={self.grades(MAX_SEMESTERS)!r})"
+
+
+class SubjectGrid:
+    """Names, credits, grade letters and template flags for up to ``MAX_SUBJECTS`` subjects.
+
+    ``credits`` is an ``array('B')`` and ``template`` a ``bytearray`` of 0/1 flags;
+    names and letters are short strings kept in fixed-length lists.
+    """
+
+    __slots__ = ("names", "credits", "grades", "template")
+
+    def __init__(
+        self,
+        names: Sequence[str] = (),
+        credits: Iterable[int] = (),
+        grades: Iterable[str] = (),
+        default_grade: str = "A",
+    ):
+        self.names = [str(names[i]) if i < len(names) else f"Subject {i + 1}" for i in range(MAX_SUBJECTS)]
+        self.credits = array("B", [DEFAULT_SUBJECT_CREDITS]) * MAX_SUBJECTS
+        self.grades = [default_grade] * MAX_SUBJECTS
+        self.template = bytearray(MAX_SUBJECTS)
+        _fill(self.credits, credits, _byte)
+        _fill(self.grades, grades, str)
+
+    def load(self, subjects: Sequence[dict], grade: str) -> None:
+        """Fill the first rows from curriculum ``{name, credits}`` entries and lock them as a template."""
+        for i, subject in enumerate(subjects[:MAX_SUBJECTS]):
+            self.names[i] = subject["name"]
+            self.credits[i] = _byte(subject["credits"])
+            self.grades[i] = grade
+            self.template[i] = 1
+
+    def add(self, subject: dict, grade: str, count: int) -> Optional[int]:
+        """Put one curriculum ``{name, credits}`` entry in the first still-unnamed row of the
+        ``count`` shown, else in the row after them, and lock it like a template row.
+
+        Returns the row used, or None when all ``MAX_SUBJECTS`` rows are taken.
+        """
+        shown = min(count, MAX_SUBJECTS)
+        row = next(
+            (i for i in range(shown) if not self.template[i] and self.names[i] == f"Subject {i + 1}"),
+            shown,
+        )
+        if row >= MAX_SUBJECTS:
+            return None
+        self.names[row] = subject["name"]
+        self.credits[row] = _byte(subject["credits"])
+        self.grades[row] = grade
+        self.template[row] = 1
+        return row
+
+    @property
+    def is_template(self) -> bool:
+        return any(self.template)
+
+    def __repr__(self) -> str:
+        return f"SubjectGrid(names={self.names!r}, credits={self.credits.tolist()!r}, grades={self.grades!r})"
+
+
+def forget_widgets(session: MutableMapping, prefixes: Sequence[str], count: int) -> None:
+    """Drop the widget keys for rows ``0..count-1`` so the widgets re-read the grid next run."""
+    for i in range(count):
+        for prefix in prefixes:
+            session.pop(f"{prefix}_{i}", None)
+
+
+def semester_grid(
+    session: MutableMapping, initial_state: Optional[dict] = None, default_credits: Sequence[int] = ()
+) -> SemesterGrid:
+    """The session's CGPA grid, created on first use from a saved page state or the defaults."""
+    grid = session.get(CGPA_GRID_KEY)
+    if grid is None:
+        initial_state = initial_state or {}
+        credits = list(initial_state.get("credits", []))
+        credits += list(default_credits[len(credits):MAX_SEMESTERS])
+        grid = session[CGPA_GRID_KEY] = SemesterGrid(credits, initial_state.get("grades", []))
+    return grid
+
+
+def subject_grid(session: MutableMapping, initial_state: Optional[dict] = None, default_grade: str = "A") -> SubjectGrid:
+    """The session's SGPA grid, created on first use from a saved page state or the defaults."""
+    grid = session.get(SGPA_GRID_KEY)
+    if grid is None:
+        initial_state = initial_state or {}
+        grid = session[SGPA_GRID_KEY] = SubjectGrid(
+            initial_state.get("subjects", []),
+            initial_state.get("credits", []),
+            initial_state.get("grades", []),
+            default_grade,
+        )
+    return grid
@@ -0,0 +1,133 @@
+"""
+Process warm-up: pay the one-time costs behind a first request (on-demand imports,
+curriculum load, stylesheet build, card fonts, PDF engine, first chart-to-image call)
+once per process instead of on whichever page first needs them.
+"""
+import time
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional, Sequence
+
+_SAMPLE_RECORDS = [{"Semester": 1, "Credits": 20, "SGPA": 8.0}]
+
+
+def _imports() -> None:
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    import plotly.express  # noqa: F401
+    import plotly.graph_objects  # noqa: F401
+
+    from . import export, projection  # noqa: F401
+
+
+def _curriculum() -> None:
+    from .curriculum import curriculum_catalog
+
+    # Only the sidebar's default scheme; other shards stay unloaded until a session uses them.
+    catalog = curriculum_catalog()
+    catalog.credits("rc1920")
+    catalog.search_index("rc1920")
+
+
+def _styles() -> None:
+    from .config import get_theme
+    from .layout import compiled_stylesheet
+
+    for dark_mode in (False, True):
+        compiled_stylesheet(get_theme(dark_mode))
+
+
+def _fonts() -> None:
+    from .export import card_fonts, generate_shareable_card
+
+    card_fonts()
+    generate_shareable_card(8.0, 75.0, "First Class")
+
+
+def _pdf() -> None:
+    from .export import generate_pdf_report
+
+    generate_pdf_report(8.0, 75.0, "First Class", _SAMPLE_RECORDS)
+
+
+def _charts() -> None:
+    import plotly.express as px
+
+    px.line(x=[1, 2], y=[8.0, 8.5]).to_image(format="png", width=200, height=100)
+
+
+# Run in this order; each step is idempotent and leaves its result in a process-wide cache.
+STEPS: dict[str, Callable[[], None]] = {
+    "imports": _imports,
+    "curriculum": _curriculum,
+    "styles": _styles,
+    "fonts": _fonts,
+    "pdf": _pdf,
+    "charts": _charts,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class StepTiming:
+    """Wall time of one warm-up step; ``error`` is set when the step raised."""
+    name: str
+    ms: float
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class WarmupReport:
+    """Per-step timings of one warm-up pass, in run order."""
+    steps: tuple[StepTiming, ...]
+
+    @property
+    def total_ms(self) -> float:
+        return sum(step.ms for step in self.steps)
+
+    @property
+    def failed(self) -> list[str]:
+        return [step.name for step in self.steps if step.error]
+
+    def as_dict(self) -> dict:
+        """Timings for logs and the debug view."""
+        return {
+            "total_ms": round(self.total_ms, 1),
+            "steps": {step.name: round(step.ms, 1) for step in self.steps},
+            "errors": {step.name: step.error for step in self.steps if step.error},
+        }
+
+
+def parse_steps(spec: str) -> list[str]:
+    """Step names from a comma-separated ``WARMUP_STEPS`` value.
+
+    ``"all"`` selects every step and ``""`` or ``"none"`` disables warm-up; the
+    result keeps :data:`STEPS` order.
+    """
+    names = {name.strip().lower() for name in spec.split(",") if name.strip()}
+    if not names or names == {"none"}:
+        return []
+    if names == {"all"}:
+        return list(STEPS)
+    unknown = sorted(names - STEPS.keys())
+    if unknown:
+        raise ValueError(f"Unknown warm-up steps {unknown}; choose from {list(STEPS)}, 'all' or 'none'.")
+    return [name for name in STEPS if name in names]
+
+
+def run_warmup(steps: Sequence[str] = tuple(STEPS), registry: Optional[Mapping[str, Callable[[], None]]] = None) -> WarmupReport:
+    """Run ``steps`` in order and time each one.
+
+    A failing step (for instance chart export without Kaleido) is recorded in the
+    report and does not stop the steps after it.
+    """
+    registry = STEPS if registry is None else registry
+    timings = []
+    for name in steps:
+        error = None
+        start = time.perf_counter()
+        try:
+            registry[name]()
+        except Exception as exc:
+            detail = next((line.strip() for line in str(exc).splitlines() if line.strip()), "")
+            error = f"{type(exc).__name__}: {detail}" if detail else type(exc).__name__
+        timings.append(StepTiming(name, (time.perf_counter() - start) * 1000, error))
+    return WarmupReport(tuple(timings))
@@ -0,0 +1,219 @@
+"""
+Parity tests for the vectorized cohort engines in src.batch.
+Every batch result must match the scalar function applied row by row.
+"""
+import random
+import unittest
+
+import numpy as np
+
+from src.batch import (
+    classify_cgpa_batch,
+    compute_cgpa_batch,
+    compute_sgpa_batch,
+    convert_gpa_batch,
+    gpa_to_percentage_batch,
+    summarize_semesters_batch,
+)
+from src.logic import PERCENTAGE_FORMULAS, classify_cgpa, compute_cgpa, compute_sgpa, gpa_to_percentage, gpa_to_us_gpa, summarize_semesters
+
+
+def _scalar_rows(grades, credits, blocked, method="weighted", engine="float"):
+    results = []
+    for g_row, c_row, b_row in zip(grades, credits, blocked):
+        row = [None if b else float(g) for g, b in zip(g_row, b_row)]
+        results.append(compute_cgpa(row, [float(c) for c in c_row], method=method, engine=engine))
+    return results
+
+
+class TestCGPABatch(unittest.TestCase):
+    """Test suite for compute_cgpa_batch."""
+
+    def setUp(self):
+        rng = random.Random(42)
+        self.grades = [[round(rng.uniform(0, 10), 2) for _ in range(10)] for _ in range(200)]
+        self.credits = [[rng.randint(0, 30) for _ in range(10)] for _ in range(200)]
+        self.blocked = [[rng.random() < 0.03 for _ in range(10)] for _ in range(200)]
+        # Sprinkle in out-of-range rows so every status code is exercised.
+        self.grades[5][3] = 10.5
+        self.credits[7][1] = 36
+        self.credits[9] = [0] * 10
+        self.blocked[9] = [False] * 10
+
+    def _assert_parity(self, method, engine="float"):
+        batch = compute_cgpa_batch(self.grades, self.credits, np.array(self.blocked), method=method, engine=engine)
+        scalar = _scalar_rows(self.grades, self.credits, self.blocked, method=method, engine=engine)
+        for i, expected in enumerate(scalar):
+            with self.subTest(student=i):
+                self.assertEqual(batch["status"][i], expected["status"])
+                if expected["cgpa"] is None:
+                    self.assertTrue(np.isnan(batch["cgpa"][i]))
+                else:
+                    self.assertEqual(batch["cgpa"][i], expected["cgpa"])
+
+    def test_weighted_matches_scalar_exactly(self):
+        self._assert_parity("weighted")
+
+    def test_simple_average_matches_scalar_exactly(self):
+        self._assert_parity("simple_average")
+
+    def test_fixed_engine_matches_scalar_exactly(self):
+        self._assert_parity("weighted", engine="fixed")
+        self._assert_parity("simple_average", engine="fixed")
+
+    def test_fixed_engine_nan_credit_matches_scalar(self):
+        self.credits[11][4] = float("nan")
+        self._assert_parity("weighted", engine="fixed")
+        self._assert_parity("simple_average", engine="fixed")
+
+    def test_fixed_engine_is_order_independent(self):
+        grades = np.array(self.grades)
+        credits = np.array(self.credits)
+        permutation = np.random.default_rng(3).permutation(grades.shape[1])
+        baseline = compute_cgpa_batch(grades, credits, engine="fixed")["cgpa"]
+        shuffled = compute_cgpa_batch(grades[:, permutation], credits[:, permutation], engine="fixed")["cgpa"]
+        np.testing.assert_array_equal(baseline, shuffled)
+        # Splitting the cohort across workers must not change any value either.
+        halves = [compute_cgpa_batch(grades[part], credits[part], engine="fixed")["cgpa"] for part in (slice(0, 77), slice(77, None))]
+        np.testing.assert_array_equal(baseline, np.concatenate(halves))
+
+    def test_unknown_engine_raises(self):
+        with self.assertRaises(ValueError):
+            compute_cgpa_batch([[8.0]], [[20]], engine="decimal")
+
+    def test_status_codes(self):
+        result = compute_cgpa_batch(
+            [[8.0, 9.0], [8.0, 11.0], [8.0, 9.0], [8.0, 9.0]],
+            [[20, 20], [20, 20], [20, 40], [0, 0]],
+            [[False, False], [False, False], [False, False], [False, False]],
+        )
+        self.assertEqual(result["status"].tolist(), ["cleared", "error", "error", "error"])
+        self.assertAlmostEqual(result["cgpa"][0], 8.5)
+
+    def test_blocked_takes_precedence_over_validation(self):
+        result = compute_cgpa_batch([[np.nan, 11.0]], [[20, 20]], [[True, False]])
+        self.assertEqual(result["status"][0], "blocked")
+        self.assertTrue(np.isnan(result["cgpa"][0]))
+
+    def test_empty_semesters_is_error(self):
+        result = compute_cgpa_batch(np.zeros((3, 0)), np.zeros((3, 0)))
+        self.assertEqual(result["status"].tolist(), ["error"] * 3)
+
+    def test_shape_mismatch_raises(self):
+        with self.assertRaises(ValueError):
+            compute_cgpa_batch([[8.0, 9.0]], [[20]])
+        with self.assertRaises(ValueError):
+            compute_cgpa_batch([[8.0]], [[20]], blocked=[[False, False]])
+
+
+class TestSGPABatch(unittest.TestCase):
+    """Test suite for compute_sgpa_batch."""
+
+    def test_matches_scalar_exactly(self):
+        rng = random.Random(7)
+        levels = [10.0, 9.0, 8.0, 7.0, 6.0, 5.0, 4.0, 0.0]
+        points = [[rng.choice(levels) for _ in range(8)] for _ in range(300)]
+        credits = [[rng.choice([0, 1, 2, 3, 4]) for _ in range(8)] for _ in range(300)]
+        missing = [[rng.random() < 0.02 for _ in range(8)] for _ in range(300)]
+        points[3][0] = 12.0
+        credits[4] = [0] * 8
+
+        for engine in ("float", "fixed"):
+            batch = compute_sgpa_batch(points, credits, missing, engine=engine)
+            for i, (p_row, c_row, m_row) in enumerate(zip(points, credits, missing)):
+                expected = compute_sgpa([None if m else p for p, m in zip(p_row, m_row)], c_row, engine=engine)
+                with self.subTest(student=i, engine=engine):
+                    self.assertEqual(batch["status"][i], expected["status"])
+                    if expected["sgpa"] is None:
+                        self.assertTrue(np.isnan(batch["sgpa"][i]))
+                    else:
+                        self.assertEqual(batch["sgpa"][i], expected["sgpa"])
+
+    def test_rule_precedence(self):
+        result = compute_sgpa_batch(
+            [[8.0, 0.0], [8.0, 0.0], [8.0, 0.0], [8.0, 9.0]],
+            [[4, 3], [4, 3], [4, 0], [4, 3]],
+            [[True, False], [False, False], [False, False], [False, False]],
+        )
+        self.assertEqual(
+            result["status"].tolist(),
+            ["invalid_input", "backlog_pending", "cleared", "cleared"],
+        )
+        self.assertEqual(result["sgpa"][2], 8.0)
+
+
+class TestSummaryBatch(unittest.TestCase):
+    """Test suite for summarize_semesters_batch."""
+
+    def test_matches_scalar_summary(self):
+        rng = np.random.default_rng(11)
+        grades = np.round(rng.uniform(4, 10, (150, 8)), 2)
+        grades[rng.random(grades.shape) < 0.05] = np.nan
+        grades[0] = np.nan
+        credits = rng.integers(10, 30, grades.shape)
+        remaining = rng.integers(0, 60, 150)
+
+        batch = summarize_semesters_batch(grades, credits, remaining_credits=remaining)
+        for i in range(grades.shape[0]):
+            row = [None if np.isnan(g) else float(g) for g in grades[i]]
+            expected = summarize_semesters(row, credits[i].tolist(), remaining_credits=int(remaining[i]))
+            with self.subTest(student=i):
+                self.assertEqual(batch["count"][i], expected.count)
+                self.assertAlmostEqual(batch["slope"][i], expected.slope, places=9)
+                self.assertAlmostEqual(batch["consistency"][i], expected.consistency, places=9)
+                self.assertEqual(batch["strongest_semester"][i], expected.strongest_semester)
+                self.assertEqual(batch["weakest_semester"][i], expected.weakest_semester)
+                self.assertEqual(batch["status"][i], expected.status)
+                if expected.projection is None:
+                    self.assertTrue(np.isnan(batch["realistic"][i]))
+                else:
+                    self.assertAlmostEqual(batch["realistic"][i], expected.projection["realistic"], places=9)
+
+    def test_no_semesters_matches_scalar(self):
+        expected = summarize_semesters([], [], remaining_credits=40)
+        batch = summarize_semesters_batch(np.empty((3, 0)), np.empty((3, 0), dtype=int), remaining_credits=40)
+        for field in ("count", "mean_sgpa", "slope", "consistency", "strongest_semester", "weakest_sgpa", "cleared_credits", "status"):
+            with self.subTest(field=field):
+                self.assertEqual(batch[field].tolist(), [getattr(expected, field)] * 3)
+        self.assertTrue(np.isnan(batch["cgpa"]).all())
+        self.assertTrue(np.isnan(batch["realistic"]).all())
+
+    def test_without_remaining_credits(self):
+        batch = summarize_semesters_batch([[8.0, 9.0]], [[20, 20]])
+        self.assertAlmostEqual(batch["cgpa"][0], 8.5)
+        self.assertTrue(np.isnan(batch["best"][0]))
+
+
+class TestConversionBatch(unittest.TestCase):
+    """Test suite for convert_gpa_batch."""
+
+    def test_matches_scalar_conversions_exactly(self):
+        values = np.concatenate([np.round(np.random.default_rng(5).uniform(-1, 11, 500), 2), [6.0, 7.0, 8.0, 9.0, 10.0]])
+        for formula in PERCENTAGE_FORMULAS:
+            batch = convert_gpa_batch(values, formula)
+            for i, gpa in enumerate(values.tolist()):
+                expected = gpa_to_percentage(gpa, formula)
+                with self.subTest(formula=formula, gpa=gpa):
+                    if expected is None:
+                        self.assertTrue(np.isnan(batch["percentage"][i]))
+                    else:
+                        self.assertEqual(batch["percentage"][i], expected)
+                    self.assertEqual(batch["us_gpa"][i], gpa_to_us_gpa(gpa))
+                    self.assertEqual(batch["classification"][i], classify_cgpa(gpa))
+
+    def test_missing_values(self):
+        batch = convert_gpa_batch([np.nan])
+        self.assertTrue(np.isnan(batch["percentage"][0]))
+        self.assertEqual(batch["classification"][0], "")
+
+    def test_nan_matches_scalar_functions(self):
+        for formula in PERCENTAGE_FORMULAS:
+            expected = gpa_to_percentage(float("nan"), formula)
+            with self.subTest(formula=formula):
+                np.testing.assert_array_equal(gpa_to_percentage_batch([np.nan], formula), [expected])
+        self.assertEqual(gpa_to_percentage_batch([np.nan], "mu").tolist(), [0.0])
+        self.assertEqual(classify_cgpa_batch([np.nan]).tolist(), [classify_cgpa(float("nan"))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Unit tests for the shared results cache.
+"""
+import threading
+import unittest
+
+from src.cache import ByteBudgetCache, LRUCache, cached_result, canonical_hash
+
+
+class TestCanonicalHash(unittest.TestCase):
+    """Test suite for canonical_hash."""
+
+    def test_equal_inputs_hash_equally(self):
+        self.assertEqual(canonical_hash("cgpa", [8.0, 9.0], {"a": 1, "b": 2}), canonical_hash("cgpa", (8.0, 9.0), {"b": 2, "a": 1}))
+
+    def test_distinct_inputs_hash_differently(self):
+        self.assertNotEqual(canonical_hash("cgpa", [8.0, 9.0]), canonical_hash("cgpa", [9.0, 8.0]))
+        self.assertNotEqual(canonical_hash("cgpa", [8.0]), canonical_hash("sgpa", [8.0]))
+        self.assertNotEqual(canonical_hash("cgpa", [8.0, None]), canonical_hash("cgpa", [8.0, 0.0]))
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test suite for LRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_counts_hits_and_misses(self):
+        cache = LRUCache(4)
+        calls = []
+        for _ in range(3):
+            self.assertEqual(cache.get_or_compute("k", lambda: calls.append(1) or "value"), "value")
+        self.assertEqual(len(calls), 1)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+        cache.clear()
+        self.assertEqual(cache.stats(), {"size": 0, "maxsize": 4, "hits": 0, "misses": 0, "evictions": 0, "hit_rate": 0.0})
+
+    def test_caches_none(self):
+        cache = LRUCache(4)
+        calls = []
+        cache.get_or_compute("k", lambda: calls.append(1))
+        cache.get_or_compute("k", lambda: calls.append(1))
+        self.assertEqual(len(calls), 1)
+
+    def test_rejects_non_positive_size(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+    def test_concurrent_access_stays_bounded(self):
+        cache = LRUCache(8)
+
+        def worker(offset):
+            for i in range(200):
+                cache.get_or_compute((offset + i) % 16, lambda: i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertLessEqual(stats["size"], 8)
+        self.assertEqual(stats["hits"] + stats["misses"], 800)
+
+
+class TestByteBudgetCache(unittest.TestCase):
+    """Test suite for ByteBudgetCache."""
+
+    def test_evicts_to_stay_within_budget(self):
+        cache = ByteBudgetCache(maxbytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        cache.get("a")
+        cache.put("c", b"1234")
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats()["bytes"], 8)
+
+    def test_replacing_a_key_updates_its_size(self):
+        cache = ByteBudgetCache(maxbytes=10)
+        cache.put("a", b"12345678")
+        cache.put("a", b"12")
+        self.assertEqual(cache.nbytes, 2)
+        cache.clear()
+        self.assertEqual((cache.nbytes, len(cache)), (0, 0))
+
+    def test_resize_reaccounts_values_that_grew_in_place(self):
+        cache = ByteBudgetCache(maxbytes=10)
+        first, second = bytearray(b"1234"), bytearray(b"1234")
+        cache.put("a", first)
+        cache.put("b", second)
+        second.extend(b"12")
+        cache.resize("b")
+        self.assertEqual((cache.nbytes, len(cache)), (10, 2))
+        second.extend(b"1")
+        cache.resize("b")
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.nbytes, 7)
+        second.extend(b"1234")
+        cache.resize("b")
+        self.assertEqual((cache.nbytes, len(cache)), (0, 0))
+        cache.resize("missing")
+
+    def test_oversized_values_are_returned_but_not_stored(self):
+        cache = ByteBudgetCache(maxbytes=4)
+        cache.put("small", b"12")
+        self.assertEqual(cache.get_or_compute("big", lambda: b"123456"), b"123456")
+        self.assertNotIn("big", cache)
+        self.assertIn("small", cache)
+
+    def test_rejects_non_positive_budget(self):
+        with self.assertRaises(ValueError):
+            ByteBudgetCache(maxbytes=0)
+
+
+class TestCachedResult(unittest.TestCase):
+    """Test suite for cached_result."""
+
+    def test_repeat_submit_is_a_hit(self):
+        cache = LRUCache(4)
+        first = cached_result("cgpa", ([8.0, 9.0], [20, 20]), lambda: {"cgpa": 8.5}, cache=cache)
+        second = cached_result("cgpa", ((8.0, 9.0), (20, 20)), lambda: {"cgpa": 0.0}, cache=cache)
+        self.assertIs(second, first)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_namespaces_do_not_collide(self):
+        cache = LRUCache(4)
+        cached_result("cgpa", ([8.0],), lambda: "cgpa", cache=cache)
+        self.assertEqual(cached_result("sgpa", ([8.0],), lambda: "sgpa", cache=cache), "sgpa")
+
+
+if __name__ == "__main__":
+    unittest.main()
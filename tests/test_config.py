@@ -1,6 +1,7 @@
 import unittest
+from streamlit.testing.v1 import AppTest
 from src.config import get_theme, Theme, global_css
-from src.layout import inject_styles, enhanced_css
+from src.layout import inject_styles, enhanced_css, compiled_stylesheet, minify_css
 
 class TestConfig(unittest.TestCase):
     def test_get_theme(self):
@@ -20,3 +21,47 @@ class TestConfig(unittest.TestCase):
         
         encss = enhanced_css(theme)
         self.assertIn("Inter", encss)
+
+    def test_compiled_stylesheet_is_cached_per_theme(self):
+        light, dark = get_theme(False), get_theme(True)
+        self.assertIs(compiled_stylesheet(light), compiled_stylesheet(get_theme(False)))
+        self.assertNotEqual(compiled_stylesheet(light), compiled_stylesheet(dark))
+        sheet = compiled_stylesheet(light)
+        self.assertTrue(sheet.startswith("<style>") and sheet.endswith("</style>"))
+        self.assertIn("--surface: #F8FAFC", sheet)
+        self.assertLess(len(sheet), len(global_css(light) + enhanced_css(light)))
+
+    def test_minify_css(self):
+        css = "/* note */\n.a > .b ,\n .c {\n  color: red ;\n  margin: 0 auto;\n}\n"
+        self.assertEqual(minify_css(css), ".a>.b,.c{color: red;margin: 0 auto}")
+
+    def test_client_script_is_sent_once_per_session(self):
+        def app():
+            from src.layout import inject_client_script
+            import streamlit as st
+            st.session_state["sent"] = inject_client_script("probe", "window.probe = 1;")
+            st.button("rerun")
+
+        at = AppTest.from_function(app).run()
+        self.assertTrue(at.session_state["sent"])
+        self.assertEqual(len(at.get("html")), 1)
+        at.button[0].click().run()
+        self.assertFalse(at.session_state["sent"])
+        self.assertEqual(len(at.get("html")), 0)
+
+    def test_client_script_falls_back_to_component_iframe(self):
+        def app():
+            from unittest import mock
+            from src.layout import inject_client_script
+            import streamlit as st
+            with mock.patch("src.layout.html_runs_scripts", return_value=False):
+                st.session_state["sent"] = inject_client_script("probe", "window.probe = 1;")
+            st.button("rerun")
+
+        at = AppTest.from_function(app).run()
+        self.assertTrue(at.session_state["sent"])
+        self.assertEqual(len(at.get("html")), 0)
+        self.assertIn("window.parent.document", at.get("iframe")[0].proto.srcdoc)
+        at.button[0].click().run()
+        self.assertTrue(at.session_state["sent"])
+        self.assertEqual(len(at.get("iframe")), 1)
@@ -0,0 +1,148 @@
+"""
+Unit tests for the curriculum index.
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from src.curriculum import CurriculumCatalog, CurriculumIndex, curriculum_catalog, load_manifest
+
+SAMPLE = {
+    "First Year Engineering (Common) - RC 2019-20": {
+        "Semester 1": [{"name": "Maths I", "credits": 4}, {"name": "Physics", "credits": 3}],
+        "Semester 2": [{"name": "Maths II", "credits": 4}],
+    },
+    "Computer Engineering - RC 2019-20": {
+        "Semester 4": [{"name": "OS", "credits": 4}],
+        "Semester 3": [{"name": "DSA", "credits": 4}, {"name": "Logic Design", "credits": 3}],
+    },
+    "Civil Engineering - RC 2019-20": {
+        "Semester 3": [{"name": "Surveying", "credits": 5}],
+    },
+    "Computer Engineering - NEP 2025": {
+        "Semester 1": [{"name": "Programming", "credits": 5}],
+    },
+}
+
+
+class TestCurriculumIndex(unittest.TestCase):
+    """Test suite for CurriculumIndex."""
+
+    def setUp(self):
+        self.index = CurriculumIndex(SAMPLE)
+
+    def test_templates_by_scheme(self):
+        self.assertEqual(
+            self.index.templates("rc1920"),
+            (
+                "First Year Engineering (Common) - RC 2019-20",
+                "Computer Engineering - RC 2019-20",
+                "Civil Engineering - RC 2019-20",
+            ),
+        )
+        self.assertEqual(
+            self.index.branches("rc1920"), ("Computer Engineering - RC 2019-20", "Civil Engineering - RC 2019-20")
+        )
+        self.assertEqual(self.index.templates("nep2025"), ("Computer Engineering - NEP 2025",))
+        self.assertEqual(self.index.templates("custom"), ())
+
+    def test_semesters_are_ordered_with_totals(self):
+        branch = "Computer Engineering - RC 2019-20"
+        self.assertEqual(self.index.semesters(branch), ("Semester 3", "Semester 4"))
+        semester = self.index.semester(branch, "Semester 3")
+        self.assertEqual((semester.number, semester.credits, semester.count), (3, 7, 2))
+        self.assertIs(self.index.semester(branch, 3), semester)
+
+    def test_first_year_fallback_and_subject_listing(self):
+        branch = "Computer Engineering - RC 2019-20"
+        self.assertEqual(self.index.semester(branch, 1).credits, 7)
+        self.assertIsNone(self.index.semester("Computer Engineering - NEP 2025", 2))
+        self.assertEqual(
+            [(s["semester"], s["name"]) for s in self.index.subjects(branch, 2, 4)],
+            [(2, "Maths II"), (3, "DSA"), (3, "Logic Design"), (4, "OS")],
+        )
+
+    def test_credit_vectors(self):
+        self.assertEqual(self.index.credits("rc1920"), (7, 4, 7, 4))
+        self.assertEqual(self.index.credits("rc1920", "Computer Engineering - RC 2019-20"), (7, 4, 7, 4))
+        self.assertEqual(self.index.credits("rc1920", "Civil Engineering - RC 2019-20"), (7, 4, 5, 4))
+        self.assertEqual(self.index.credits("rc1920", "Computer Engineering - NEP 2025"), (7, 4, 7, 4))
+        self.assertEqual(self.index.credits("nep2025", "Computer Engineering - NEP 2025"), (5,))
+        self.assertEqual(self.index.credits("custom"), ())
+
+
+class TestCurriculumCatalog(unittest.TestCase):
+    """Test suite for the sharded catalog."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        shards = {
+            "rc1920": ("Goa University", "RC 2019-20", {k: v for k, v in SAMPLE.items() if k.endswith("RC 2019-20")}),
+            "xyz24": ("XYZ University", "XYZ 2024", {"Mechanical - XYZ 2024": {"Semester 1": [{"name": "Drawing", "credits": 21}]}}),
+        }
+        manifest = {"version": 1, "shards": {}}
+        for scheme, (university, tag, data) in shards.items():
+            path = os.path.join(self.tmp.name, f"{scheme}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            manifest["shards"][scheme] = {"university": university, "tag": tag, "path": f"{scheme}.json"}
+        self.manifest = os.path.join(self.tmp.name, "manifest.json")
+        with open(self.manifest, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_routes_lookups_to_shards_loaded_on_first_use(self):
+        catalog = CurriculumCatalog.from_manifest(self.manifest)
+        self.assertEqual(catalog.stats()["size"], 0)
+        self.assertEqual(catalog.credits("xyz24"), (21,))
+        self.assertEqual(catalog.stats()["size"], 1)
+        self.assertEqual(catalog.semester("Mechanical - XYZ 2024", 1).subjects, ({"name": "Drawing", "credits": 21},))
+        self.assertIn("Computer Engineering - RC 2019-20", catalog)
+        self.assertEqual(catalog.branches("rc1920"), CurriculumIndex(SAMPLE).branches("rc1920"))
+        self.assertEqual(catalog.templates("nep2025"), ())
+        self.assertEqual(catalog.subjects("Unknown - NEP 2025", 1, 2), [])
+
+    def test_memory_cap_evicts_least_recently_used_shard(self):
+        sizes = {scheme: CurriculumCatalog.from_manifest(self.manifest).shard(scheme).nbytes for scheme in ("rc1920", "xyz24")}
+        catalog = CurriculumCatalog.from_manifest(self.manifest, maxbytes=max(sizes.values()))
+        catalog.templates("rc1920")
+        catalog.templates("xyz24")
+        self.assertEqual(catalog.stats()["evictions"], 1)
+        self.assertEqual(catalog.templates("rc1920")[0], "First Year Engineering (Common) - RC 2019-20")
+
+    def test_lazily_built_semesters_and_search_count_against_the_cap(self):
+        catalog = CurriculumCatalog.from_manifest(self.manifest)
+        shard = catalog.shard("rc1920")
+        loaded = catalog.stats()["bytes"]
+        catalog.semester("Computer Engineering - RC 2019-20", 3)
+        with_semester = catalog.stats()["bytes"]
+        self.assertGreater(with_semester, loaded)
+        catalog.search_index("rc1920")
+        self.assertGreater(catalog.stats()["bytes"], with_semester)
+        self.assertEqual(catalog.stats()["bytes"], shard.nbytes)
+
+        # A shard that grows past the budget once its search index is built is evicted.
+        capped = CurriculumCatalog.from_manifest(self.manifest, maxbytes=loaded + 1)
+        self.assertTrue(capped.search_index("rc1920").search("dsa"))
+        self.assertEqual((capped.stats()["size"], capped.stats()["bytes"]), (0, 0))
+
+    def test_manifest_validation(self):
+        self.assertEqual(load_manifest(os.path.join(self.tmp.name, "missing.json")), {})
+        with open(self.manifest, "w", encoding="utf-8") as f:
+            json.dump({"version": 2, "shards": {}}, f)
+        with self.assertRaises(ValueError):
+            load_manifest(self.manifest)
+
+    def test_shipped_catalog(self):
+        catalog = curriculum_catalog()
+        self.assertIs(curriculum_catalog(), catalog)
+        self.assertEqual(catalog.shards["rc1920"].university, "Goa University")
+        self.assertIn("Computer Engineering - RC 2019-20", catalog.branches("rc1920"))
+        self.assertEqual(catalog.semesters("Electrical & Electronics Engineering - RC 2019-20")[0], "Semester 3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Unit tests for the compiled GradeScale.
+"""
+import math
+import unittest
+
+from src.grades import DEFAULT_GRADE_SCALE, GRADE_POINT_MAP, UNKNOWN_CODE, GradeScale
+from src.logic import grade_letter_to_point
+
+
+class TestGradeScale(unittest.TestCase):
+    """Test suite for GradeScale."""
+
+    def test_matches_grade_point_map(self):
+        self.assertEqual(DEFAULT_GRADE_SCALE.letters, tuple(GRADE_POINT_MAP))
+        self.assertEqual(dict(DEFAULT_GRADE_SCALE), GRADE_POINT_MAP)
+        for letter, point in GRADE_POINT_MAP.items():
+            self.assertEqual(DEFAULT_GRADE_SCALE.point(letter), point)
+
+    def test_lookup_normalizes_like_grade_letter_to_point(self):
+        for letter in ("o", " a+ ", "b", "F", "", "D", "Z"):
+            with self.subTest(letter=letter):
+                self.assertEqual(DEFAULT_GRADE_SCALE.point(letter), grade_letter_to_point(letter))
+        self.assertIsNone(DEFAULT_GRADE_SCALE.point(None))
+
+    def test_bulk_conversion(self):
+        letters = ["O", "A", "zz", "F", None]
+        codes = DEFAULT_GRADE_SCALE.to_codes(letters)
+        self.assertEqual(codes.tolist(), [0, 2, UNKNOWN_CODE, 7, UNKNOWN_CODE])
+        points = DEFAULT_GRADE_SCALE.to_points(letters)
+        self.assertEqual(points[:2].tolist(), [10.0, 8.0])
+        self.assertTrue(math.isnan(points[2]))
+        self.assertEqual(DEFAULT_GRADE_SCALE.to_points(letters, default=0.0).tolist(), [10.0, 8.0, 0.0, 0.0, 0.0])
+
+    def test_from_map_is_cached_and_hashable(self):
+        custom = {"A": 4.0, "B": 3.0, "F": 0.0}
+        scale = GradeScale.from_map(custom)
+        self.assertIs(GradeScale.from_map(dict(custom)), scale)
+        self.assertIs(GradeScale.from_map(scale), scale)
+        self.assertEqual({scale: "cached"}[GradeScale(custom)], "cached")
+        self.assertNotEqual(scale, GradeScale({"B": 3.0, "A": 4.0, "F": 0.0}))
+
+    def test_scale_is_immutable(self):
+        points = DEFAULT_GRADE_SCALE.points
+        points[0] = 0.0
+        self.assertEqual(DEFAULT_GRADE_SCALE["O"], 10.0)
+        with self.assertRaises(KeyError):
+            DEFAULT_GRADE_SCALE["Z"]
+        with self.assertRaises(AttributeError):
+            DEFAULT_GRADE_SCALE.extra = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
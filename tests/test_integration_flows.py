@@ -3,6 +3,8 @@ Integration-style tests for navigation mapping and calculator flows.
 """
 import unittest
 
+from streamlit.testing.v1 import AppTest
+
 from src.logic import (
     build_breakdown,
     build_subject_breakdown,
@@ -52,5 +54,26 @@ class TestNavigationIntegration(unittest.TestCase):
         self.assertIn(feasibility, {"Already Done", "Possible", "Impossible"})
 
 
+class TestBackupFlow(unittest.TestCase):
+    """The deferred backup download must see page states saved by later fragment reruns."""
+
+    def test_backup_reads_latest_page_state(self):
+        def app():
+            import json
+            import streamlit as st
+            from main import _backup_json, _page_states, _save_page_state
+
+            page_states = _page_states()
+            _save_page_state("cgpa", {"grades": [8.0]})
+            # A later fragment rerun replaces the saved state after the button was rendered.
+            _save_page_state("cgpa", {"grades": [8.0, 9.0]})
+            st.session_state["backup"] = json.loads(_backup_json(page_states, {"pct_formula": "mu"}))
+
+        at = AppTest.from_function(app).run()
+        self.assertFalse(at.exception)
+        self.assertEqual(at.session_state["backup"]["cgpa"]["grades"], [8.0, 9.0])
+        self.assertEqual(at.session_state["backup"]["sgpa"], {})
+
+
 if __name__ == "__main__":
     unittest.main()
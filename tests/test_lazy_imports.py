@@ -0,0 +1,24 @@
+"""
+Importing the app must not load the heavy libraries that only some pages use.
+"""
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFERRED = ("pandas", "numpy", "plotly.express", "fpdf", "src.export", "src.projection")
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test suite for on-demand imports."""
+
+    def test_import_main_defers_heavy_modules(self):
+        probe = f"import sys, main; print(','.join(m for m in {DEFERRED!r} if m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, timeout=120)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
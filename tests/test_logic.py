@@ -3,8 +3,10 @@
 Comprehensive unit tests for CGPA Calculator core logic.
 Includes edge cases, boundary testing, and error conditions.
 """
+import math
 import unittest
 from src.logic import (
+    PERCENTAGE_FORMULAS,
     DEFAULT_CREDITS,
     DEFAULT_SEM_COUNT,
     cgpa_to_percentage,
@@ -13,9 +15,12 @@ from src.logic import (
     consistency_score,
     compute_cgpa,
     compute_sgpa,
+    gpa_to_us_gpa,
     grade_letter_to_point,
+    LinearFormula,
     padded_default_credits,
     predict_final_cgpa_range,
+    register_percentage_formula,
     required_sgpa_for_target,
     semester_trend_slope,
     sgpa_to_percentage,
@@ -82,6 +87,8 @@ class TestCGPALogic(unittest.TestCase):
         self.assertEqual(classify_cgpa(9.0), "Outstanding")  # Exact boundary
         self.assertEqual(classify_cgpa(8.999), "Excellent")  # Just below
         self.assertEqual(classify_cgpa(9.001), "Outstanding")  # Just above
+        self.assertEqual(classify_cgpa(float("nan")), "Needs improvement")  # NaN fails every edge
+        self.assertEqual(classify_cgpa(float("inf")), "Outstanding")
 
         self.assertEqual(classify_cgpa(8.0), "Excellent")
         self.assertEqual(classify_cgpa(7.999), "Good")
@@ -244,12 +251,28 @@ class TestCGPALogic(unittest.TestCase):
 
 
     def test_build_breakdown_logic(self):
-        from src.logic import build_breakdown, build_subject_breakdown
+        from src.logic import BreakdownTable, build_breakdown, build_subject_breakdown
         import pandas as pd
-        df = build_breakdown(3, [20, 20, 20], [8.0, None, 9.0])
+        table = build_breakdown(3, [20, 20, 20], [8.0, None, 9.0])
+        self.assertIsInstance(table, BreakdownTable)
+        self.assertEqual(table.columns, ("Semester", "Credits", "SGPA", "Weighted"))
+        self.assertTrue(math.isnan(table["SGPA"][1]))
+        self.assertEqual(table.sum("Weighted"), 340.0)
+        df = table.to_frame()
         self.assertTrue(isinstance(df, pd.DataFrame))
-        df_sub = build_subject_breakdown(['A', 'B'], [3, 4], [8.0, 9.0])
-        self.assertTrue(isinstance(df_sub, pd.DataFrame))
+        self.assertEqual(df["SGPA"].isna().tolist(), [False, True, False])
+        self.assertEqual(str(df["Credits"].dtype), "int64")
+        table_sub = build_subject_breakdown(['A', 'B'], [3, 4], [8.0, 9.0])
+        self.assertEqual(table_sub.records()[1], {"Subject": "B", "Credits": 4, "Grade Point": 9.0, "Weighted": 36.0})
+        self.assertTrue(isinstance(table_sub.to_frame(), pd.DataFrame))
+
+    def test_breakdown_table_shape_checks(self):
+        from src.logic import BreakdownTable
+        with self.assertRaises(ValueError):
+            BreakdownTable(("A", "B"), ((1, 2), (1,)))
+        with self.assertRaises(KeyError):
+            BreakdownTable(("A",), ((1,),))["B"]
+        self.assertTrue(BreakdownTable((), ()).empty)
         
     def test_analytics_edge_cases(self):
         from src.logic import semester_trend_slope, consistency_score, strongest_weakest_semester
@@ -266,6 +289,14 @@ class TestCGPALogic(unittest.TestCase):
         self.assertIsNone(predict_final_cgpa_range([None], [20], 20))
         self.assertIsNone(what_if_simulator([None], [20], 20))
         
+    def test_scheme_credits_come_from_curriculum(self):
+        from src.logic import NEP2025_CREDITS, RC1920_CREDITS, get_scheme_credits
+        self.assertEqual(get_scheme_credits('rc1920'), RC1920_CREDITS)
+        self.assertEqual(get_scheme_credits('rc1920', branch='Civil Engineering - RC 2019-20'), RC1920_CREDITS)
+        self.assertEqual(get_scheme_credits('rc1920', 3, branch='Unknown - NEP 2025'), [16, 18, 23])
+        self.assertEqual(get_scheme_credits('nep2025', 9), NEP2025_CREDITS + [20])
+        self.assertEqual(get_scheme_credits('custom'), RC1920_CREDITS)
+
     def test_missing_logic_branches(self):
         from src.logic import get_scheme_credits, compute_sgpa, grade_letter_to_point, sgpa_to_percentage, required_sgpa_for_target, consistency_score, predict_final_cgpa_range, what_if_simulator
         self.assertEqual(get_scheme_credits('rc1920', 10), [16, 18, 23, 24, 22, 22, 17, 18, 18, 18])
@@ -286,6 +317,159 @@ class TestCGPALogic(unittest.TestCase):
         self.assertIsNone(what_if_simulator([8.0], [20], -1))
 
 
+class TestConversionRegistry(unittest.TestCase):
+    """Test suite for the percentage formula registry and US GPA conversion."""
+
+    def test_wrappers_match_original_formulas(self):
+        for gpa in (0.0, 0.5, 6.37, 8.0, 9.99, 10.0):
+            with self.subTest(gpa=gpa):
+                self.assertEqual(cgpa_to_percentage(gpa, "mu"), max(0.0, (gpa - 0.75) * 10))
+                self.assertEqual(sgpa_to_percentage(gpa, "cbse"), gpa * 9.5)
+                self.assertEqual(cgpa_to_percentage(gpa, "direct"), gpa * 10.0)
+                self.assertEqual(gpa_to_us_gpa(gpa), (gpa / 10.0) * 4.0)
+
+    def test_unknown_formula_falls_back_to_mu(self):
+        self.assertEqual(cgpa_to_percentage(8.0, "unknown"), cgpa_to_percentage(8.0, "mu"))
+
+    def test_registered_formula_is_used(self):
+        register_percentage_formula("test_x9", LinearFormula("Test (CGPA × 9)", r"GPA \times 9", scale=9.0))
+        try:
+            self.assertEqual(cgpa_to_percentage(8.0, "test_x9"), 72.0)
+            self.assertEqual(PERCENTAGE_FORMULAS["test_x9"].describe("SGPA"), r"$SGPA \times 9$")
+        finally:
+            del PERCENTAGE_FORMULAS["test_x9"]
+
+
+class TestFixedPointEngine(unittest.TestCase):
+    """Test suite for the fixed-point integer engine."""
+
+    def test_fixed_matches_float_to_display_precision(self):
+        grades = [8.12, 7.85, 9.01, 6.4, 8.33]
+        credits = [16, 18, 23, 24, 22]
+        fixed = compute_cgpa(grades, credits, engine="fixed")
+        self.assertEqual(fixed["status"], "cleared")
+        self.assertAlmostEqual(fixed["cgpa"], compute_cgpa(grades, credits)["cgpa"], places=10)
+        self.assertAlmostEqual(
+            compute_cgpa(grades, credits, method="simple_average", engine="fixed")["cgpa"],
+            sum(grades) / len(grades),
+            places=10,
+        )
+
+    def test_fixed_is_order_independent(self):
+        grades = [0.1, 0.2, 0.3, 9.7, 6.35, 7.05, 8.45]
+        credits = [20, 20, 20, 20, 20, 20, 20]
+        forward = compute_cgpa(grades, credits, engine="fixed")["cgpa"]
+        backward = compute_cgpa(grades[::-1], credits[::-1], engine="fixed")["cgpa"]
+        self.assertEqual(forward, backward)
+
+    def test_fixed_sgpa_rules(self):
+        self.assertEqual(compute_sgpa([9.0, 8.0, 7.0], [4, 3, 3], engine="fixed")["sgpa"], 8.1)
+        self.assertEqual(compute_sgpa([9.0, 0.0], [4, 3], engine="fixed")["status"], "backlog_pending")
+        self.assertEqual(compute_sgpa([9.0, None], [4, 3], engine="fixed")["status"], "invalid_input")
+
+    def test_fixed_rejects_fractional_credits_and_unknown_engine(self):
+        self.assertEqual(compute_cgpa([8.0, 9.0], [2.5, 3], engine="fixed")["status"], "error")
+        self.assertEqual(compute_cgpa([8.0, 9.0], [float("nan"), 3], engine="fixed"), {"cgpa": None, "status": "error"})
+        with self.assertRaises(ValueError):
+            compute_cgpa([8.0], [20], engine="decimal")
+
+
+class TestSemesterSummary(unittest.TestCase):
+    """Test suite for the fused summarize_semesters kernel."""
+
+    def test_matches_individual_analytics(self):
+        from src.logic import summarize_semesters
+        grades = [7.2, 8.4, 6.9, 9.1, 8.0]
+        credits = [16, 18, 23, 24, 22]
+        summary = summarize_semesters(grades, credits, remaining_credits=57)
+
+        self.assertAlmostEqual(summary.slope, semester_trend_slope(grades), places=12)
+        self.assertAlmostEqual(summary.consistency, consistency_score(grades), places=10)
+        extremes = strongest_weakest_semester(grades)
+        self.assertEqual(summary.strongest_semester, extremes["strongest_semester"])
+        self.assertEqual(summary.weakest_semester, extremes["weakest_semester"])
+        self.assertEqual(summary.weakest_sgpa, extremes["weakest_sgpa"])
+        self.assertEqual(summary.cgpa, compute_cgpa(grades, credits)["cgpa"])
+        expected = what_if_simulator(grades, credits, 57)
+        for case in ("minimum", "realistic", "best"):
+            self.assertAlmostEqual(summary.projection[case], expected[case], places=12)
+
+    def test_blocked_semesters_are_skipped(self):
+        from src.logic import summarize_semesters
+        summary = summarize_semesters([8.0, None, 9.0, float("nan")], [20, 20, 20, 20], remaining_credits=20)
+        self.assertEqual(summary.count, 2)
+        self.assertEqual(summary.status, "blocked")
+        self.assertIsNone(summary.cgpa)
+        self.assertIsNone(summary.projection)
+        self.assertEqual(summary.strongest_semester, 3)
+        self.assertEqual(summary.cleared_credits, 40)
+
+    def test_edge_cases(self):
+        from src.logic import summarize_semesters
+        empty = summarize_semesters([], [])
+        self.assertEqual((empty.slope, empty.consistency, empty.strongest_semester), (0.0, 100.0, 0))
+        self.assertEqual(empty.status, "error")
+        single = summarize_semesters([8.0], [20])
+        self.assertEqual((single.slope, single.consistency), (0.0, 100.0))
+        self.assertIsNone(single.projection)
+        self.assertIsNone(summarize_semesters([8.0], [20], remaining_credits=-1).projection)
+        self.assertEqual(summarize_semesters([11.0], [20]).status, "error")
+
+
+class TestCGPAAccumulator(unittest.TestCase):
+    """Test suite for the incremental CGPA accumulator."""
+
+    def test_add_matches_compute_cgpa(self):
+        from src.logic import CGPAAccumulator
+        grades = [8.12, 7.85, 9.01, 6.4]
+        credits = [16, 18, 23, 24]
+        acc = CGPAAccumulator()
+        for g, c in zip(grades, credits):
+            acc.add(g, c)
+        self.assertAlmostEqual(acc.cgpa, compute_cgpa(grades, credits)["cgpa"], places=12)
+        self.assertEqual(acc.total_credits, sum(credits))
+        self.assertEqual(acc.semesters, 4)
+
+    def test_retract_and_replace_are_exact(self):
+        from src.logic import CGPAAccumulator
+        acc = CGPAAccumulator().add(8.0, 20).add(7.33, 22)
+        snapshot = acc.to_bytes()
+        acc.add(9.17, 18).retract(9.17, 18)
+        self.assertEqual(acc.to_bytes(), snapshot)
+
+        # Revaluation: semester 2 SGPA changes from 7.33 to 7.9.
+        acc.replace(7.33, 22, 7.9, 22)
+        self.assertEqual(acc, CGPAAccumulator().add(8.0, 20).add(7.9, 22))
+
+    def test_no_drift_over_many_updates(self):
+        from src.logic import CGPAAccumulator
+        acc = CGPAAccumulator.from_cgpa(8.37, 100, semesters=5)
+        for _ in range(1000):
+            acc.add(6.71, 23).retract(6.71, 23)
+        self.assertEqual(acc.cgpa, 8.37)
+
+    def test_serialization_round_trip(self):
+        from src.logic import CGPAAccumulator
+        acc = CGPAAccumulator().add(8.5, 20).add(9.25, 22)
+        payload = acc.to_bytes()
+        self.assertEqual(len(payload), 14)
+        self.assertEqual(CGPAAccumulator.from_bytes(payload), acc)
+
+    def test_invalid_operations(self):
+        from src.logic import CGPAAccumulator
+        acc = CGPAAccumulator()
+        self.assertIsNone(acc.cgpa)
+        with self.assertRaises(ValueError):
+            acc.add(11.0, 20)
+        with self.assertRaises(ValueError):
+            acc.add(8.0, 40)
+        with self.assertRaises(ValueError):
+            acc.add(None, 20)
+        with self.assertRaises(ValueError):
+            acc.retract(8.0, 20)
+        self.assertFalse(hasattr(acc, "__dict__"))
+
+
 class TestPerformance(unittest.TestCase):
     """Performance tests for CGPA calculation logic."""
 
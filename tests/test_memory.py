@@ -0,0 +1,104 @@
+"""
+Unit tests for per-session memory accounting.
+"""
+import io
+import unittest
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from src.memory import categorize, enforce_budget, measure_session, sizeof
+from src.state import CGPA_GRID_KEY, SemesterGrid
+
+
+class TestSizeof(unittest.TestCase):
+    """Test suite for sizeof."""
+
+    def test_counts_payloads(self):
+        self.assertGreaterEqual(sizeof(b"x" * 10_000), 10_000)
+        self.assertGreaterEqual(sizeof(io.BytesIO(b"x" * 10_000)), 10_000)
+        self.assertGreaterEqual(sizeof({"a": [b"x" * 5_000, b"y" * 5_000]}), 10_000)
+        self.assertGreater(sizeof(SemesterGrid()), sizeof(object()))
+
+    def test_shared_objects_are_counted_once(self):
+        blob = b"x" * 10_000
+        self.assertLess(sizeof([blob, blob]), 2 * len(blob))
+
+
+class TestSessionMemory(unittest.TestCase):
+    """Test suite for measure_session and enforce_budget."""
+
+    def setUp(self):
+        self.session = {
+            CGPA_GRID_KEY: SemesterGrid([20], [8.0]),
+            "page_states": {"cgpa": {"grades": [8.0]}},
+            "profile_upload": io.BytesIO(b"{}" * 100),
+            "breakdown_frame": pd.DataFrame({"SGPA": [8.0] * 1_000}),
+            "pdf_blob": b"%PDF" * 5_000,
+            "settings": {"pct_formula": "mu"},
+        }
+
+    def test_categories(self):
+        self.assertEqual(
+            {key: categorize(key, value) for key, value in self.session.items()},
+            {
+                CGPA_GRID_KEY: "grids",
+                "page_states": "page_states",
+                "profile_upload": "uploads",
+                "breakdown_frame": "frames",
+                "pdf_blob": "blobs",
+                "settings": "other",
+            },
+        )
+        memory = measure_session(self.session)
+        self.assertEqual(memory.total, sum(memory.categories.values()))
+        self.assertEqual(memory.as_dict(budget=1)["largest"][0][0], "pdf_blob")
+
+    def test_evicts_regenerable_entries_largest_first(self):
+        total = measure_session(self.session).total
+        evicted = enforce_budget(self.session, total - 1)
+        self.assertEqual(evicted, ["pdf_blob"])
+        evicted = enforce_budget(self.session, 0)
+        self.assertEqual(evicted, ["breakdown_frame", "profile_upload"])
+        self.assertEqual(set(self.session), {CGPA_GRID_KEY, "page_states", "settings"})
+
+    def test_sizing_an_upload_leaves_it_sharing_its_bytes(self):
+        data = b"x" * 100_000
+        upload = io.BytesIO(data)
+        upload.seek(10)
+        self.assertGreaterEqual(sizeof(upload), len(data))
+        self.assertEqual(upload.tell(), 10)
+
+    def test_real_session_is_brought_back_under_budget(self):
+        def app():
+            import io
+            import streamlit as st
+            from src.memory import enforce_budget, measure_session
+            from src.state import CGPA_GRID_KEY, SemesterGrid
+
+            class Upload(io.BytesIO):
+                name = "profile.json"
+
+            if "before" not in st.session_state:
+                st.session_state[CGPA_GRID_KEY] = SemesterGrid([20] * 8, [8.0] * 8)
+                st.session_state["page_states"] = {"cgpa": {"grades": [8.0] * 8}}
+                st.session_state["comp1"] = Upload(b'{"cgpa": {}}' * 50_000)
+                st.session_state["calculated_cgpa"] = 8.0
+                st.session_state["before"] = measure_session(st.session_state).total
+                st.session_state["evicted"] = enforce_budget(st.session_state, 64 * 1024)
+            st.session_state["after"] = measure_session(st.session_state).total
+
+        at = AppTest.from_function(app).run()
+        self.assertGreater(at.session_state["before"], 64 * 1024)
+        self.assertEqual(at.session_state["evicted"], ["comp1"])
+        self.assertLessEqual(at.session_state["after"], 64 * 1024)
+        self.assertIn(CGPA_GRID_KEY, at.session_state)
+        self.assertEqual(categorize("calculated_cgpa", 8.0), "results")
+
+    def test_under_budget_is_left_alone(self):
+        self.assertEqual(enforce_budget(self.session, 10**9), [])
+        self.assertEqual(len(self.session), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
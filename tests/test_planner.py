@@ -0,0 +1,96 @@
+"""
+Unit tests for the Goal Planner grade-combination solver.
+"""
+import itertools
+import random
+import time
+import unittest
+
+from src.logic import GRADE_POINT_MAP
+from src.planner import plan_for_target, plan_grade_combinations
+
+PASSING_POINTS = sorted({p for p in GRADE_POINT_MAP.values() if p > 0})
+
+
+def _brute_force_pareto(credits, required):
+    """Every passing combination reaching ``required`` where no single one-step drop still does."""
+    found = set()
+    for combo in itertools.product(PASSING_POINTS, repeat=len(credits)):
+        total = sum(p * c for p, c in zip(combo, credits))
+        if total < required - 1e-9:
+            continue
+        droppable = any(
+            p > PASSING_POINTS[0]
+            and total - (p - PASSING_POINTS[PASSING_POINTS.index(p) - 1]) * c >= required - 1e-9
+            for p, c in zip(combo, credits)
+        )
+        if not droppable:
+            found.add(combo)
+    return found
+
+
+class TestPlanGradeCombinations(unittest.TestCase):
+    """Test suite for plan_grade_combinations."""
+
+    def test_matches_brute_force_on_small_cases(self):
+        rng = random.Random(0)
+        for _ in range(60):
+            credits = [rng.choice([1, 2, 3, 4]) for _ in range(rng.randint(1, 4))]
+            required = rng.uniform(0, 10 * sum(credits) + 3)
+            with self.subTest(credits=credits, required=required):
+                plans = plan_grade_combinations(credits, required, limit=10**6)
+                got = {tuple(plan["grade_points"]) for plan in plans}
+                self.assertEqual(got, _brute_force_pareto(credits, required))
+
+    def test_plans_are_ordered_and_reach_target(self):
+        credits = [4, 3, 3, 3, 1, 1, 2]
+        plans = plan_grade_combinations(credits, 140, limit=50)
+        totals = [plan["total_points"] for plan in plans]
+        self.assertEqual(totals, sorted(totals))
+        for plan in plans:
+            self.assertGreaterEqual(sum(p * c for p, c in zip(plan["grade_points"], credits)), 140)
+            self.assertEqual([GRADE_POINT_MAP[g] for g in plan["grades"]], plan["grade_points"])
+
+    def test_minimal_mode_returns_only_smallest_total(self):
+        plans = plan_grade_combinations([4, 3, 3], 80, pareto=False, limit=100)
+        self.assertTrue(plans)
+        self.assertEqual({plan["total_points"] for plan in plans}, {80.0})
+
+    def test_unreachable_target(self):
+        self.assertEqual(plan_grade_combinations([4, 3], 71), [])
+
+    def test_already_met_target_returns_lowest_pass(self):
+        plans = plan_grade_combinations([4, 3], 0)
+        self.assertEqual(len(plans), 1)
+        self.assertEqual(plans[0]["grade_points"], [PASSING_POINTS[0]] * 2)
+
+    def test_fractional_grade_map(self):
+        grade_map = {"A": 4.0, "A-": 3.7, "B+": 3.3, "B": 3.0, "F": 0.0}
+        plans = plan_grade_combinations([3, 3], 20.0, grade_map=grade_map, pareto=False)
+        self.assertAlmostEqual(plans[0]["total_points"], 20.1)
+        self.assertEqual(sorted(plans[0]["grades"]), ["A-", "B"])
+
+    def test_performance_for_several_semesters(self):
+        credits = [4, 3, 3, 3, 3, 2, 1, 1, 1, 1] * 4
+        start = time.perf_counter()
+        plans = plan_grade_combinations(credits, 8.7 * sum(credits), limit=10)
+        self.assertLess(time.perf_counter() - start, 0.2)
+        self.assertEqual(len(plans), 10)
+
+
+class TestPlanForTarget(unittest.TestCase):
+    """Test suite for plan_for_target."""
+
+    def test_final_cgpa_reaches_target(self):
+        plans = plan_for_target(7.8, 80, 8.2, [4, 3, 3, 3, 1, 1, 2, 4, 3, 3])
+        self.assertTrue(plans)
+        for plan in plans:
+            self.assertGreaterEqual(plan["final_cgpa"], 8.2 - 1e-9)
+
+    def test_invalid_inputs(self):
+        self.assertIsNone(plan_for_target(11.0, 80, 8.0, [4]))
+        self.assertIsNone(plan_for_target(8.0, 80, 8.5, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the Monte Carlo CGPA projection engine.
+"""
+import time
+import unittest
+
+import numpy as np
+
+from src.logic import compute_cgpa, predict_final_cgpa_range
+from src.projection import GRID_SGPA, projection_grid, simulate_final_cgpa
+
+
+class TestSimulateFinalCGPA(unittest.TestCase):
+    """Test suite for simulate_final_cgpa."""
+
+    def setUp(self):
+        self.grades = [8.1, 7.8, 8.4, 8.2, 8.9]
+        self.credits = [16, 18, 23, 24, 22]
+        self.future = [22, 17, 18]
+
+    def test_seeded_runs_are_reproducible(self):
+        first = simulate_final_cgpa(self.grades, self.credits, self.future, target_cgpa=8.5, seed=42)
+        second = simulate_final_cgpa(self.grades, self.credits, self.future, target_cgpa=8.5, seed=42)
+        self.assertEqual(first, second)
+
+    def test_bands_are_ordered_and_bounded(self):
+        result = simulate_final_cgpa(self.grades, self.credits, self.future, seed=1)
+        bands = list(result["percentiles"].values())
+        self.assertEqual(bands, sorted(bands))
+        self.assertGreaterEqual(bands[0], 0.0)
+        self.assertLessEqual(bands[-1], 10.0)
+        self.assertIsNone(result["target_probability"])
+
+    def test_target_probability_extremes(self):
+        easy = simulate_final_cgpa(self.grades, self.credits, self.future, target_cgpa=0.0, seed=1)
+        impossible = simulate_final_cgpa(self.grades, self.credits, self.future, target_cgpa=10.0, seed=1)
+        self.assertEqual(easy["target_probability"], 1.0)
+        self.assertEqual(impossible["target_probability"], 0.0)
+
+    def test_no_remaining_semesters_returns_current_cgpa(self):
+        result = simulate_final_cgpa(self.grades, self.credits, [], seed=1)
+        current = compute_cgpa(self.grades, self.credits)["cgpa"]
+        for value in result["percentiles"].values():
+            self.assertAlmostEqual(value, current, places=12)
+
+    def test_withheld_history_returns_none(self):
+        self.assertIsNone(simulate_final_cgpa([8.0, None], [20, 20], [20], seed=1))
+        self.assertIsNone(simulate_final_cgpa([], [], [20], seed=1))
+
+    def test_single_semester_history_still_has_spread(self):
+        result = simulate_final_cgpa([8.0], [20], [20, 20, 20], seed=3)
+        self.assertLess(result["percentiles"][10], result["percentiles"][90])
+
+    def test_performance_per_student(self):
+        start = time.perf_counter()
+        simulate_final_cgpa(self.grades, self.credits, self.future, target_cgpa=8.5, n_paths=10000, seed=5)
+        self.assertLess(time.perf_counter() - start, 0.05)
+
+
+class TestProjectionGrid(unittest.TestCase):
+    """Test suite for the precomputed what-if projection grid."""
+
+    def setUp(self):
+        self.grades = [8.1, 7.8, 8.4, 8.2, 8.9]
+        self.credits = [16, 18, 23, 24, 22]
+        cleared = sum(self.credits)
+        self.grid = projection_grid(compute_cgpa(self.grades, self.credits)["cgpa"] * cleared, cleared, [22, 39, 57])
+
+    def test_grid_spans_every_hundredth(self):
+        self.assertEqual(len(GRID_SGPA), 1001)
+        self.assertEqual(GRID_SGPA[0], 0.0)
+        self.assertEqual(GRID_SGPA[-1], 10.0)
+        self.assertEqual(self.grid.final_cgpa.shape, (3, 1001))
+
+    def test_matches_predict_final_cgpa_range_exactly(self):
+        for remaining in (22, 39, 57):
+            for future in (0.0, 6.0, 7.35, 8.0, 9.5, 10.0):
+                expected = predict_final_cgpa_range(
+                    self.grades, self.credits, remaining,
+                    minimum_future_sgpa=future, realistic_future_sgpa=future, best_future_sgpa=future,
+                )["realistic"]
+                with self.subTest(remaining=remaining, future=future):
+                    self.assertEqual(self.grid.lookup(future, remaining), expected)
+
+    def test_cached_and_read_only(self):
+        again = projection_grid(self.grid.current_points, self.grid.current_credits, [57, 22, 39])
+        self.assertIs(again, self.grid)
+        with self.assertRaises(ValueError):
+            self.grid.final_cgpa[0, 0] = 1.0
+        self.assertFalse(self.grid.row(39).flags.writeable)
+
+    def test_lookup_clamps_sgpa_and_rejects_unknown_credits(self):
+        self.assertEqual(self.grid.lookup(12.0, 22), self.grid.lookup(10.0, 22))
+        with self.assertRaises(ValueError):
+            self.grid.lookup(8.0, 23)
+        with self.assertRaises(ValueError):
+            projection_grid(100.0, 0, [20])
+
+    def test_curve_is_monotonic(self):
+        self.assertTrue(np.all(np.diff(self.grid.row(57)) > 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Unit tests for the Quick Fill search index.
+"""
+import time
+import unittest
+
+from src.curriculum import CurriculumIndex, curriculum_catalog
+from src.search import SearchEntry, SearchIndex, curriculum_entries, describe, normalize, trigrams
+
+SAMPLE = {
+    "Computer Engineering - RC 2019-20": {
+        "Semester 3": [{"name": "Data Structures", "credits": 4}, {"name": "Engineering Mathematics III", "credits": 4}],
+        "Semester 4": [{"name": "Operating Systems", "credits": 4}],
+    },
+    "Mechanical Engineering - RC 2019-20": {
+        "Semester 3": [{"name": "Engineering Mathematics III", "credits": 4}, {"name": "Fluid Mechanics", "credits": 4}],
+    },
+}
+
+
+class TestText(unittest.TestCase):
+    """Test suite for normalize and trigrams."""
+
+    def test_normalize_drops_case_and_punctuation(self):
+        self.assertEqual(normalize("  Electrical & Electronics—Engg.  "), "electrical electronics engg")
+
+    def test_trigrams_are_padded_per_word(self):
+        self.assertEqual(trigrams("OS"), {"  o", " os", "os "})
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test suite for SearchIndex over a small curriculum."""
+
+    def setUp(self):
+        self.index = SearchIndex(curriculum_entries(CurriculumIndex(SAMPLE), "rc1920"))
+
+    def test_entries_cover_semesters_and_distinct_subjects(self):
+        kinds = [entry.kind for entry in self.index.entries]
+        self.assertEqual(kinds.count("semester"), 3)
+        self.assertEqual(kinds.count("subject"), 4)
+        maths = [entry for entry in self.index.entries if entry.text == "Engineering Mathematics III"]
+        self.assertEqual([(m.template, m.semester) for m in maths], [("Computer Engineering - RC 2019-20", "Semester 3")])
+
+    def test_branch_and_semester_query(self):
+        top = self.index.search("comp sem 4")[0].entry
+        self.assertEqual((top.kind, top.template, top.semester, top.credits), ("semester", "Computer Engineering - RC 2019-20", "Semester 4", 4))
+
+    def test_prefix_and_typo(self):
+        self.assertEqual(self.index.search("data str")[0].entry.text, "Data Structures")
+        self.assertEqual(self.index.search("operting sytems")[0].entry.text, "Operating Systems")
+
+    def test_kind_filter_limit_and_misses(self):
+        hits = self.index.search("mech", kind="subject", limit=1)
+        self.assertEqual([hit.entry.text for hit in hits], ["Fluid Mechanics"])
+        self.assertEqual(self.index.search("   "), [])
+        self.assertEqual(self.index.search("zzqx"), [])
+
+    def test_describe(self):
+        entry = SearchEntry("subject", "Lab", "Civil Engineering - RC 2019-20", "Semester 3", 1)
+        self.assertEqual(describe(entry), "Lab · 1 credit · Civil Engineering, Semester 3")
+
+
+class TestShippedIndex(unittest.TestCase):
+    """Test suite for the catalog's search index."""
+
+    def test_cached_per_scheme_and_fast(self):
+        catalog = curriculum_catalog()
+        index = catalog.search_index("rc1920")
+        self.assertIs(catalog.search_index("rc1920"), index)
+        self.assertEqual(len(catalog.search_index("no-such-scheme")), 0)
+        start = time.perf_counter()
+        for query in ("comp sem 3", "data str", "digtal electronics", "mathematics"):
+            self.assertTrue(index.search(query))
+        self.assertLess((time.perf_counter() - start) / 4, 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
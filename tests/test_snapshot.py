@@ -0,0 +1,119 @@
+"""
+Unit tests for the compiled curriculum tables and their snapshot.
+"""
+import json
+import mmap
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.curriculum import CurriculumIndex
+from src.snapshot import compile_tables, load_tables, read_snapshot, snapshot_path, write_snapshot
+
+SAMPLE = {
+    "Computer Engineering - RC 2019-20": {
+        "Semester 4": [{"name": "OS", "credits": 4}],
+        "Semester 3": [{"name": "DSA", "credits": 4}, {"name": "Maths III", "credits": 4}],
+    },
+    "Civil Engineering - RC 2019-20": {
+        "Semester 3": [{"name": "Maths III", "credits": 4}],
+    },
+}
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test suite for compile_tables, the snapshot format and load_tables."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmp.name, "curriculum.json")
+        self.write_source(SAMPLE)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_source(self, data):
+        with open(self.source, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def test_strings_are_shared_and_semesters_ordered(self):
+        tables = compile_tables(SAMPLE)
+        self.assertEqual(tables.strings.count("Maths III"), 1)
+        self.assertEqual(list(tables.semester_number), [3, 4, 3])
+        self.assertEqual(list(tables.semester_credits), [8, 4, 4])
+        with self.assertRaises(ValueError):
+            compile_tables({"Bad\0Name": {}})
+
+    def test_round_trip(self):
+        path = os.path.join(self.tmp.name, "round.snapshot")
+        write_snapshot(compile_tables(SAMPLE), path, b"h" * 32, 7, 11)
+        tables, source_hash, mtime_ns, size = read_snapshot(path)
+        self.assertEqual((source_hash, mtime_ns, size), (b"h" * 32, 7, 11))
+        index, expected = CurriculumIndex.from_tables(tables), CurriculumIndex(SAMPLE)
+        branch = "Computer Engineering - RC 2019-20"
+        self.assertEqual(index.templates("rc1920"), expected.templates("rc1920"))
+        self.assertEqual(index.semester(branch, 3), expected.semester(branch, 3))
+        self.assertEqual(index.semesters(branch), ("Semester 3", "Semester 4"))
+        self.assertEqual(index.semester(branch, "Semester 4").credits, 4)
+
+    def test_snapshot_is_built_then_reused(self):
+        load_tables(self.source, write=True)
+        snapshot = snapshot_path(self.source)
+        self.assertTrue(os.path.exists(snapshot))
+        built = os.stat(snapshot).st_mtime_ns
+        self.assertEqual(len(load_tables(self.source, write=True)), 2)
+        self.assertEqual(os.stat(snapshot).st_mtime_ns, built)
+
+    def test_loading_does_not_write_by_default(self):
+        self.assertEqual(len(load_tables(self.source)), 2)
+        self.assertEqual(len(CurriculumIndex.from_file(self.source).templates("rc1920")), 2)
+        self.assertFalse(os.path.exists(snapshot_path(self.source)))
+
+    def test_changed_source_rebuilds_snapshot(self):
+        load_tables(self.source, write=True)
+        self.write_source({"Mechanical Engineering - RC 2019-20": {"Semester 3": [{"name": "Thermo", "credits": 3}]}})
+        os.utime(self.source, ns=(1, 1))
+        index = CurriculumIndex.from_tables(load_tables(self.source))
+        self.assertEqual(index.templates("rc1920"), ("Mechanical Engineering - RC 2019-20",))
+        self.assertNotEqual(read_snapshot(snapshot_path(self.source))[2], 1)
+        load_tables(self.source, write=True)
+        self.assertEqual(read_snapshot(snapshot_path(self.source))[2], 1)
+
+    def test_corrupt_snapshot_is_replaced(self):
+        with open(snapshot_path(self.source), "wb") as f:
+            f.write(b"CGPC garbage")
+        self.assertEqual(len(load_tables(self.source, write=True)), 2)
+        self.assertEqual(len(read_snapshot(snapshot_path(self.source))[0]), 2)
+
+    def test_unwritable_snapshot_falls_back_to_json(self):
+        with mock.patch("src.snapshot.write_snapshot", side_effect=PermissionError("read-only")):
+            self.assertEqual(len(load_tables(self.source, write=True)), 2)
+
+    def test_invalid_snapshot_is_unmapped(self):
+        path = os.path.join(self.tmp.name, "bad.snapshot")
+        write_snapshot(compile_tables(SAMPLE), path, b"h" * 32)
+        with open(path, "rb") as f:
+            valid = f.read()
+        mapped, real_mmap = [], mmap.mmap
+
+        def mapping(*args, **kwargs):
+            mapped.append(real_mmap(*args, **kwargs))
+            return mapped[-1]
+
+        for payload in (b"NOPE" + valid[4:], valid[:-8], valid.replace(b"Maths III", b"Maths \xff\xfe")):
+            with open(path, "wb") as f:
+                f.write(payload)
+            with mock.patch("src.snapshot.mmap.mmap", side_effect=mapping), self.assertRaises(ValueError):
+                read_snapshot(path)
+            self.assertTrue(mapped[-1].closed)
+
+    def test_shipped_snapshot_without_source(self):
+        load_tables(self.source, write=True)
+        os.remove(self.source)
+        self.assertEqual(len(load_tables(self.source)), 2)
+        self.assertEqual(len(load_tables(os.path.join(self.tmp.name, "missing.json"))), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
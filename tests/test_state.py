@@ -0,0 +1,97 @@
+"""
+Unit tests for the array-backed calculator grids.
+"""
+import pickle
+import unittest
+
+from src.state import (
+    CGPA_GRID_KEY,
+    MAX_SEMESTERS,
+    MAX_SUBJECTS,
+    SEMESTER_WIDGETS,
+    SGPA_GRID_KEY,
+    SemesterGrid,
+    SubjectGrid,
+    forget_widgets,
+    semester_grid,
+    subject_grid,
+)
+
+
+class TestSemesterGrid(unittest.TestCase):
+    """Test suite for SemesterGrid."""
+
+    def test_round_trips_credits_and_backlogs(self):
+        grid = SemesterGrid([20, 22, 18], [8.2, None, 9.0])
+        self.assertEqual(grid.credit_list(3), [20, 22, 18])
+        self.assertEqual(grid.grades(3), [8.2, None, 9.0])
+        self.assertEqual(len(grid.sgpa), MAX_SEMESTERS)
+
+    def test_backlog_keeps_the_last_sgpa(self):
+        grid = SemesterGrid(grades=[7.5])
+        grid.set_grades([None])
+        self.assertEqual(grid.grades(1), [None])
+        grid.backlog[0] = False
+        self.assertEqual(grid.grades(1), [7.5])
+
+    def test_is_slotted_and_picklable(self):
+        grid = SemesterGrid([20], [8.0])
+        with self.assertRaises(AttributeError):
+            grid.extra = 1
+        self.assertEqual(repr(pickle.loads(pickle.dumps(grid))), repr(grid))
+
+
+class TestSubjectGrid(unittest.TestCase):
+    """Test suite for SubjectGrid."""
+
+    def test_defaults(self):
+        grid = SubjectGrid(["Math"], [4], default_grade="O")
+        self.assertEqual(grid.names[:2], ["Math", "Subject 2"])
+        self.assertEqual(grid.credits[:2].tolist(), [4, 3])
+        self.assertEqual(grid.grades[:2], ["O", "O"])
+        self.assertFalse(grid.is_template)
+
+    def test_load_template(self):
+        grid = SubjectGrid()
+        grid.load([{"name": "DSA", "credits": 4}, {"name": "OS", "credits": 3}], "A")
+        self.assertEqual(grid.names[:3], ["DSA", "OS", "Subject 3"])
+        self.assertEqual(grid.template[:3], bytearray([1, 1, 0]))
+        self.assertTrue(grid.is_template)
+        self.assertEqual(len(grid.names), MAX_SUBJECTS)
+
+    def test_add_fills_unnamed_rows_then_grows(self):
+        grid = SubjectGrid(["Math"])
+        self.assertEqual(grid.add({"name": "DSA", "credits": 4}, "A", 2), 1)
+        self.assertEqual(grid.add({"name": "OS", "credits": 3}, "B", 2), 2)
+        self.assertEqual(grid.names[:3], ["Math", "DSA", "OS"])
+        self.assertEqual(grid.credits[1], 4)
+        self.assertEqual(grid.grades[2], "B")
+        self.assertEqual(grid.template[:3], bytearray([0, 1, 1]))
+
+    def test_add_to_full_grid(self):
+        grid = SubjectGrid([f"S{i}" for i in range(MAX_SUBJECTS)])
+        self.assertIsNone(grid.add({"name": "DSA", "credits": 4}, "A", MAX_SUBJECTS))
+
+
+class TestSessionBinding(unittest.TestCase):
+    """Test suite for the session-state helpers."""
+
+    def test_grid_is_created_once_from_initial_state(self):
+        session: dict = {}
+        grid = semester_grid(session, {"credits": [20], "grades": [8.0]}, default_credits=[16, 18, 23])
+        self.assertIs(session[CGPA_GRID_KEY], grid)
+        self.assertEqual(grid.credit_list(3), [20, 18, 23])
+        self.assertIs(semester_grid(session, {"credits": [1]}), grid)
+
+        subjects = subject_grid(session, {"subjects": ["Math"], "grades": ["B"]})
+        self.assertIs(session[SGPA_GRID_KEY], subjects)
+        self.assertEqual(subjects.grades[:2], ["B", "A"])
+
+    def test_forget_widgets(self):
+        session = {"sgpa_0": 8.0, "backlog_1": True, "sgpa_12": 1.0, "cgpa_num_courses": 8}
+        forget_widgets(session, SEMESTER_WIDGETS, MAX_SEMESTERS)
+        self.assertEqual(session, {"sgpa_12": 1.0, "cgpa_num_courses": 8})
+
+
+if __name__ == "__main__":
+    unittest.main()
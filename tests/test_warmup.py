@@ -0,0 +1,91 @@
+"""
+Unit tests for the server warm-up steps and report.
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from src.warmup import STEPS, parse_steps, run_warmup
+
+
+class TestParseSteps(unittest.TestCase):
+    """Test suite for parse_steps."""
+
+    def test_all_none_and_subsets(self):
+        self.assertEqual(parse_steps("all"), list(STEPS))
+        self.assertEqual(parse_steps(""), [])
+        self.assertEqual(parse_steps(" None "), [])
+        self.assertEqual(parse_steps("pdf, curriculum"), ["curriculum", "pdf"])
+
+    def test_default_skips_chart_export(self):
+        from src.config import Config
+
+        self.assertEqual(parse_steps(Config.WARMUP_STEPS), [name for name in STEPS if name != "charts"])
+
+    def test_unknown_step_raises(self):
+        with self.assertRaises(ValueError):
+            parse_steps("styles,fonst")
+
+
+class TestRunWarmup(unittest.TestCase):
+    """Test suite for run_warmup."""
+
+    def test_failures_are_reported_and_do_not_stop_later_steps(self):
+        calls = []
+
+        def broken():
+            raise RuntimeError("\nImage export requires the Kaleido package\nmore detail")
+
+        registry = {"first": lambda: calls.append("first"), "broken": broken, "last": lambda: calls.append("last")}
+        report = run_warmup(["first", "broken", "last"], registry)
+        self.assertEqual(calls, ["first", "last"])
+        self.assertEqual([step.name for step in report.steps], ["first", "broken", "last"])
+        self.assertEqual(report.failed, ["broken"])
+        self.assertEqual(report.as_dict()["errors"], {"broken": "RuntimeError: Image export requires the Kaleido package"})
+        self.assertAlmostEqual(report.total_ms, sum(step.ms for step in report.steps))
+
+    def test_builtin_steps_prime_process_caches(self):
+        from src.export import card_fonts
+        from src.layout import compiled_stylesheet
+
+        report = run_warmup(["styles", "fonts", "pdf"])
+        self.assertEqual(report.failed, [])
+        self.assertGreaterEqual(compiled_stylesheet.cache_info().currsize, 2)
+        self.assertEqual(card_fonts.cache_info().currsize, 1)
+
+
+class TestAppWarmup(unittest.TestCase):
+    """The app sends the first page before the per-process warm-up runs."""
+
+    def test_first_page_renders_before_warm_up(self):
+        import src.layout
+        import src.warmup
+
+        order = []
+        render_home_page = src.layout.render_home_page
+
+        def home(*pages):
+            render_home_page(*pages)
+            order.append("page")
+
+        def warmup(steps):
+            order.append("warm-up")
+            return run_warmup([], {})
+
+        st.cache_resource.clear()
+        main_path = os.path.join(os.path.dirname(__file__), os.pardir, "main.py")
+        with mock.patch.dict(sys.modules, {"streamlit_local_storage": mock.MagicMock()}), \
+                mock.patch.object(src.layout, "render_home_page", home), \
+                mock.patch.object(src.warmup, "run_warmup", warmup):
+            at = AppTest.from_file(main_path, default_timeout=30).run()
+        st.cache_resource.clear()
+        self.assertFalse(at.exception)
+        self.assertEqual(order, ["page", "warm-up"])
+
+
+if __name__ == "__main__":
+    unittest.main()